@@ -0,0 +1,174 @@
+from cba.teds.utils.Logger import getLogger
+import getopt
+import json
+import shutil
+import sys
+import tempfile
+import time
+
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.PackageGenerator import PackageGenerator
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+
+from collections import OrderedDict
+from datetime import datetime
+
+
+# The phases (in the order they happen) that are timed for each package
+PHASES = ["extraction", "construction", "whenCollection", "ruleEvaluation", "reportGeneration"]
+
+
+def benchmarkPackage(rulesFile, packageDirectory, packageFileName, reportFileName):
+    """
+    Time each phase of checking one Assembled Package (in the same order as AssembledPackage.runChecks()).
+
+    :param rulesFile: The relative (project root) path to the rules (XML) file.
+    :param packageDirectory: The path of the directory containing the Assembled Package.
+    :param packageFileName: The file name of the Assembled Package.
+    :param reportFileName: The file path of the JUnit Report.
+    :returns: An ordered map of phase (see PHASES) to time (seconds).
+    """
+    timings = OrderedDict()
+
+    started = time.perf_counter()
+    assembledPackage = AssembledPackage(packageDirectory, packageFileName)
+    timings["extraction"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ruleRunner = RuleRunner(rulesFile, assembledPackage, collectWhenData=False)
+    timings["construction"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ruleRunner._buildWhenDataFromAssembledPackage(assembledPackage)
+    timings["whenCollection"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ruleRunner.runRules()
+    timings["ruleEvaluation"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ruleRunner.generateReport(reportFileName)
+    timings["reportGeneration"] = time.perf_counter() - started
+
+    return timings
+
+
+def benchmarkTeradataPackage(argv):
+    """
+    Benchmark the Teradata Package Checks against synthetic packages (see PackageGenerator) at several scales.
+
+    Each phase (see PHASES) is timed separately and the best time of a number of repeats is reported for each scale.
+    The results can be saved (-o) and compared with the results saved from another branch (-b).
+
+    Example : python -m cba.teds.BenchmarkTeradataPackage -q resources/teradataQualityCheckRules.xml -s 10x20,100x50,500x100 -n 3 -o output/benchmark.json
+
+    Use -s <scales> (--scales) for a comma separated list of <tables>x<columns> e.g. 10x20,100x50.
+    Use -n <repeats> (--repeats) for the number of times each scale is run (the best time is reported).
+    Use -f <faultRate> (--faultRate) for the fraction of the tables that break a rule.
+    Use -o <results.json> (--output) to save the results and -b <baseline.json> (--baseline) to compare with them.
+    """
+
+    # Initialize Logging
+    logger = getLogger()
+
+    logger.debug("Start BenchmarkTeradataPackage(%s) - %s", argv, datetime.now().strftime("%Y%m%d%H%M"))
+
+    teradataQualityCheckRuleFile = 'resources/teradataQualityCheckRules.xml'
+    scales = "10x20,100x50,500x100"
+    repeats = 3
+    faultRate = 0.1
+    outputFile = None
+    baselineFile = None
+
+    try:
+        opts, args = getopt.getopt(argv, "q:s:n:f:o:b:h",
+                                   ["teradataQualityCheckRuleFile=", "scales=", "repeats=", "faultRate=", "output=",
+                                    "baseline=", "help"])
+    except getopt.GetoptError as e:
+        print(e)
+        print(
+            "  cba.teds.BenchmarkTeradataPackage [-q <qaRuleFilePath>] [-s <tables>x<columns>,...] [-n <repeats>] [-f <faultRate>] [-o <results.json>] [-b <baseline.json>]")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(
+                "  HELP cba.teds.BenchmarkTeradataPackage [-q <qaRuleFilePath>] [-s <tables>x<columns>,...] [-n <repeats>] [-f <faultRate>] [-o <results.json>] [-b <baseline.json>]")
+            sys.exit()
+        elif opt in ("-q", "--teradataQualityCheckRuleFile"):
+            teradataQualityCheckRuleFile = arg
+        elif opt in ("-s", "--scales"):
+            scales = arg
+        elif opt in ("-n", "--repeats"):
+            repeats = int(arg)
+        elif opt in ("-f", "--faultRate"):
+            faultRate = float(arg)
+        elif opt in ("-o", "--output"):
+            outputFile = arg
+        elif opt in ("-b", "--baseline"):
+            baselineFile = arg
+
+    results = OrderedDict()
+
+    workDirectory = tempfile.mkdtemp(prefix="BENCHMARK_")
+    try:
+        for scale in scales.split(","):
+            tables, columns = [int(number) for number in scale.lower().split("x")]
+
+            packageFileName = "synthetic_assembled_package_%dx%d.tgz" % (tables, columns)
+            fileCount = PackageGenerator(tables, columns, faultRate).generateTarball(workDirectory, packageFileName)
+            logger.info(" Generated %s (%d files)" % (packageFileName, fileCount))
+
+            # Keep the best time of each phase (the other runs were disturbed by something else)
+            bestTimings = None
+            for repeat in range(repeats):
+                timings = benchmarkPackage(teradataQualityCheckRuleFile, workDirectory, packageFileName,
+                                           workDirectory + "/junit-%s.xml" % scale)
+                if bestTimings is None:
+                    bestTimings = timings
+                else:
+                    for phase in PHASES:
+                        bestTimings[phase] = min(bestTimings[phase], timings[phase])
+
+            results[scale] = bestTimings
+    finally:
+        shutil.rmtree(workDirectory, ignore_errors=True)
+
+    baseline = None
+    if baselineFile is not None:
+        with open(baselineFile) as file:
+            baseline = json.load(file)
+
+    printResults(results, baseline)
+
+    if outputFile is not None:
+        with open(outputFile, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+def printResults(results, baseline=None):
+    """
+    Print the results (seconds per phase for each scale) and (if there is a baseline) the ratio to the baseline.
+
+    :param results: An ordered map of scale to timings (see benchmarkPackage()).
+    :param baseline: The results of another run (e.g. saved from another branch).
+    """
+    print(" %-12s %s %12s" % ("scale", " ".join("%16s" % phase for phase in PHASES), "total"))
+    for scale in results:
+        timings = results[scale]
+        total = sum(timings[phase] for phase in PHASES)
+        print(" %-12s %s %12.4f" % (scale, " ".join("%16.4f" % timings[phase] for phase in PHASES), total))
+
+        if baseline is not None and scale in baseline:
+            baselineTimings = baseline[scale]
+            baselineTotal = sum(baselineTimings[phase] for phase in PHASES)
+            print(" %-12s %s %11.2fx" % ("  vs baseline", " ".join("%15.2fx" % (timings[phase] / baselineTimings[phase])
+                                                                  if baselineTimings[phase] > 0 else "%16s" % "-"
+                                                                  for phase in PHASES),
+                                        total / baselineTotal if baselineTotal > 0 else 0.0))
+
+
+if __name__ == '__main__':
+    benchmarkTeradataPackage(sys.argv[1:])
@@ -1,11 +1,18 @@
 from cba.teds.utils.Logger import getLogger
 import getopt
+import glob
 import logging
+import os
 import sys
 import time
 
 from cba.teds.teradata.qa.artifacts.AssembledBTEQ import *
 from cba.teds.teradata.qa.artifacts.AssembledPackage import *
+from cba.teds.teradata.qa.artifacts.PackageBatch import PackageBatch
+from cba.teds.teradata.qa.artifacts.TarballPackage import TarballPackage
+from cba.teds.teradata.qa.rules.ExtractionPlan import ExtractionPlan
+from cba.teds.teradata.qa.rules.RulePlan import RulePlan
+from cba.teds.teradata.qa.rules.RuleSetCache import loadRuleSet
 
 from datetime import datetime
 from junit_xml import TestSuite
@@ -17,6 +24,27 @@ def checkTeradataPackage(argv):
 
     Example : python -m cba.teds.CheckTeradataPackage -q "D:\Documents and Settings\JoyGa\PycharmProjects\python_core\resources\teradataQualityCheckRules.xml" -r "resources/test/" -t test_assembled_package.tgz -o unitTestResources_assembled_bteqs -p junit-QACheck.xml -e Y
     python -m cba.teds.CheckTeradataPackage -q "D:\Apps\python_core\resources\teradataQualityCheckRules.xml" -r "D:\Apps\python_core\output" -t assembled_bteqs.tgz -o unitTestResources_assembled_bteqs -p junit-QACheck.xml
+
+    Use -j <jobs> (--jobs) to split the artifacts of an assembled package across a number of worker processes.
+    Use -s (--streaming) to evaluate the rules one artifact at a time (memory is bounded by the largest artifact).
+    Use -c <cacheDirectory> (--cacheDirectory) to keep the findings for each artifact in a persistent result cache so
+    that unchanged artifacts are not scanned again by the next run. The rules are loaded from a compiled rule set (see
+    CompileTeradataRules) in the rulesets directory next to the rules file whether or not -c is used.
+    Use -i (--inMemory) to read an assembled package straight from the tarball (nothing is extracted to disk).
+    Use -m <statsFile> (--statsFile) to record the time spent (and the work done) by each When and Action of the rules
+    (as properties in the JUnit report and in a JSON stats file).
+    Use -x (--selective) to only extract (or read) the members of an assembled package that the rules can reach (see
+    ExtractionPlan).
+    Use -b <packages> (--batch) to check a batch of assembled packages (a comma separated list of paths or globs e.g.
+    "archive/*assembled_package*.tgz") in one process. The rules are read once and -j <jobs> packages are checked at
+    the same time. A JUnit report is written for each package (next to the -p report) and -p is a summary report.
+    Use -g (--corpus) to search for the LINE pattern Whens of the rules across all of the artifacts of a filter group
+    at once (see ArtifactCorpus) instead of line by line.
+    Use -f <depth> (--prefetch) to read up to <depth> artifacts ahead (in background threads) while the rules are
+    evaluated and -n <readers> (--readers) for the number of reader threads (the default is 1). The time spent waiting
+    on I/O versus evaluating is logged.
+    Use --explain to print the plan that the rules are evaluated by (see RulePlan) i.e. the Whens (grouped by filter)
+    with the rules of each When and the Whens that are dropped (not referenced by a rule). Nothing is checked.
     """
 
     # Initialize Logging
@@ -30,20 +58,31 @@ def checkTeradataPackage(argv):
     tarName = ''
     extractFlag = ''
     teradataQualityCheckRuleFile = ''
+    jobs = 1
+    streaming = False
+    cacheDirectory = None
+    inMemory = False
+    statsFile = None
+    selective = False
+    batch = None
+    corpus = False
+    prefetch = 0
+    readers = 1
+    explain = False
 
     try:
-        opts, args = getopt.getopt(argv, "q:r:t:o:p:e:dh",
+        opts, args = getopt.getopt(argv, "q:r:t:o:p:e:j:sc:im:xb:gf:n:dh",
                                    ["teradataQualityCheckRuleFile=", "rootDirectoryPath=", "tarName=", "outputDir=",
-                                    "extractFlag=", "printToJunitReport=", "debug"])
+                                    "extractFlag=", "printToJunitReport=", "jobs=", "streaming", "cacheDirectory=", "inMemory", "statsFile=", "selective", "batch=", "corpus", "prefetch=", "readers=", "explain", "debug"])
     except getopt.GetoptError as e:
         print(e)
         print(
-            "  cba.teds.TeradataQualityCheck -q <qaRuleFilePath> -r <rootDirectoryPath> -t <tarName> -o <outputDir> -p <junit-output.xml> -e <Y|N>")
+            "  cba.teds.TeradataQualityCheck -q <qaRuleFilePath> -r <rootDirectoryPath> -t <tarName> -o <outputDir> -p <junit-output.xml> -e <Y|N> [-j <jobs>] [-s] [-c <cacheDirectory>] [-i] [-m <statsFile>] [-x] [-b <packages>] [-g] [-f <depth>] [-n <readers>] [--explain]")
         sys.exit(2)
 
     if ( len(opts) == 0):
         print(
-            "  (Please specify arguments) cba.teds.TeradataQualityCheck -q <qaRuleFilePath> -r <rootDirectoryPath> -t <tarName> -o <outputDir>  -p <junit-output.xml> -e <Y|N>")
+            "  (Please specify arguments) cba.teds.TeradataQualityCheck -q <qaRuleFilePath> -r <rootDirectoryPath> -t <tarName> -o <outputDir>  -p <junit-output.xml> -e <Y|N> [-j <jobs>] [-s] [-c <cacheDirectory>] [-i] [-m <statsFile>] [-x] [-b <packages>] [-g] [-f <depth>] [-n <readers>] [--explain]")
         sys.exit()
 
     for arg in args:
@@ -54,7 +93,7 @@ def checkTeradataPackage(argv):
     for opt, arg in opts:
         if opt in ("-h", "--help"):
             print(
-                "  HELP cba.teds.TeradataQualityCheck -q <qaRuleFilePath> -d <rootDirectoryPath> -t <tarName> -o <outputDir>  -p <junit-output.xml> -e <Y|N>")
+                "  HELP cba.teds.TeradataQualityCheck -q <qaRuleFilePath> -d <rootDirectoryPath> -t <tarName> -o <outputDir>  -p <junit-output.xml> -e <Y|N> [-j <jobs>] [-s] [-c <cacheDirectory>] [-i] [-m <statsFile>] [-x] [-b <packages>] [-g] [-f <depth>] [-n <readers>] [--explain]")
             sys.exit()
         elif opt in ("-q", "--teradataQualityCheckRuleFile"):
             teradataQualityCheckRuleFile = arg
@@ -74,12 +113,69 @@ def checkTeradataPackage(argv):
         elif opt in ("-e", "--extractFlag"):
             extractFlag = arg
             logger.info(" extractFlag    = %s" % (extractFlag))
-
-    start = time.clock()
+        elif opt in ("-j", "--jobs"):
+            try:
+                jobs = int(arg)
+            except ValueError:
+                print("  Invalid number of jobs: %s" % (arg))
+                sys.exit(2)
+            logger.info(" Jobs           = %s" % (jobs))
+        elif opt in ("-s", "--streaming"):
+            streaming = True
+            logger.info(" Streaming      = %s" % (streaming))
+        elif opt in ("-c", "--cacheDirectory"):
+            cacheDirectory = arg
+            logger.info(" Cache Dir      = %s" % (cacheDirectory))
+        elif opt in ("-i", "--inMemory"):
+            inMemory = True
+            logger.info(" In Memory      = %s" % (inMemory))
+        elif opt in ("-m", "--statsFile"):
+            statsFile = arg
+            logger.info(" Stats File     = %s" % (statsFile))
+        elif opt in ("-x", "--selective"):
+            selective = True
+            logger.info(" Selective      = %s" % (selective))
+        elif opt in ("-b", "--batch"):
+            batch = arg
+            logger.info(" Batch          = %s" % (batch))
+        elif opt in ("-g", "--corpus"):
+            corpus = True
+            logger.info(" Corpus         = %s" % (corpus))
+        elif opt in ("-f", "--prefetch"):
+            try:
+                prefetch = int(arg)
+            except ValueError:
+                print("  Invalid prefetch depth: %s" % (arg))
+                sys.exit(2)
+            logger.info(" Prefetch       = %s" % (prefetch))
+        elif opt in ("-n", "--readers"):
+            try:
+                readers = int(arg)
+            except ValueError:
+                print("  Invalid number of readers: %s" % (arg))
+                sys.exit(2)
+            logger.info(" Readers        = %s" % (readers))
+        elif opt == "--explain":
+            explain = True
+
+    if explain:
+        ruleReader = loadRuleSet(teradataQualityCheckRuleFile)
+        print(RulePlan(ruleReader.retrieveListOfWhenConditions(), ruleReader.retrieveListOfRules()).explain())
+        return
+
+    start = time.time()
 
     fileList = None
     name = None
-    if ( tarName.find('assembled_bteqs') > -1 ):
+    if batch is not None:
+        packagePaths = []
+        for pattern in batch.split(","):
+            packagePaths.extend(sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern])
+
+        packageBatch = PackageBatch(packagePaths, teradataQualityCheckRuleFile, jobs, inMemory, selective)
+        packageBatch.runChecks(os.path.dirname(printToJunitReport) or ".", printToJunitReport)
+
+    elif ( tarName.find('assembled_bteqs') > -1 ):
         extractReleasePackage = AssembledBTEQ(rootDirectoryPath, tarName, outputDir)
         if ( extractFlag == 'Y' or extractFlag == 'True' or extractFlag == 'T'):
             logger.info(" Extracting file to dir : %s/%s" % (rootDirectoryPath, outputDir))
@@ -93,11 +189,19 @@ def checkTeradataPackage(argv):
 
     elif ( tarName.find('assembled_package') > -1 ):
 
-        assembledPackage = AssembledPackage(rootDirectoryPath, tarName)
-        assembledPackage.runChecks(teradataQualityCheckRuleFile, printToJunitReport)
+        extractionPlan = None
+        if selective:
+            extractionPlan = ExtractionPlan(teradataQualityCheckRuleFile)
+
+        if inMemory:
+            assembledPackage = TarballPackage(rootDirectoryPath, tarName, extractionPlan)
+        else:
+            assembledPackage = AssembledPackage(rootDirectoryPath, tarName, extractionPlan=extractionPlan)
+        assembledPackage.runChecks(teradataQualityCheckRuleFile, printToJunitReport, jobs, streaming, cacheDirectory,
+                                   statsFile, corpus, prefetch, readers)
 
 
-    end = time.clock()
+    end = time.time()
     executionTime = (end - start)
     print(' Execution Time ', executionTime)
 
@@ -0,0 +1,105 @@
+from cba.teds.utils.Logger import getLogger
+import getopt
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+from cba.teds.CheckTeradataPackageDaemon import DEFAULT_PORT
+
+from datetime import datetime
+
+
+def checkTeradataPackageClient(argv):
+    """
+    Ask a running CheckTeradataPackageDaemon to check a Teradata Package (e.g. from a CI or IDE hook).
+
+    Example : python -m cba.teds.CheckTeradataPackageClient -t resources/test/test_assembled_package.tgz -p output/junit-QACheck.xml
+
+    Use -t <package> (--package) for the path of an assembled package (or a directory a package was extracted to).
+    Use -p <junit-output.xml> (--printToJunitReport) to write the JUnit report to a file (otherwise it is printed).
+    Use -f (--findings) to print the findings (JSON) instead of the JUnit report.
+    Use -P <port> (--port) for the port the daemon listens on.
+    Use --status to print the state of the daemon and --shutdown to stop it.
+
+    :returns: The response of the daemon (String).
+    """
+
+    # Initialize Logging
+    logger = getLogger()
+
+    logger.debug("Start CheckTeradataPackageClient(%s) - %s", argv, datetime.now().strftime("%Y%m%d%H%M"))
+
+    packagePath = None
+    printToJunitReport = None
+    reportFormat = "junit"
+    port = DEFAULT_PORT
+    request = "check"
+
+    try:
+        opts, args = getopt.getopt(argv, "t:p:fP:h",
+                                   ["package=", "printToJunitReport=", "findings", "port=", "status", "shutdown",
+                                    "help"])
+    except getopt.GetoptError as e:
+        print(e)
+        print("  cba.teds.CheckTeradataPackageClient -t <package> [-p <junit-output.xml>] [-f] [-P <port>] [--status] [--shutdown]")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print("  HELP cba.teds.CheckTeradataPackageClient -t <package> [-p <junit-output.xml>] [-f] [-P <port>] [--status] [--shutdown]")
+            sys.exit()
+        elif opt in ("-t", "--package"):
+            packagePath = arg
+        elif opt in ("-p", "--printToJunitReport"):
+            printToJunitReport = arg
+        elif opt in ("-f", "--findings"):
+            reportFormat = "findings"
+        elif opt in ("-P", "--port"):
+            try:
+                port = int(arg)
+            except ValueError:
+                print("  Invalid port: %s" % (arg))
+                sys.exit(2)
+        elif opt == "--status":
+            request = "status"
+        elif opt == "--shutdown":
+            request = "shutdown"
+
+    url = "http://127.0.0.1:%d/%s" % (port, request)
+    if request == "status":
+        httpRequest = urllib.request.Request(url)
+    elif request == "shutdown":
+        httpRequest = urllib.request.Request(url, data=b"", method="POST")
+    else:
+        if packagePath is None:
+            print("  (Please specify a package) cba.teds.CheckTeradataPackageClient -t <package> [-p <junit-output.xml>] [-f] [-P <port>] [--status] [--shutdown]")
+            sys.exit(2)
+        # The daemon may be running in another directory
+        body = json.dumps({"package": os.path.abspath(packagePath), "format": reportFormat}).encode("utf-8")
+        httpRequest = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"},
+                                             method="POST")
+
+    try:
+        with urllib.request.urlopen(httpRequest) as httpResponse:
+            response = httpResponse.read().decode("utf-8")
+    except urllib.error.HTTPError as httpError:
+        print("  %s" % httpError.read().decode("utf-8"))
+        sys.exit(2)
+    except urllib.error.URLError as urlError:
+        print("  CheckTeradataPackageDaemon is not running on port %d (%s)" % (port, urlError.reason))
+        sys.exit(2)
+
+    if printToJunitReport is not None and request == "check":
+        with open(printToJunitReport, "w") as reportFile:
+            reportFile.write(response)
+        logger.info(" JUNIT File     = %s" % (printToJunitReport))
+    else:
+        print(response)
+
+    return response
+
+
+if __name__ == '__main__':
+    checkTeradataPackageClient(sys.argv[1:])
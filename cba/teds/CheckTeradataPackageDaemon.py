@@ -0,0 +1,176 @@
+from cba.teds.utils.Logger import getLogger
+import getopt
+import json
+import sys
+import threading
+
+from cba.teds.teradata.qa.artifacts.PackageChecker import PackageChecker
+
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_PORT = 8765
+
+
+def buildFindings(ruleRunner):
+    """
+    Build the findings (a JSON friendly list) of a check i.e. one entry for each artifact that has a result e.g.
+
+        {"artifact": "/TERADATA/P_D_BAL_001/...tbl", "failure": "...", "warning": null, "information": null}
+
+    :param ruleRunner: The RuleRunner that ran the checks.
+    :returns: A list of maps.
+    """
+    findings = []
+    for testCase in ruleRunner.retrieveTestCases():
+        findings.append({"artifact": testCase.name,
+                         "failure": testCase.failure_message,
+                         "warning": testCase.error_message,
+                         "information": testCase.stdout})
+    return findings
+
+
+class CheckRequestHandler(BaseHTTPRequestHandler):
+    """
+    The CheckRequestHandler class handles the (HTTP) requests of the daemon:
+
+    POST /check     {"package": "<path>", "format": "junit" | "findings"} returns the JUnit Report (XML) or the findings
+                    (JSON, see buildFindings()) for the package (or extracted directory).
+    GET  /status    returns the state of the PackageChecker (JSON).
+    POST /shutdown  stops the daemon.
+    """
+
+    def do_GET(self):
+        if self.path == "/status":
+            self._sendResponse(200, "application/json", json.dumps(self.server.packageChecker.retrieveStatus()))
+        else:
+            self._sendResponse(404, "text/plain", "Unknown Request: %s" % self.path)
+
+    def do_POST(self):
+        if self.path == "/check":
+            self._checkPackage()
+        elif self.path == "/shutdown":
+            self._sendResponse(200, "text/plain", "Shutting Down")
+            # shutdown() waits for serve_forever() to stop (so it can't be called from this request's thread)
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            self._sendResponse(404, "text/plain", "Unknown Request: %s" % self.path)
+
+    def log_message(self, format, *args):
+        getLogger().debug("CheckTeradataPackageDaemon: " + format, *args)
+
+    # PRIVATE METHODS #
+
+    def _checkPackage(self):
+        try:
+            contentLength = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(contentLength).decode("utf-8"))
+            packagePath = request["package"]
+            reportFormat = request.get("format", "junit")
+        except (ValueError, KeyError, TypeError) as exception:
+            self._sendResponse(400, "text/plain", "Invalid Request: %s" % exception)
+            return
+
+        try:
+            ruleRunner = self.server.packageChecker.checkPackage(packagePath)
+        except Exception as exception:
+            getLogger().error("Package '%s' cannot be checked", packagePath)
+            getLogger().error(exception)
+            self._sendResponse(500, "text/plain", "Package cannot be checked: %s" % exception)
+            return
+
+        if reportFormat == "findings":
+            self._sendResponse(200, "application/json", json.dumps(buildFindings(ruleRunner)))
+        else:
+            self._sendResponse(200, "application/xml", ruleRunner.generateReportXml())
+
+    def _sendResponse(self, status, contentType, body):
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "%s; charset=utf-8" % contentType)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def createServer(packageChecker, port = DEFAULT_PORT):
+    """
+    Create the (HTTP) server of the daemon. It only listens on localhost.
+
+    :param packageChecker: The PackageChecker that runs the checks.
+    :param port: The port to listen on (0 = any free port, see server.server_address).
+    :returns: A ThreadingHTTPServer (see serve_forever()).
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), CheckRequestHandler)
+    server.packageChecker = packageChecker
+    return server
+
+
+def checkTeradataPackageDaemon(argv):
+    """
+    Run a resident (localhost) daemon that checks Teradata Packages on request (see CheckTeradataPackageClient).
+
+    The rules, the Teradata Keywords and (optionally) a ResultCache are kept warm between checks, and the rules are
+    read again when the rules file is modified (see PackageChecker).
+
+    Example : python -m cba.teds.CheckTeradataPackageDaemon -q resources/teradataQualityCheckRules.xml -P 8765 -c output/cache
+
+    Use -P <port> (--port) for the (localhost) port to listen on.
+    Use -c <cacheDirectory> (--cacheDirectory) to keep the findings for each artifact in a persistent result cache.
+    Use -i (--inMemory) to read each package straight from the tarball (nothing is extracted to disk).
+    Use -x (--selective) to only extract (or read) the members of each package that the rules can reach.
+    """
+
+    # Initialize Logging
+    logger = getLogger()
+
+    logger.debug("Start CheckTeradataPackageDaemon(%s) - %s", argv, datetime.now().strftime("%Y%m%d%H%M"))
+
+    teradataQualityCheckRuleFile = 'resources/teradataQualityCheckRules.xml'
+    port = DEFAULT_PORT
+    cacheDirectory = None
+    inMemory = False
+    selective = False
+
+    try:
+        opts, args = getopt.getopt(argv, "q:P:c:ixh",
+                                   ["teradataQualityCheckRuleFile=", "port=", "cacheDirectory=", "inMemory",
+                                    "selective", "help"])
+    except getopt.GetoptError as e:
+        print(e)
+        print("  cba.teds.CheckTeradataPackageDaemon [-q <qaRuleFilePath>] [-P <port>] [-c <cacheDirectory>] [-i] [-x]")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print("  HELP cba.teds.CheckTeradataPackageDaemon [-q <qaRuleFilePath>] [-P <port>] [-c <cacheDirectory>] [-i] [-x]")
+            sys.exit()
+        elif opt in ("-q", "--teradataQualityCheckRuleFile"):
+            teradataQualityCheckRuleFile = arg
+        elif opt in ("-P", "--port"):
+            try:
+                port = int(arg)
+            except ValueError:
+                print("  Invalid port: %s" % (arg))
+                sys.exit(2)
+        elif opt in ("-c", "--cacheDirectory"):
+            cacheDirectory = arg
+        elif opt in ("-i", "--inMemory"):
+            inMemory = True
+        elif opt in ("-x", "--selective"):
+            selective = True
+
+    packageChecker = PackageChecker(teradataQualityCheckRuleFile, cacheDirectory, inMemory, selective)
+    server = createServer(packageChecker, port)
+    logger.info(" Listening on http://%s:%d/", server.server_address[0], server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    checkTeradataPackageDaemon(sys.argv[1:])
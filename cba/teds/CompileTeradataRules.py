@@ -0,0 +1,81 @@
+from cba.teds.utils.Logger import getLogger
+import getopt
+import sys
+
+from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+from cba.teds.teradata.qa.rules.RuleSetCache import buildRuleSetHash, loadRuleSet, retrieveDefaultRuleSetDirectory, \
+    retrieveRuleSetPath
+
+from datetime import datetime
+
+
+def compileTeradataRules(argv):
+    """
+    Validate the Teradata Quality Check rules (e.g. before they are committed) and compile them into a rule set
+    directory so that the next CheckTeradataPackage run doesn't read the rules file. By default the compiled rule set
+    is written to the rulesets directory next to the rules file, where every CheckTeradataPackage run looks for it
+    (whether or not it uses a result cache).
+
+    Every pattern is compiled and every When/Action a Rule refers to is resolved. The errors are printed and the exit
+    code is 1 if there are any (the invalid Whens, Actions and Rules would be left out of a check).
+
+    Example : python -m cba.teds.CompileTeradataRules -q resources/teradataQualityCheckRules.xml
+
+    Use -l <ruleSetDirectory> (--ruleSetDirectory) to write the compiled rule set to another directory and -v
+    (--validateOnly) to only validate the rules.
+
+    :returns: The list of errors.
+    """
+
+    # Initialize Logging
+    logger = getLogger()
+
+    logger.debug("Start CompileTeradataRules(%s) - %s", argv, datetime.now().strftime("%Y%m%d%H%M"))
+
+    teradataQualityCheckRuleFile = 'resources/teradataQualityCheckRules.xml'
+    ruleSetDirectory = None
+    validateOnly = False
+
+    try:
+        opts, args = getopt.getopt(argv, "q:l:vh", ["teradataQualityCheckRuleFile=", "ruleSetDirectory=",
+                                                    "validateOnly", "help"])
+    except getopt.GetoptError as e:
+        print(e)
+        print("  cba.teds.CompileTeradataRules [-q <qaRuleFilePath>] [-l <ruleSetDirectory>] [-v]")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print("  HELP cba.teds.CompileTeradataRules [-q <qaRuleFilePath>] [-l <ruleSetDirectory>] [-v]")
+            sys.exit()
+        elif opt in ("-q", "--teradataQualityCheckRuleFile"):
+            teradataQualityCheckRuleFile = arg
+        elif opt in ("-l", "--ruleSetDirectory"):
+            ruleSetDirectory = arg
+        elif opt in ("-v", "--validateOnly"):
+            validateOnly = True
+
+    # Always read (and validate) the rules file, the cache only holds the result
+    ruleReader = RuleReader(teradataQualityCheckRuleFile)
+    errors = ruleReader.retrieveErrors()
+    for error in errors:
+        print("  %s" % error)
+
+    if not validateOnly:
+        if ruleSetDirectory is None:
+            ruleSetDirectory = retrieveDefaultRuleSetDirectory(teradataQualityCheckRuleFile)
+        loadRuleSet(teradataQualityCheckRuleFile, ruleSetDirectory)
+        logger.info(" Compiled Rule Set = %s",
+                    retrieveRuleSetPath(ruleSetDirectory, buildRuleSetHash(teradataQualityCheckRuleFile)))
+
+    logger.info(" %d Whens, %d Actions, %d Rules, %d Errors", len(ruleReader.retrieveListOfWhenConditions()),
+                len(ruleReader.retrieveListOfActions()), len(ruleReader.retrieveListOfRules()), len(errors))
+
+    if len(errors) > 0:
+        sys.exit(1)
+
+    return errors
+
+
+if __name__ == '__main__':
+    compileTeradataRules(sys.argv[1:])
@@ -0,0 +1,73 @@
+from cba.teds.utils.Logger import getLogger
+import getopt
+import sys
+import time
+
+from cba.teds.teradata.qa.rules.HtmlReportWriter import HtmlReportWriter, readJunitReport
+
+from datetime import datetime
+
+
+def renderTeradataQualityReport(argv):
+    """
+    Render the Quality Check Report (HTML) from the JUnit Report of a Teradata Package Check. This replaces the Ant
+    XSLT step (resources/teradataQualityCheckBuild.xml and teradataQualityCheckTransform.xsl) so no JVM is needed.
+
+    Example : python -m cba.teds.RenderTeradataQualityReport -p output/junit-teradataQualityCheck.xml -o Quality_Check_Report.html -n "%dep.GDW_DeveloperTools_PackageTeradata.teamcity.build.branch%" -q "%teamcity.build.id%" -k "%dep.GDW_DeveloperTools_PackageTeradata.teamcity.build.id%"
+
+    Use -p <junit-output.xml> (--junitReport) for the JUnit Report (the default is output/junit-teradataQualityCheck.xml).
+    Use -o <report.html> (--htmlReport) for the HTML Report (the default is Quality_Check_Report.html).
+    Use -n <branchName> (--branchName), -q <qaBuildId> (--qaBuildId), -k <packagerBuildId> (--packagerBuildId) and
+    -w <qaBuildTime> (--qaBuildTime) for the parameters of the report (the default qaBuildTime is now e.g.
+    14:30 26-05-2015).
+    """
+
+    # Initialize Logging
+    logger = getLogger()
+
+    logger.debug("Start RenderTeradataQualityReport(%s) - %s", argv, datetime.now().strftime("%Y%m%d%H%M"))
+
+    junitReport = 'output/junit-teradataQualityCheck.xml'
+    htmlReport = 'Quality_Check_Report.html'
+    branchName = ''
+    qaBuildId = ''
+    qaBuildTime = datetime.now().strftime("%H:%M %d-%m-%Y")
+    packagerBuildId = ''
+
+    try:
+        opts, args = getopt.getopt(argv, "p:o:n:q:w:k:h",
+                                   ["junitReport=", "htmlReport=", "branchName=", "qaBuildId=", "qaBuildTime=",
+                                    "packagerBuildId=", "help"])
+    except getopt.GetoptError as e:
+        print(e)
+        print("  cba.teds.RenderTeradataQualityReport [-p <junit-output.xml>] [-o <report.html>] [-n <branchName>] [-q <qaBuildId>] [-w <qaBuildTime>] [-k <packagerBuildId>]")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print("  HELP cba.teds.RenderTeradataQualityReport [-p <junit-output.xml>] [-o <report.html>] [-n <branchName>] [-q <qaBuildId>] [-w <qaBuildTime>] [-k <packagerBuildId>]")
+            sys.exit()
+        elif opt in ("-p", "--junitReport"):
+            junitReport = arg
+        elif opt in ("-o", "--htmlReport"):
+            htmlReport = arg
+        elif opt in ("-n", "--branchName"):
+            branchName = arg
+        elif opt in ("-q", "--qaBuildId"):
+            qaBuildId = arg
+        elif opt in ("-w", "--qaBuildTime"):
+            qaBuildTime = arg
+        elif opt in ("-k", "--packagerBuildId"):
+            packagerBuildId = arg
+
+    start = time.time()
+
+    testSuites = readJunitReport(junitReport)
+    with open(htmlReport, "w", encoding="ascii") as reportFile:
+        HtmlReportWriter(reportFile, branchName, qaBuildId, qaBuildTime, packagerBuildId).writeReport(testSuites)
+
+    logger.info(" HTML Report    = %s (%.3f seconds)" % (htmlReport, time.time() - start))
+
+
+if __name__ == '__main__':
+    renderTeradataQualityReport(sys.argv[1:])
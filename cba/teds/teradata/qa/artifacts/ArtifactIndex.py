@@ -0,0 +1,180 @@
+import cba.teds.utils.Logger
+
+from collections import OrderedDict
+from enum import Enum
+
+
+class ArtifactKind(Enum):
+    """
+    ArtifactKind defines the kinds of artifact (file) in an Assembled Package (an artifact can be more than one kind
+    e.g. a Rollback_Drop_Tables.sql file is a DropTables and a RollbackDropTables artifact).
+
+    Table = Creates a Table (*.tbl)
+    View = Creates a View (*.viw)
+    Comment = Creates a Comment (*.cmt)
+    AutoBackupTables = Backs up Tables (*Auto_Backup_Tables*)
+    AutoBackupViews = Backs up Views (*Auto_Backup_Views*, unless it is an AutoBackupTables artifact)
+    DropTables = Drops Tables (*_Drop_Tables.sql)
+    DropViews = Drops Views (*_Drop_Views.sql)
+    RollbackDropTables = Drops Tables on Rollback (*Rollback_Drop_Tables.sql)
+    RollbackDropViews = Drops Views on Rollback (*Rollback_Drop_Views.sql)
+    BackupViews = Shows the Views to Back up (*_Backup_Views.sql)
+    Version = The Version File (*Version.txt)
+    """
+
+    Table = "TABLE"
+    View = "VIEW"
+    Comment = "COMMENT"
+    AutoBackupTables = "AUTO_BACKUP_TABLES"
+    AutoBackupViews = "AUTO_BACKUP_VIEWS"
+    DropTables = "DROP_TABLES"
+    DropViews = "DROP_VIEWS"
+    RollbackDropTables = "ROLLBACK_DROP_TABLES"
+    RollbackDropViews = "ROLLBACK_DROP_VIEWS"
+    BackupViews = "BACKUP_VIEWS"
+    Version = "VERSION"
+
+
+def classifyArtifact(filePath):
+    """
+        Helper function to classify an artifact by its File Path.
+
+        :param filePath: The File Path (e.g. resources/test//EXTRACTED_FILES_20150528145843/TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0/P_D_BAL_001_STD_0.FACT_ACCT_BALN_MNLY.tbl)
+        :returns kinds: A tuple of ArtifactKind (e.g. (ArtifactKind.Table,))
+    """
+    kinds = []
+
+    if filePath.endswith(".tbl"):
+        kinds.append(ArtifactKind.Table)
+    elif filePath.endswith(".viw"):
+        kinds.append(ArtifactKind.View)
+    elif filePath.endswith(".cmt"):
+        kinds.append(ArtifactKind.Comment)
+
+    if filePath.find("Auto_Backup_Tables") > -1:
+        kinds.append(ArtifactKind.AutoBackupTables)
+    elif filePath.find("Auto_Backup_Views") > -1:
+        kinds.append(ArtifactKind.AutoBackupViews)
+
+    if filePath.find("_Drop_Tables.sql") > -1:
+        kinds.append(ArtifactKind.DropTables)
+    if filePath.find("_Drop_Views.sql") > -1:
+        kinds.append(ArtifactKind.DropViews)
+    if filePath.find("Rollback_Drop_Tables.sql") > -1:
+        kinds.append(ArtifactKind.RollbackDropTables)
+    if filePath.find("Rollback_Drop_Views.sql") > -1:
+        kinds.append(ArtifactKind.RollbackDropViews)
+    if filePath.find("_Backup_Views.sql") > -1:
+        kinds.append(ArtifactKind.BackupViews)
+
+    if filePath.find("Version.txt") > -1:
+        kinds.append(ArtifactKind.Version)
+
+    return tuple(kinds)
+
+
+class ArtifactIndex(object):
+    """
+    The ArtifactIndex class classifies (see classifyArtifact()) every artifact of a package once and keeps a map of
+    ArtifactKind to file ids (the position of the File Path in the package files list).
+
+    It answers "which artifacts are of this kind?" (e.g. for AssembledPackage.retrieveCreatedObjects()) and "what kinds
+    is this artifact?" (e.g. for the filter dispatch in RuleRunner) without scanning the File Paths again.
+
+    If an ArtifactSniffer is specified every artifact is also sniffed (once) to decide whether its content is text
+    that is worth scanning (see retrieveSkipReason()).
+    """
+
+    def __init__(self, filePaths, artifactSniffer=None, artifactContents=None):
+        """
+        Constructor.
+
+        :param filePaths: The list of File Paths of the package (see retrieveAssembledPackageFilesList()).
+        :param artifactSniffer: An ArtifactSniffer (None = don't sniff the artifacts).
+        :param artifactContents: A map of File Path to content (bytes) if the artifacts are only held in memory (an
+                                 artifact that isn't in the map is not sniffed).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: ArtifactIndex(%d files)", len(filePaths))
+
+        self._filePaths = list(filePaths)
+        self._fileIds = {} # map keyed on file path
+        self._artifactKinds = [] # list (indexed by file id) of the kinds of each file
+
+        self._fileIdsByKind = OrderedDict((kind, []) for kind in ArtifactKind)
+        self._skipReasons = OrderedDict() # map keyed on file path (of the artifacts whose content is not scanned)
+
+        for fileId, filePath in enumerate(self._filePaths):
+            kinds = classifyArtifact(filePath)
+            self._fileIds[filePath] = fileId
+            self._artifactKinds.append(kinds)
+            for kind in kinds:
+                self._fileIdsByKind[kind].append(fileId)
+
+            if artifactSniffer is not None:
+                if artifactContents is None:
+                    skipReason = artifactSniffer.sniffFile(filePath)
+                elif filePath in artifactContents:
+                    skipReason = artifactSniffer.sniffContent(filePath, artifactContents[filePath])
+                else:
+                    skipReason = None
+                if skipReason is not None:
+                    self._skipReasons[filePath] = skipReason
+
+        if self._skipReasons:
+            self.logger.info("The content of %d of %d files will not be scanned (binary, oversized or non-text)",
+                             len(self._skipReasons), len(self._filePaths))
+
+    def __len__(self):
+        return len(self._filePaths)
+
+    # PUBLIC METHODS #
+
+    def retrieveFileIds(self, kind):
+        """
+        Returns the list of file ids (in package order) of a kind of artifact.
+
+        :param kind: An ArtifactKind.
+        """
+        return self._fileIdsByKind[kind]
+
+    def retrieveFilePaths(self, kind):
+        """
+        Returns the list of File Paths (in package order) of a kind of artifact.
+
+        :param kind: An ArtifactKind.
+        """
+        return [self._filePaths[fileId] for fileId in self._fileIdsByKind[kind]]
+
+    def retrieveFilePath(self, fileId):
+        return self._filePaths[fileId]
+
+    def retrieveArtifactKinds(self, filePath):
+        """
+        Returns the kinds (a tuple of ArtifactKind) of an artifact (an artifact outside the package is classified on
+        the fly).
+
+        :param filePath: A File Path.
+        """
+        fileId = self._fileIds.get(filePath)
+        if fileId is None:
+            return classifyArtifact(filePath)
+        return self._artifactKinds[fileId]
+
+    def retrieveSkipReason(self, filePath):
+        """
+        Returns the ArtifactSkipReason of an artifact whose content is not scanned (None otherwise).
+
+        :param filePath: A File Path.
+        """
+        return self._skipReasons.get(filePath)
+
+    def retrieveSkippedFilePaths(self):
+        """
+        Returns the list of File Paths (in package order) of the artifacts whose content is not scanned.
+        """
+        return list(self._skipReasons.keys())
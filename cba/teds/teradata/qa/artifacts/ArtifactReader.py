@@ -0,0 +1,60 @@
+import locale
+import mmap
+import os
+
+
+def decodeArtifactBytes(buffer):
+    """
+        Helper function to decode the content (bytes) of an artifact the same way that a file opened in text mode
+        (i.e. open(filePath)) would be read i.e. using the preferred encoding and universal newlines.
+
+        :param buffer: The content of the artifact (any bytes-like object e.g. bytes, mmap, memoryview)
+        :returns text: The content of the artifact (String)
+    """
+    text = str(buffer, locale.getpreferredencoding(False))
+
+    # Universal Newlines (only copy the text if there is something to translate)
+    if text.find("\r") > -1:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return text
+
+
+def readArtifactText(filePath):
+    """
+        Helper function to read the entire content of an artifact (file) in one go.
+
+        The file is memory-mapped and decoded straight from the mapping (there is no intermediate copy of the bytes)
+        and the result can be shared by everything that needs the content of the artifact (see iterateLines()).
+
+        :param filePath: The path of the artifact
+        :returns text: The content of the artifact (String)
+    """
+    with open(filePath, "rb") as file:
+        # An empty file cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""
+
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return decodeArtifactBytes(mapping)
+        finally:
+            mapping.close()
+
+
+def iterateLines(text):
+    """
+        Helper function to iterate over the lines of the content of an artifact (in the same way as iterating over a
+        file opened in text mode i.e. each line includes its trailing newline).
+
+        :param text: The content of the artifact (String)
+        :returns: A generator of (start, end) spans (of each line in text)
+    """
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start) + 1
+        if end == 0:
+            end = length
+        yield start, end
+        start = end
@@ -0,0 +1,159 @@
+import cba.teds.utils.Logger
+import codecs
+import locale
+import os
+
+from enum import Enum
+
+
+class ArtifactSkipReason(Enum):
+    """
+    ArtifactSkipReason defines why the content of an artifact (file) is not scanned by the rules (the File Path is
+    still checked).
+
+    DeniedExtension = The file extension is on the deny list (e.g. *.png, *.pdf, *.zip)
+    Oversized = The file is larger than the size threshold (e.g. a data extract)
+    Binary = The file contains NUL bytes
+    NonText = The file has too many control characters or cannot be decoded (using the preferred encoding)
+    """
+
+    DeniedExtension = "DENIED_EXTENSION"
+    Oversized = "OVERSIZED"
+    Binary = "BINARY"
+    NonText = "NON_TEXT"
+
+
+class ArtifactSniffer(object):
+    """
+    The ArtifactSniffer class decides (once, when the package is indexed, see ArtifactIndex) whether the content of
+    an artifact is text that is worth scanning. It looks at the file extension, the size of the file and the first
+    sniffLength bytes of its content (rather than the whole file).
+
+    1.  An extension on the deny list is skipped (the content is not read).
+    2.  A file larger than maxSize is skipped.
+    3.  The content is sniffed for NUL bytes (binary), whatever the extension.
+    4.  An extension on the allow list is text. Otherwise the content is sniffed for too many control characters or
+        bytes that cannot be decoded (non-text).
+
+    NOTE:  Archives (*.gz, *.tar) are never scanned (see RuleRunner) so they are not sniffed (or reported) here.
+    NOTE:  A file that cannot be read is not skipped (the error is reported when it is scanned).
+    """
+
+    DEFAULT_MAX_SIZE = 32 * 1024 * 1024 # bytes
+    DEFAULT_SNIFF_LENGTH = 8192 # bytes
+
+    # The share of control characters (other than whitespace) in the sniffed content that makes it non-text
+    MAX_CONTROL_CHARACTER_RATIO = 0.1
+
+    ALLOWED_EXTENSIONS = (".tbl", ".viw", ".cmt", ".sql", ".bteq", ".btq", ".txt", ".sts", ".grt", ".log", ".xml",
+                          ".csv", ".ddl", ".sh", ".ksh")
+    DENIED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".pdf", ".doc", ".docx", ".xls", ".xlsx",
+                         ".ppt", ".pptx", ".zip", ".7z", ".bz2", ".xz", ".jar", ".class", ".exe", ".dll", ".so", ".pyc")
+    ARCHIVE_EXTENSIONS = (".gz", ".tar")
+
+    # The bytes (other than NUL) that are not expected in text i.e. the control characters except \t \n \f \r (and
+    # \b \x1b that turn up in logs)
+    _CONTROL_CHARACTERS = bytes(character for character in range(1, 32) if character not in (8, 9, 10, 12, 13, 27)) + b"\x7f"
+
+    def __init__(self, maxSize=DEFAULT_MAX_SIZE, sniffLength=DEFAULT_SNIFF_LENGTH,
+                 allowedExtensions=ALLOWED_EXTENSIONS, deniedExtensions=DENIED_EXTENSIONS):
+        """
+        Constructor.
+
+        :param maxSize: The size (bytes) above which the content of an artifact is not scanned.
+        :param sniffLength: The number of bytes (at the start of an artifact) that are sniffed.
+        :param allowedExtensions: The (lower case) file extensions that are always text.
+        :param deniedExtensions: The (lower case) file extensions that are never scanned.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: ArtifactSniffer(%s, %s)", maxSize, sniffLength)
+
+        self._maxSize = maxSize
+        self._sniffLength = sniffLength
+        self._allowedExtensions = tuple(allowedExtensions)
+        self._deniedExtensions = tuple(deniedExtensions)
+        self._encoding = locale.getpreferredencoding(False)
+
+    # PUBLIC METHODS #
+
+    def sniffFile(self, filePath):
+        """
+        Sniff an artifact (file) on the file system.
+
+        :param filePath: The File Path of the artifact.
+        :returns: An ArtifactSkipReason or None (if the content of the artifact should be scanned).
+        """
+        reason = self._sniffFilePath(filePath)
+        if reason is not None or self._isArchive(filePath):
+            return reason
+
+        try:
+            size = os.path.getsize(filePath)
+            if size > self._maxSize:
+                return ArtifactSkipReason.Oversized
+            with open(filePath, "rb") as file:
+                head = file.read(self._sniffLength)
+        except (IOError, OSError):
+            return None
+
+        return self._sniffHead(head, size <= len(head), self._isAllowed(filePath))
+
+    def sniffContent(self, filePath, content):
+        """
+        Sniff an artifact that is held in memory.
+
+        :param filePath: The File Path of the artifact.
+        :param content: The content (bytes) of the artifact.
+        :returns: An ArtifactSkipReason or None (if the content of the artifact should be scanned).
+        """
+        reason = self._sniffFilePath(filePath)
+        if reason is not None or self._isArchive(filePath):
+            return reason
+
+        if len(content) > self._maxSize:
+            return ArtifactSkipReason.Oversized
+
+        return self._sniffHead(bytes(content[:self._sniffLength]), len(content) <= self._sniffLength,
+                               self._isAllowed(filePath))
+
+    # PRIVATE METHODS #
+
+    def _isArchive(self, filePath):
+        return filePath.lower().endswith(self.ARCHIVE_EXTENSIONS)
+
+    def _isAllowed(self, filePath):
+        return filePath.lower().endswith(self._allowedExtensions)
+
+    def _sniffFilePath(self, filePath):
+        if filePath.lower().endswith(self._deniedExtensions):
+            return ArtifactSkipReason.DeniedExtension
+        return None
+
+    def _sniffHead(self, head, complete, allowed=False):
+        """
+            Sniff the first bytes of the content of an artifact.
+
+            :param head: The first (up to sniffLength) bytes of the content.
+            :param complete: True if the head is the entire content (i.e. it doesn't end part way through a character).
+            :param allowed: True if the extension is on the allow list (only NUL bytes are sniffed).
+        """
+        if head.find(b"\x00") > -1:
+            return ArtifactSkipReason.Binary
+
+        if allowed or len(head) == 0:
+            return None
+
+        controlCharacters = len(head) - len(head.translate(None, self._CONTROL_CHARACTERS))
+        if controlCharacters > len(head) * self.MAX_CONTROL_CHARACTER_RATIO:
+            return ArtifactSkipReason.NonText
+
+        try:
+            codecs.getincrementaldecoder(self._encoding)().decode(head, complete)
+        except UnicodeDecodeError:
+            return ArtifactSkipReason.NonText
+
+        return None
@@ -11,7 +11,8 @@ class Artifacts(object):
 
     @abc.abstractmethod
     def name(self):
-        """ Returns a Name for the Artifacts. ""
+        """ Returns a Name for the Artifacts. """
+
     @abc.abstractmethod
     def runChecks(self):
         """ Run all of the Checks for the Artifacts. """
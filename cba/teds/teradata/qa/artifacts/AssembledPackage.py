@@ -7,11 +7,22 @@ import shutil
 import tarfile
 import time
 
+from collections import OrderedDict
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import ArtifactIndex, ArtifactKind
+from cba.teds.teradata.qa.artifacts.ArtifactSniffer import ArtifactSniffer
+from cba.teds.teradata.qa.artifacts.ArtifactReader import readArtifactText
 from cba.teds.teradata.qa.artifacts.TeradataArtifacts import TeradataArtifacts
+from cba.teds.teradata.qa.rules.KeywordIndex import loadKeywordIndex
 from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
 from tarfile import TarFile
 
 
+# The statements that name the deleted (and rolled-back) objects
+_DROP_TABLE_PATTERN = re.compile("DROP TABLE (.*);")
+_DROP_VIEW_PATTERN = re.compile("DROP VIEW (.*);")
+_SHOW_VIEW_PATTERN = re.compile("SHOW VIEW (.*);")
+
+
 def extractObjectNameFromFilePath(filePath):
     """
         Helper function to extract the file name component from a file path.
@@ -32,15 +43,20 @@ class AssembledPackage(TeradataArtifacts):
 
         It works by extracting the specified assembled_package.tgz to a specified directory and then identifying
         constituent files to support the interface defined in TeradataArtifacts.
+
+        If an ExtractionPlan is specified only the members that the rules can reach are extracted (the other members
+        are still listed but their content is not available).
     """
 
-    def __init__(self, packageDirectory, packageFileName, extractionDirectory=None):
+    def __init__(self, packageDirectory, packageFileName, extractionDirectory=None, extractionPlan=None):
         """
         Constructor. Everything happens in the Constructor. The Package is extracted and the extracted files are
         walked to set up everything that is exposed via the public interface.
 
         :param packageDirectory: The relative (project root) path to the directory containing the Assembled Package.
         :param packageFileName: The file name of the Assembled Package.
+        :param extractionDirectory: The name of a directory (in packageDirectory) the Package was already extracted to.
+        :param extractionPlan: An ExtractionPlan (None = extract every member).
         """
 
         # Initialize Logging
@@ -52,6 +68,10 @@ class AssembledPackage(TeradataArtifacts):
         # Copy Parameters to Local Variables
         self._packageDirectory = packageDirectory
         self._packageFileName = packageFileName
+        self._extractionPlan = extractionPlan
+
+        # The (file) member names of the Package if it is extracted selectively (see _extractSelectedMembers())
+        self._memberNames = None
 
         # Create a unique Directory Name to Extract To
         if extractionDirectory is None:
@@ -59,22 +79,44 @@ class AssembledPackage(TeradataArtifacts):
             timestampString = datetime.datetime.fromtimestamp(rightNow).strftime("%Y%m%d%H%M%S")
             self._extractionDirectory = "EXTRACTED_FILES_" + timestampString
 
+            # Packages extracted in the same second (e.g. by a PackageBatch) must not share (and delete) the same
+            # directory so the directory is claimed (created) before the Package is extracted
+            suffix = 1
+            while True:
+                try:
+                    os.mkdir(self._extractedFilesRelativeDirectory())
+                    break
+                except FileExistsError:
+                    suffix += 1
+                    self._extractionDirectory = "EXTRACTED_FILES_%s_%d" % (timestampString, suffix)
+                except OSError:
+                    # e.g. the Package Directory doesn't exist (reported by _extractFiles())
+                    break
+
             # Extract the Package (Can Throw an Exception)
             self._packageExtracted = self._extractFiles()
             if self._packageExtracted == False:
+                self._deleteExtractedFiles()
                 raise ValueError("Error Extracting Assembled Package: %s" % self.name())
         else:
             self._packageExtracted = False
             self._extractionDirectory = extractionDirectory
 
-        # Walk the Extracted Files and Store all the File Names
+        # Walk the Extracted Files (or List the Members of a Selectively Extracted Package) and Store all the File Names
         self._assembledPackageFilesList = []
-        for root, directoryNames, fileNames in os.walk(self._extractedFilesRelativeDirectory(), topdown=True):
-            for fileName in fileNames:
-                filePath = os.path.join(root, fileName)
-                # Standardise Slashes Up Front for extractObjectNameFromFilePath()
-                filePath = filePath.replace("\\", "/")
-                self._assembledPackageFilesList.append(filePath)
+        if self._memberNames is not None:
+            for memberName in self._memberNames:
+                self._assembledPackageFilesList.append(self._extractedFilesRelativeDirectory() + memberName)
+        else:
+            for root, directoryNames, fileNames in os.walk(self._extractedFilesRelativeDirectory(), topdown=True):
+                for fileName in fileNames:
+                    filePath = os.path.join(root, fileName)
+                    # Standardise Slashes Up Front for extractObjectNameFromFilePath()
+                    filePath = filePath.replace("\\", "/")
+                    self._assembledPackageFilesList.append(filePath)
+
+        # Classify (and Sniff) the Files (once)
+        self._artifactIndex = ArtifactIndex(self._assembledPackageFilesList, ArtifactSniffer())
 
         # Initialise the Local Variables
         self._changeRequestNumber = None
@@ -99,6 +141,13 @@ class AssembledPackage(TeradataArtifacts):
         self.logger.debug("Call: retrieveAssembledPackageFilesList()")
         return self._assembledPackageFilesList
 
+    def retrieveArtifactIndex(self):
+        """
+        Returns the ArtifactIndex (i.e. the kinds of each file) of the Package.
+        """
+        self.logger.debug("Call: retrieveArtifactIndex()")
+        return self._artifactIndex
+
     def name(self):
         self.logger.debug("Call: name()")
         return self._packageFileName
@@ -112,44 +161,74 @@ class AssembledPackage(TeradataArtifacts):
 
         if self._changeRequestNumber == None:
 
-            for filePath in self._assembledPackageFilesList:
-                if filePath.find("Version.txt") > -1:
-                    file = open(filePath)
-                    for line in file:
-                        if line.find("CR_NUMBER:") > -1:
-                            line = line.rstrip().lstrip()
-                            startIndex = line.find("CR_NUMBER:")
-                            self._changeRequestNumber = line[startIndex + 10:].rstrip().lstrip()
+            for filePath in self._artifactIndex.retrieveFilePaths(ArtifactKind.Version):
+                file = self._openArtifact(filePath)
+                for line in file:
+                    if line.find("CR_NUMBER:") > -1:
+                        line = line.rstrip().lstrip()
+                        startIndex = line.find("CR_NUMBER:")
+                        self._changeRequestNumber = line[startIndex + 10:].rstrip().lstrip()
+                file.close()
 
         return self._changeRequestNumber
 
     def retrieveTeradataKeywords(self):
         """
-            This public interface retrieve all the teradata keywords from 'resources/Teradata_Reserved_Words.csv'
+            This public interface retrieve all the teradata keywords from 'resources/Teradata_Reserved_Words.csv' as a
+            KeywordIndex (the file is only read once per process)
         """
         self.logger.debug("Call: retrieveTeradataKeywords()")
         if self._teradataKeywords == None:
-            self._teradataKeywords = []
-            filePath = 'resources/Teradata_Reserved_Words.csv'
-            file = open(filePath)
-            try:
-                for line in file:
-                    tmpLine = line.rstrip() # remove new line character
-                    tmpLine += ' '
-                    self._teradataKeywords.append(tmpLine)
-            except Exception as exception:
-                self.logger.error("AssembledPackage.retrieveTeradataKeywords() ERROR IN READING FILE(%s)" % filePath)
-                self.logger.error(exception)
-            file.close()
+            self._teradataKeywords = loadKeywordIndex('resources/Teradata_Reserved_Words.csv')
 
         return self._teradataKeywords
 
-    def runChecks(self, rulesFileName = 'resources/teradataQualityCheckRules.xml', junitFileName = 'output/junit-GeneratedFromRuleRunner.xml'):
-        self.logger.debug("Call: runChecks(rulesFileName = %s, junitFileName = %s)" % (rulesFileName, junitFileName))
+    def retrieveArtifactContent(self, filePath):
+        """
+        Returns the entire content (bytes) of an artifact.
+
+        :param filePath: A File Path (see retrieveAssembledPackageFilesList()).
+        """
+        with open(filePath, "rb") as file:
+            return file.read()
+
+    def retrieveArtifactText(self, filePath):
+        """
+        Returns the entire content (String) of an artifact.
 
-        self._ruleRunner = RuleRunner(rulesFileName, self)
+        :param filePath: A File Path (see retrieveAssembledPackageFilesList()).
+        """
+        return readArtifactText(filePath)
+
+    def retrieveInMemoryArtifacts(self):
+        """
+        Returns a map of File Path to content (bytes) if the artifacts are only held in memory (None otherwise).
+        """
+        return None
+
+    def runChecks(self, rulesFileName = 'resources/teradataQualityCheckRules.xml', junitFileName = 'output/junit-GeneratedFromRuleRunner.xml', jobs = 1, streaming = False, cacheDirectory = None, statsFileName = None, corpus = False, prefetch = 0, readers = 1):
+        """
+        Run all of the Checks (Rules) for the Assembled Package and generate a JUnit Report.
+
+        :param rulesFileName: The relative (project root) path to the rules (XML) file.
+        :param junitFileName: The file path of the JUnit Report.
+        :param jobs: The number of worker processes used to run the rules (1 = run the rules in this process).
+        :param streaming: Set to True to evaluate the rules one artifact at a time (see RuleRunner).
+        :param cacheDirectory: The path of a directory for a ResultCache (None = don't cache the findings).
+        :param statsFileName: The file path of a (JSON) stats file (None = don't collect the rule statistics).
+        :param corpus: Set to True to search for the LINE pattern Whens in an ArtifactCorpus (see RuleRunner).
+        :param prefetch: The number of artifacts that are read ahead of the evaluation (0 = don't read ahead).
+        :param readers: The number of (background) reader threads if the artifacts are read ahead.
+        """
+        self.logger.debug("Call: runChecks(rulesFileName = %s, junitFileName = %s, jobs = %s, streaming = %s, cacheDirectory = %s, statsFileName = %s, corpus = %s, prefetch = %s, readers = %s)" % (rulesFileName, junitFileName, jobs, streaming, cacheDirectory, statsFileName, corpus, prefetch, readers))
+
+        self._ruleRunner = RuleRunner(rulesFileName, self, jobs, streaming=streaming, cacheDirectory=cacheDirectory,
+                                      collectStatistics=statsFileName is not None, corpus=corpus, prefetch=prefetch,
+                                      readers=readers)
         self._ruleRunner.runRules()
         self._ruleRunner.generateReport(junitFileName)
+        if statsFileName is not None:
+            self._ruleRunner.writeStatistics(statsFileName)
 
     def retrieveCreatedObjects(self):
         """
@@ -162,14 +241,11 @@ class AssembledPackage(TeradataArtifacts):
 
             self._createdObjects = set()
 
-            for filePath in self._assembledPackageFilesList:
-                if filePath.endswith(".tbl"):
-                    objectName = extractObjectNameFromFilePath(filePath)
-                    self._createdObjects.add(objectName)
+            for filePath in self._artifactIndex.retrieveFilePaths(ArtifactKind.Table):
+                self._createdObjects.add(extractObjectNameFromFilePath(filePath))
 
-            for filePath in self._assembledPackageFilesList:
-                if filePath.endswith(".viw"):
-                    self._createdObjects.add(extractObjectNameFromFilePath(filePath))
+            for filePath in self._artifactIndex.retrieveFilePaths(ArtifactKind.View):
+                self._createdObjects.add(extractObjectNameFromFilePath(filePath))
 
         return self._createdObjects
 
@@ -184,25 +260,8 @@ class AssembledPackage(TeradataArtifacts):
 
             self._deletedObjects = set()
 
-            for filePath in self._assembledPackageFilesList:
-                if filePath.find("_Drop_Tables.sql") != -1:
-                    file = open(filePath)
-                    for line in file:
-                        match = re.search("DROP TABLE (.*);", line)
-                        if match:
-                            objectName = match.groups()[0]
-                            self._deletedObjects.add(objectName)
-                    file.close()
-
-            for filePath in self._assembledPackageFilesList:
-                if filePath.find("_Drop_Views.sql") != -1:
-                    file = open(filePath)
-                    for line in file:
-                        match = re.search("DROP VIEW (.*);", line)
-                        if match:
-                            objectName = match.groups()[0]
-                            self._deletedObjects.add(objectName)
-                    file.close()
+            self._collectObjectNames(ArtifactKind.DropTables, _DROP_TABLE_PATTERN, self._deletedObjects)
+            self._collectObjectNames(ArtifactKind.DropViews, _DROP_VIEW_PATTERN, self._deletedObjects)
 
         return self._deletedObjects
 
@@ -217,35 +276,9 @@ class AssembledPackage(TeradataArtifacts):
 
             self._rolledBackObjects = set()
 
-            for filePath in self._assembledPackageFilesList:
-                if filePath.find("Rollback_Drop_Tables.sql") != -1:
-                    file = open(filePath)
-                    for line in file:
-                        match = re.search("DROP TABLE (.*);", line)
-                        if match:
-                            objectName = match.groups()[0]
-                            self._rolledBackObjects.add(objectName)
-                    file.close()
-
-            for filePath in self._assembledPackageFilesList:
-                if filePath.find("Rollback_Drop_Views.sql") != -1:
-                    file = open(filePath)
-                    for line in file:
-                        match = re.search("DROP VIEW (.*);", line)
-                        if match:
-                            objectName = match.groups()[0]
-                            self._rolledBackObjects.add(objectName)
-                    file.close()
-
-            for filePath in self._assembledPackageFilesList:
-                if filePath.find("_Backup_Views.sql") != -1:
-                    file = open(filePath)
-                    for line in file:
-                        match = re.search("SHOW VIEW (.*);", line)
-                        if match:
-                            objectName = match.groups()[0]
-                            self._rolledBackObjects.add(objectName)
-                    file.close()
+            self._collectObjectNames(ArtifactKind.RollbackDropTables, _DROP_TABLE_PATTERN, self._rolledBackObjects)
+            self._collectObjectNames(ArtifactKind.RollbackDropViews, _DROP_VIEW_PATTERN, self._rolledBackObjects)
+            self._collectObjectNames(ArtifactKind.BackupViews, _SHOW_VIEW_PATTERN, self._rolledBackObjects)
 
         return self._rolledBackObjects
 
@@ -257,6 +290,25 @@ class AssembledPackage(TeradataArtifacts):
     def _packagePath(self):
         return os.path.abspath(self._packageDirectory + "/" + self._packageFileName)
 
+    def _openArtifact(self, filePath):
+        return open(filePath)
+
+    def _collectObjectNames(self, kind, pattern, objectNames):
+        """
+        Add the Object Name matched (by the first group of the pattern) in each line of each artifact of a kind.
+
+        :param kind: An ArtifactKind (e.g. ArtifactKind.DropTables).
+        :param pattern: A compiled regular expression (e.g. _DROP_TABLE_PATTERN).
+        :param objectNames: The set of Object Names to add to.
+        """
+        for filePath in self._artifactIndex.retrieveFilePaths(kind):
+            file = self._openArtifact(filePath)
+            for line in file:
+                match = pattern.search(line)
+                if match:
+                    objectNames.add(match.groups()[0])
+            file.close()
+
     def _extractFiles(self):
 
         extractionOK = False
@@ -264,14 +316,41 @@ class AssembledPackage(TeradataArtifacts):
         try:
             extractionOK = tarfile.is_tarfile(self._packagePath())
             tarFile = TarFile.open(self._packagePath(), mode="r")
-            tarFile.extractall(self.extractedFilesDirectory())
-            self.logger.info("Package Extracted to '%s'", self.extractedFilesDirectory())
+            if self._extractionPlan is None:
+                tarFile.extractall(self.extractedFilesDirectory())
+                self.logger.info("Package Extracted to '%s'", self.extractedFilesDirectory())
+            else:
+                self._extractSelectedMembers(tarFile)
 
         except FileNotFoundError as fileNotFoundError:
             self.logger.error("Package Not Found (Check Working Directory): %s", self._packagePath())
 
         return extractionOK
 
+    def _extractSelectedMembers(self, tarFile):
+        """
+        Extract only the members (files) that the ExtractionPlan requires and list the names of all the members.
+
+        :param tarFile: The (open) TarFile of the Package.
+        """
+        memberNames = OrderedDict() # map keyed on member name
+        selectedMembers = []
+        for member in tarFile.getmembers():
+            if not member.isfile():
+                continue
+            # Standardise Slashes Up Front for extractObjectNameFromFilePath()
+            memberName = member.name.replace("\\", "/")
+            if memberName.startswith("./"):
+                memberName = memberName[2:]
+            memberNames[memberName] = True
+            if self._extractionPlan.requiresContent(memberName):
+                selectedMembers.append(member)
+
+        tarFile.extractall(self.extractedFilesDirectory(), members=selectedMembers)
+        self._memberNames = list(memberNames.keys())
+        self.logger.info("Package Extracted (%d of %d files) to '%s'", len(selectedMembers), len(self._memberNames),
+                         self.extractedFilesDirectory())
+
     def _deleteExtractedFiles(self):
 
         if (os.path.exists(self.extractedFilesDirectory())):
@@ -0,0 +1,182 @@
+import cba.teds.utils.Logger
+import multiprocessing
+import os
+import time
+
+from junit_xml import TestSuite, TestCase
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.TarballPackage import TarballPackage
+from cba.teds.teradata.qa.rules.ExtractionPlan import ExtractionPlan
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.teradata.qa.rules.RuleSetCache import loadRuleSet
+
+
+def retrieveJunitFileName(outputDirectory, packagePath):
+    """
+        Helper function to build the file path of the JUnit Report of a package in a batch e.g.
+
+            From : resources/test/test_assembled_package.tgz
+            TO   : <outputDirectory>/junit-test_assembled_package.xml
+
+        :param outputDirectory: The path of the directory for the JUnit Reports.
+        :param packagePath: The path of the Assembled Package.
+        :returns junitFileName: The file path of the JUnit Report.
+    """
+    packageName = os.path.basename(packagePath)
+    for extension in (".tgz", ".tar.gz", ".tar"):
+        if packageName.endswith(extension):
+            packageName = packageName[:-len(extension)]
+            break
+
+    return os.path.join(outputDirectory, "junit-%s.xml" % packageName)
+
+
+# The (parsed) rules of a batch worker process (see PackageBatch.runChecks())
+_batchRulesFileName = None
+_batchRuleReader = None
+_batchExtractionPlan = None
+_batchInMemory = False
+
+
+def _initialiseBatchWorker(rulesFileName, inMemory, selective):
+    global _batchRulesFileName, _batchRuleReader, _batchExtractionPlan, _batchInMemory
+    _batchRulesFileName = rulesFileName
+    _batchRuleReader = loadRuleSet(rulesFileName)
+    _batchExtractionPlan = ExtractionPlan(rulesFileName) if selective else None
+    _batchInMemory = inMemory
+
+
+def _checkPackageInBatch(packageCheck):
+    """
+        Check one package of a batch (in a worker process) and write its JUnit Report.
+
+        :param packageCheck: A tuple of (package path, JUnit file name)
+        :returns: A tuple of (package path, JUnit file name, number of failed artifacts, number of artifacts with
+                  warnings, elapsed seconds, error message (None if the package was checked))
+    """
+    packagePath, junitFileName = packageCheck
+
+    logger = cba.teds.utils.Logger.getLogger()
+    logger.info("Checking Package '%s'", packagePath)
+
+    start = time.time()
+    failures = 0
+    warnings = 0
+    errorMessage = None
+    try:
+        packageDirectory, packageFileName = os.path.split(packagePath)
+        if _batchInMemory:
+            assembledPackage = TarballPackage(packageDirectory, packageFileName, _batchExtractionPlan)
+        else:
+            assembledPackage = AssembledPackage(packageDirectory, packageFileName,
+                                                extractionPlan=_batchExtractionPlan)
+
+        # The rules are shared by every package of the worker so nothing may be collected in the When.data lists
+        ruleRunner = RuleRunner(_batchRulesFileName, assembledPackage, streaming=True, ruleReader=_batchRuleReader)
+        ruleRunner.runRules()
+        ruleRunner.generateReport(junitFileName)
+
+        for testCase in ruleRunner.retrieveTestCases():
+            if testCase.failure_message:
+                failures += 1
+            if testCase.error_message:
+                warnings += 1
+    except Exception as exception:
+        logger.error("Package '%s' cannot be checked", packagePath)
+        logger.error(exception)
+        errorMessage = str(exception)
+
+    return packagePath, junitFileName, failures, warnings, time.time() - start, errorMessage
+
+
+class PackageBatch(object):
+    """
+    The PackageBatch class checks a batch of Assembled Packages (e.g. every historical package after a rule change)
+    in one process instead of one CheckTeradataPackage run per package.
+
+    The rules (and the Teradata Keywords, see loadKeywordIndex()) are read once per worker process and shared by every
+    package the worker checks. The packages are checked concurrently by a bounded pool of worker processes (jobs) and
+    each package is evaluated one artifact at a time (see RuleRunner streaming) so no package-level state is kept in
+    the (shared) When.data lists.
+
+    A JUnit Report is written for each package (see retrieveJunitFileName()) along with a summary JUnit Report that
+    has a test case for each package.
+    """
+
+    def __init__(self, packagePaths, rulesFileName = 'resources/teradataQualityCheckRules.xml', jobs = 1,
+                 inMemory = False, selective = False):
+        """
+        Constructor.
+
+        :param packagePaths: A list of paths of Assembled Packages.
+        :param rulesFileName: The relative (project root) path to the rules (XML) file.
+        :param jobs: The number of packages checked at the same time (1 = check the packages in this process).
+        :param inMemory: Set to True to read each package straight from the tarball (see TarballPackage).
+        :param selective: Set to True to only extract the members the rules can reach (see ExtractionPlan).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: PackageBatch(%d packages, %s, %s)", len(packagePaths), rulesFileName, jobs)
+
+        self._packagePaths = list(packagePaths)
+        self._rulesFileName = rulesFileName
+        self._jobs = max(1, jobs)
+        self._inMemory = inMemory
+        self._selective = selective
+
+    # PUBLIC METHODS #
+
+    def runChecks(self, outputDirectory, summaryFileName):
+        """
+        Check every package of the batch, write a JUnit Report for each package and a summary JUnit Report.
+
+        :param outputDirectory: The path of the directory for the JUnit Report of each package.
+        :param summaryFileName: The file path of the summary JUnit Report.
+        :returns: A list (in batch order) of the result of each package (see _checkPackageInBatch())
+        """
+        self.logger.debug("Call: runChecks(%s, %s)", outputDirectory, summaryFileName)
+
+        packageChecks = [(packagePath, retrieveJunitFileName(outputDirectory, packagePath))
+                         for packagePath in self._packagePaths]
+
+        if self._jobs == 1 or len(packageChecks) < 2:
+            _initialiseBatchWorker(self._rulesFileName, self._inMemory, self._selective)
+            results = [_checkPackageInBatch(packageCheck) for packageCheck in packageChecks]
+        else:
+            pool = multiprocessing.Pool(min(self._jobs, len(packageChecks)), _initialiseBatchWorker,
+                                        (self._rulesFileName, self._inMemory, self._selective))
+            try:
+                # One package at a time (the packages are big and the pool is bounded)
+                results = pool.map(_checkPackageInBatch, packageChecks, 1)
+            finally:
+                pool.close()
+                pool.join()
+
+        self._generateSummaryReport(results, summaryFileName)
+
+        return results
+
+    # PRIVATE METHODS #
+
+    def _generateSummaryReport(self, results, summaryFileName):
+
+        testSuite = TestSuite("Teradata Package Batch Check")
+        for packagePath, junitFileName, failures, warnings, elapsedSeconds, errorMessage in results:
+            testCase = TestCase(os.path.basename(packagePath), packagePath, elapsedSeconds)
+            if errorMessage is not None:
+                testCase.failure_message = "Package cannot be checked: %s" % errorMessage
+            else:
+                if failures > 0:
+                    testCase.failure_message = "%d artifact(s) failed (see %s)" % (failures, junitFileName)
+                if warnings > 0:
+                    testCase.error_message = "%d artifact(s) have warnings (see %s)" % (warnings, junitFileName)
+                testCase.stdout = junitFileName
+            testSuite.test_cases.append(testCase)
+
+        with open(summaryFileName, "w") as summaryFile:
+            TestSuite.to_file(summaryFile, [testSuite])
+
+        self.logger.info("Batch of %d packages checked (summary in '%s')", len(results), summaryFileName)
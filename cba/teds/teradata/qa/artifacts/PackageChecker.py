@@ -0,0 +1,119 @@
+import cba.teds.utils.Logger
+import os
+import threading
+
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.TarballPackage import TarballPackage
+from cba.teds.teradata.qa.rules.ExtractionPlan import ExtractionPlan
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.teradata.qa.rules.RuleSetCache import loadRuleSet
+
+
+class PackageChecker(object):
+    """
+    The PackageChecker class keeps everything that is needed to check a package warm (for a long-running process e.g.
+    cba.teds.CheckTeradataPackageDaemon) so that each check only pays for the package itself:
+
+    - The rules are read once and read again only when the modification time of the rules file changes.
+    - The Teradata Keywords are loaded once per process (see loadKeywordIndex()).
+    - The findings for each artifact can be kept in a ResultCache (see cacheDirectory).
+
+    A check can be run against an Assembled Package (tarball) or a directory that a package was already extracted
+    to. Checks can be run at the same time (e.g. by the threads of a server) because every package is evaluated one
+    artifact at a time (see RuleRunner streaming) and nothing is collected in the (shared) When.data lists.
+    """
+
+    def __init__(self, rulesFileName = 'resources/teradataQualityCheckRules.xml', cacheDirectory = None,
+                 inMemory = False, selective = False):
+        """
+        Constructor.
+
+        :param rulesFileName: The relative (project root) path to the rules (XML) file.
+        :param cacheDirectory: The path of a directory for a ResultCache (None = don't cache the findings).
+        :param inMemory: Set to True to read a package straight from the tarball (see TarballPackage).
+        :param selective: Set to True to only extract the members the rules can reach (see ExtractionPlan).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: PackageChecker(%s, %s)", rulesFileName, cacheDirectory)
+
+        self._rulesFileName = rulesFileName
+        self._cacheDirectory = cacheDirectory
+        self._inMemory = inMemory
+        self._selective = selective
+
+        self._lock = threading.Lock()
+        self._ruleReader = None
+        self._extractionPlan = None
+        self._rulesModifiedTime = None
+
+        self._rulesReads = 0
+        self._checks = 0
+
+        # Read the Rules Up Front (so the first check is as fast as the rest)
+        self._retrieveRules()
+
+    # PUBLIC METHODS #
+
+    def checkPackage(self, packagePath):
+        """
+        Check an Assembled Package (or a directory a package was extracted to).
+
+        :param packagePath: The path of the Assembled Package (or directory).
+        :returns: The RuleRunner that ran the checks (see RuleRunner.generateReportXml() and retrieveTestCases()).
+        """
+        self.logger.debug("Call: checkPackage(%s)", packagePath)
+
+        ruleReader, extractionPlan = self._retrieveRules()
+
+        packageDirectory, packageFileName = os.path.split(os.path.normpath(packagePath))
+        if os.path.isdir(packagePath):
+            # Nothing is extracted (or deleted)
+            assembledPackage = AssembledPackage(packageDirectory, packageFileName, extractionDirectory=packageFileName)
+        elif self._inMemory:
+            assembledPackage = TarballPackage(packageDirectory, packageFileName, extractionPlan)
+        else:
+            assembledPackage = AssembledPackage(packageDirectory, packageFileName, extractionPlan=extractionPlan)
+
+        ruleRunner = RuleRunner(self._rulesFileName, assembledPackage, streaming=True,
+                                cacheDirectory=self._cacheDirectory, ruleReader=ruleReader)
+        ruleRunner.runRules()
+
+        with self._lock:
+            self._checks += 1
+
+        return ruleRunner
+
+    def retrieveStatus(self):
+        """
+        Returns a map that describes the state of the checker (e.g. for a status request).
+        """
+        self.logger.debug("Call: retrieveStatus()")
+
+        with self._lock:
+            return {"rulesFile": self._rulesFileName,
+                    "rulesModifiedTime": self._rulesModifiedTime,
+                    "rulesReads": self._rulesReads,
+                    "checks": self._checks,
+                    "cacheDirectory": self._cacheDirectory}
+
+    # PRIVATE METHODS #
+
+    def _retrieveRules(self):
+        """
+        Returns the RuleReader (and ExtractionPlan) for the rules file, reading the rules file again if it has been
+        modified since it was last read.
+        """
+        with self._lock:
+            rulesModifiedTime = os.path.getmtime(self._rulesFileName)
+            if self._ruleReader is None or rulesModifiedTime != self._rulesModifiedTime:
+                self.logger.info("Reading Rules from '%s'", self._rulesFileName)
+                self._ruleReader = loadRuleSet(self._rulesFileName)
+                self._extractionPlan = ExtractionPlan(self._rulesFileName) if self._selective else None
+                self._rulesModifiedTime = rulesModifiedTime
+                self._rulesReads += 1
+
+            return self._ruleReader, self._extractionPlan
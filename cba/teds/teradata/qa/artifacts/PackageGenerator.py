@@ -0,0 +1,278 @@
+import cba.teds.utils.Logger
+import io
+import os
+import random
+import tarfile
+import time
+
+
+# Column Definitions (Name Suffix, Type, Compression) for the generated (business) columns
+_COLUMN_TYPES = [
+    ("_HK", "CHAR(32) CHARACTER SET LATIN NOT CASESPECIFIC", "NOT NULL COMPRESS '696B031073E74BF2CB98E5EF201D4AA3'"),
+    ("_BK", "VARCHAR(255) CHARACTER SET LATIN NOT CASESPECIFIC", "NOT NULL COMPRESS ('UNKNOWN','NOT APPLICABLE')"),
+    ("_D", "DATE FORMAT 'YYYY-MM-DD'", "COMPRESS"),
+    ("_A", "DECIMAL(23,5)", "COMPRESS 0.00000"),
+    ("_C", "CHAR(10) CHARACTER SET LATIN NOT CASESPECIFIC", "COMPRESS ('GDW-MS    ','GDW2-CCS  ')"),
+]
+
+_COLUMN_WORDS = ["ACCT", "CUST", "DEPT", "EMPL", "PDCT", "BALN", "CLSE", "OPEN", "NET", "AVRG", "MNLY", "GRUP", "ARRS",
+                 "CNCY", "LOCN", "SRCE", "SYST", "CYCL", "POIT", "IDNN", "PRIM", "LEND", "CARD", "FNCL", "ACTV"]
+
+_SUBJECT_AREAS = ["BAL_001", "INP_001", "OUT_001", "TXM_001"]
+
+# The (good) Technical Control Framework Columns that every generated table ends with
+_TCF_COLUMNS = [
+    "EFFT_D DATE FORMAT 'YYYY-MM-DD' TITLE 'Effective Date',",
+    "EXPY_D DATE FORMAT 'YYYY-MM-DD' TITLE 'Expiry date' DEFAULT DATE '9999-12-31' COMPRESS (DATE '9999-12-31'),",
+    "RECORD_DELETED_FLAG BYTEINT TITLE 'Record Deleted Flag' COMPRESS (0 ,1 ),",
+    "CTL_ID SMALLINT TITLE 'Control Id' COMPRESS (69 ,92 ,103 ),",
+    "PROCESS_NAME CHAR(30) CHARACTER SET LATIN NOT CASESPECIFIC TITLE 'Process Name' COMPRESS ('TX_69_1_F_ACCT_BALN_MNLY'),",
+    "PROCESS_ID INTEGER TITLE 'Process Id',",
+    "UPDATE_PROCESS_NAME CHAR(30) CHARACTER SET LATIN NOT CASESPECIFIC TITLE 'Update Process Name' COMPRESS ,",
+    "UPDATE_PROCESS_ID INTEGER TITLE 'Update Process Id' COMPRESS ,",
+    "EFFT_TS TIMESTAMP(6) FORMAT 'YYYY-MM-DDBHH:MI:SSDS(6)' TITLE 'Effective Timestamp' COMPRESS ,",
+    "EXPY_TS TIMESTAMP(6) FORMAT 'YYYY-MM-DDBHH:MI:SSDS(6)' TITLE 'Expiry Timestamp' COMPRESS (TIMESTAMP '9999-12-31 22:22:22.112233'),",
+]
+
+# The faults that can be injected into a generated table (each one breaks one of the rules in the rules file)
+FAULT_TYPES = ["RECORD_DELETED_FLAG", "MULTISET", "KEYWORD", "DATABASE_NAME", "LOCKING_ROW", "COMMENT"]
+
+
+class PackageGenerator(object):
+    """
+    The PackageGenerator class generates synthetic (but realistic) Assembled Packages at a configurable scale e.g. for
+    benchmarks (see cba.teds.BenchmarkTeradataPackage) or unit tests.
+
+    A package has N tables of M (business) columns plus the TCF columns, and for each table a table comment, a view,
+    a view comment, a backup, and rollback scripts. It also has a Version.txt. The layout of the files is the same as
+    resources/test/goodPackage.
+
+    Faults (see FAULT_TYPES) are injected into a fraction (faultRate) of the tables so the rules produce findings. The
+    same seed always generates the same package.
+    """
+
+    def __init__(self, tables=10, columns=20, faultRate=0.0, changeRequestNumber="C1234567", release="2.123",
+                 seed=0):
+        """
+        Constructor.
+
+        :param tables: The number of tables (N).
+        :param columns: The number of (business) columns per table (M).
+        :param faultRate: The fraction (0.0 to 1.0) of the tables that have an injected fault.
+        :param changeRequestNumber: The Change Request Number (for Version.txt and the comments).
+        :param release: The release (for Version.txt and the backup scripts).
+        :param seed: The seed of the random number generator.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: PackageGenerator(%s, %s, %s)", tables, columns, faultRate)
+
+        self._tables = tables
+        self._columns = columns
+        self._faultRate = faultRate
+        self._changeRequestNumber = changeRequestNumber
+        self._release = release
+        self._seed = seed
+
+        self.faults = None # map of table name to fault type (see generateFiles())
+
+    # PUBLIC METHODS #
+
+    def generateFiles(self):
+        """
+        Generate the files of the package (in memory).
+
+        :returns: A list of (relative File Path, content (String)) e.g. ("TERADATA/RELEASE/BICD/2.123/Version.txt", "...")
+        """
+        self.logger.debug("Call: generateFiles()")
+
+        randomGenerator = random.Random(self._seed)
+
+        files = []
+        self.faults = {}
+
+        backupTableLines = ["------------------------------------------------------------",
+                            "-- BACKUP TABLES",
+                            "------------------------------------------------------------"]
+        backupCommentLines = ["------------------------------------------------------------",
+                              "-- APPLY COMMENTS",
+                              "------------------------------------------------------------"]
+        backupViewLines = []
+        rollbackTableLines = []
+        rollbackViewLines = []
+
+        for tableIndex in range(self._tables):
+            subjectArea = _SUBJECT_AREAS[tableIndex % len(_SUBJECT_AREAS)]
+            tableDatabase = "P_D_%s_STD_0" % subjectArea
+            viewDatabase = "P_V_%s_STD_0" % subjectArea
+            tableName = "FACT_%s_%05d" % ("_".join(randomGenerator.sample(_COLUMN_WORDS, 2)), tableIndex)
+
+            fault = None
+            if randomGenerator.random() < self._faultRate:
+                fault = FAULT_TYPES[randomGenerator.randrange(len(FAULT_TYPES))]
+                self.faults[tableName] = fault
+
+            columnNames = self._generateColumnNames(randomGenerator)
+
+            tableDirectory = "TERADATA/P_D_%s/%s/" % (subjectArea, tableDatabase)
+            viewDirectory = "TERADATA/P_V_%s/%s/" % (subjectArea, viewDatabase)
+
+            files.append((tableDirectory + "%s.%s.tbl" % (tableDatabase, tableName),
+                          self._generateTable(randomGenerator, tableDatabase, tableName, columnNames, fault)))
+            files.append((tableDirectory + "%s.%s.cmt" % (tableDatabase, tableName),
+                          self._generateComment(tableDatabase, tableName, "Table", fault)))
+            files.append((viewDirectory + "%s.%s.viw" % (viewDatabase, tableName),
+                          self._generateView(viewDatabase, tableDatabase, tableName, columnNames, fault)))
+            files.append((viewDirectory + "%s.%s.cmt" % (viewDatabase, tableName),
+                          self._generateComment(viewDatabase, tableName, "STD View", None)))
+
+            backupTableName = "%s_%s" % (tableName[:20], self._changeRequestNumber)
+            backupTableLines.append("CREATE MULTISET TABLE PDDBABKP.%s AS %s.%s WITH DATA AND STATS;"
+                                    % (backupTableName, tableDatabase, tableName))
+            backupCommentLines.append("COMMENT ON TABLE PDDBABKP.%s IS '%s:To be dropped on 30-June-2015 - TEDS Team. Table origin %s.%s';"
+                                      % (backupTableName, self._changeRequestNumber, tableDatabase, tableName))
+            backupViewLines.append("SHOW VIEW %s.%s;" % (viewDatabase, tableName))
+            rollbackTableLines.append("DROP TABLE %s.%s;" % (tableDatabase, tableName))
+            rollbackViewLines.append("DROP VIEW %s.%s;" % (viewDatabase, tableName))
+
+        releaseName = "10_R%s" % self._release
+        files.append(("DBAI/AUTO_BACKUP/Auto_Backup_Tables/%s_Backup_Tables.sql" % releaseName,
+                      "\n".join(backupTableLines + [""] + backupCommentLines) + "\n"))
+        files.append(("DBAI/AUTO_BACKUP/Auto_Backup_Views/%s_Backup_Views.sql" % releaseName,
+                      "\n".join(backupViewLines) + "\n"))
+        files.append(("DBAI/AUTO_ROLLBACK/ROLLBACK_DROP_TABLES/Rollback_Drop_Tables.sql",
+                      "\n".join(rollbackTableLines) + "\n"))
+        files.append(("DBAI/AUTO_ROLLBACK/ROLLBACK_DROP_NEW_VIEWS/Rollback_Drop_Views.sql",
+                      "\n".join(rollbackViewLines) + "\n"))
+        files.append(("TERADATA/RELEASE/BICD/%s/Version.txt" % self._release, self._generateVersion()))
+
+        return files
+
+    def generateDirectory(self, packageDirectory, extractionDirectory):
+        """
+        Generate the package as an (already extracted) directory e.g. for AssembledPackage(packageDirectory,
+        "ALREADY_EXTRACTED", extractionDirectory).
+
+        :param packageDirectory: The path of the directory that will contain the package.
+        :param extractionDirectory: The name of the package directory.
+        :returns: The number of files generated.
+        """
+        self.logger.debug("Call: generateDirectory(%s, %s)", packageDirectory, extractionDirectory)
+
+        files = self.generateFiles()
+        for filePath, content in files:
+            fullPath = os.path.join(packageDirectory, extractionDirectory, filePath)
+            if not os.path.exists(os.path.dirname(fullPath)):
+                os.makedirs(os.path.dirname(fullPath))
+            with open(fullPath, "w") as file:
+                file.write(content)
+
+        return len(files)
+
+    def generateTarball(self, packageDirectory, packageFileName):
+        """
+        Generate the package as a tarball e.g. for AssembledPackage(packageDirectory, packageFileName).
+
+        :param packageDirectory: The path of the directory that will contain the package.
+        :param packageFileName: The file name of the package (e.g. synthetic_assembled_package.tgz).
+        :returns: The number of files generated.
+        """
+        self.logger.debug("Call: generateTarball(%s, %s)", packageDirectory, packageFileName)
+
+        if not os.path.exists(packageDirectory):
+            os.makedirs(packageDirectory)
+
+        files = self.generateFiles()
+        modificationTime = time.time()
+        with tarfile.open(os.path.join(packageDirectory, packageFileName), mode="w:gz") as tarFile:
+            for filePath, content in files:
+                contentBytes = content.encode("utf-8")
+                tarInfo = tarfile.TarInfo(filePath)
+                tarInfo.size = len(contentBytes)
+                tarInfo.mtime = modificationTime
+                tarFile.addfile(tarInfo, io.BytesIO(contentBytes))
+
+        return len(files)
+
+    # PRIVATE METHODS #
+
+    def _generateColumnNames(self, randomGenerator):
+        columnNames = []
+        for columnIndex in range(self._columns):
+            suffix = _COLUMN_TYPES[columnIndex % len(_COLUMN_TYPES)][0]
+            columnNames.append("%s_%d%s" % ("_".join(randomGenerator.sample(_COLUMN_WORDS, 3)), columnIndex, suffix))
+        return columnNames
+
+    def _generateTable(self, randomGenerator, tableDatabase, tableName, columnNames, fault):
+        lines = []
+
+        tableKind = "SET" if fault == "MULTISET" else "MULTISET"
+        lines.append("CREATE %s TABLE %s.%s ,NO FALLBACK ," % (tableKind, tableDatabase, tableName))
+        lines.append("     NO BEFORE JOURNAL,")
+        lines.append("     NO AFTER JOURNAL,")
+        lines.append("     DATABLOCKSIZE = 262144 BYTES, CHECKSUM = DEFAULT,")
+        lines.append("     DEFAULT MERGEBLOCKRATIO")
+        lines.append("     (")
+
+        for columnIndex, columnName in enumerate(columnNames):
+            suffix, columnType, compression = _COLUMN_TYPES[columnIndex % len(_COLUMN_TYPES)]
+            title = " ".join(word.capitalize() for word in columnName.split("_")[:3])
+            lines.append("      %s %s TITLE '%s' %s," % (columnName, columnType, title, compression))
+
+        if fault == "KEYWORD":
+            lines.append("      DATE DATE FORMAT 'YYYY-MM-DD' TITLE 'Date',")
+        if fault == "DATABASE_NAME":
+            lines.append("      SRCE_TABLE_N VARCHAR(255) TITLE 'Source Table Name' DEFAULT ' T_D01_DATA',")
+
+        for tcfColumn in _TCF_COLUMNS:
+            if fault == "RECORD_DELETED_FLAG" and tcfColumn.startswith("RECORD_DELETED_FLAG"):
+                tcfColumn = "RECORD_DELETED_FLAG BYTEINT TITLE 'Record Deleted Flag',"
+            lines.append("      %s" % tcfColumn)
+
+        lines.append("      RECD_ISRT_DTTM TIMESTAMP(6) TITLE 'Record Insert Date Time' DEFAULT CURRENT_TIMESTAMP(6))")
+        lines.append("PRIMARY INDEX NUPI_%s ( %s )" % (tableName, columnNames[0] if columnNames else "CTL_ID"))
+        lines.append("PARTITION BY RANGE_N(EFFT_D  BETWEEN DATE '1998-01-01' AND '2030-06-30' EACH INTERVAL '1' MONTH ,")
+        lines.append(" NO RANGE);")
+
+        return "\n".join(lines) + "\n"
+
+    def _generateView(self, viewDatabase, tableDatabase, tableName, columnNames, fault):
+        allColumnNames = columnNames + [tcfColumn.split(" ")[0] for tcfColumn in _TCF_COLUMNS] + ["RECD_ISRT_DTTM"]
+        columnList = ",\n".join("        %s" % columnName for columnName in allColumnNames)
+
+        lines = []
+        lines.append("REPLACE VIEW %s.%s" % (viewDatabase, tableName))
+        lines.append("(")
+        lines.append(columnList)
+        lines.append(")")
+        lines.append("AS" if fault == "LOCKING_ROW" else "AS LOCKING ROW FOR ACCESS ")
+        lines.append("SELECT")
+        lines.append(columnList)
+        lines.append("  FROM")
+        lines.append("        %s.%s" % (tableDatabase, tableName))
+        lines.append(" ;")
+
+        return "\n".join(lines) + "\n"
+
+    def _generateComment(self, database, tableName, objectKind, fault):
+        changeRequestNumber = "CXXXXXXX" if fault == "COMMENT" else self._changeRequestNumber
+        return "COMMENT ON %s.%s IS '%s - Business Access Layer %s: %s' ;\n" % (database, tableName,
+                                                                                changeRequestNumber, objectKind,
+                                                                                tableName)
+
+    def _generateVersion(self):
+        lines = ["###################################################################",
+                 "# This file defines version information for the current release",
+                 "#",
+                 "# CR_NUMBER is the Change ID",
+                 "# REL_MGR is the Release manager/coordinator",
+                 "# BACKUP_DATE is the date when the backedup objects can be removed",
+                 "###################################################################",
+                 "",
+                 "CR_NUMBER:%s" % self._changeRequestNumber,
+                 "REL_MGR:TEDS Team",
+                 "BACKUP_DATE:30-June-2015"]
+        return "\n".join(lines) + "\n"
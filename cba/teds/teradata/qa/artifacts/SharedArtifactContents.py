@@ -0,0 +1,96 @@
+import cba.teds.utils.Logger
+
+from multiprocessing import shared_memory
+
+
+class SharedArtifactContents(object):
+    """
+        SharedArtifactContents holds the content (bytes) of a set of in-memory artifacts (e.g. a TarballPackage) once in
+        a block of shared memory (multiprocessing.shared_memory) along with an index of File Path to (start, end)
+        offsets.
+
+        It is handed to the worker processes instead of the content itself (see RuleRunner._runRulesInParallel()).
+        Only the name of the block and the index are pickled, each worker attaches to the block (the first time an
+        artifact is retrieved) and the content of an artifact is a memoryview of the block (there is no copy).
+
+        It answers the same questions as the map of File Path to content (bytes) it was built from i.e.
+        "filePath in contents" and "contents[filePath]".
+
+        NOTE:  The process that created the block must release() it once the workers are done with it.
+    """
+
+    def __init__(self, artifactContents):
+        """
+        Constructor. The content of every artifact is copied into a new block of shared memory.
+
+        :param artifactContents: A map of File Path to content (bytes).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: SharedArtifactContents(%d artifacts)", len(artifactContents))
+
+        self._offsets = {}
+        size = 0
+        for filePath, content in artifactContents.items():
+            self._offsets[filePath] = (size, size + len(content))
+            size += len(content)
+
+        # A block of shared memory can't be empty
+        self._sharedMemory = shared_memory.SharedMemory(create=True, size=max(1, size))
+        self._name = self._sharedMemory.name
+        self._owner = True
+
+        buffer = self._sharedMemory.buf
+        for filePath, content in artifactContents.items():
+            start, end = self._offsets[filePath]
+            buffer[start:end] = content
+
+    def __getstate__(self):
+        # Only the name of the block and the index are handed to a worker process
+        return {"name": self._name, "offsets": self._offsets}
+
+    def __setstate__(self, state):
+        self.logger = cba.teds.utils.Logger.getLogger()
+        self._name = state["name"]
+        self._offsets = state["offsets"]
+        self._sharedMemory = None
+        self._owner = False
+
+    def __contains__(self, filePath):
+        return filePath in self._offsets
+
+    def __getitem__(self, filePath):
+        start, end = self._offsets[filePath]
+        return self._retrieveBuffer()[start:end]
+
+    def __len__(self):
+        return len(self._offsets)
+
+    # PUBLIC METHODS #
+
+    def retrieveName(self):
+        return self._name
+
+    def release(self):
+        """
+        Release the block of shared memory (it is unlinked if this is the process that created it).
+        """
+        self.logger.debug("Call: SharedArtifactContents.release(%s)", self._name)
+
+        if self._sharedMemory is None:
+            return
+
+        self._sharedMemory.close()
+        if self._owner:
+            self._sharedMemory.unlink()
+        self._sharedMemory = None
+
+    # PRIVATE METHODS #
+
+    def _retrieveBuffer(self):
+        if self._sharedMemory is None:
+            self._sharedMemory = shared_memory.SharedMemory(name=self._name)
+        return self._sharedMemory.buf
@@ -0,0 +1,137 @@
+import cba.teds.utils.Logger
+import io
+import tarfile
+
+from collections import OrderedDict
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import ArtifactIndex
+from cba.teds.teradata.qa.artifacts.ArtifactSniffer import ArtifactSniffer
+from cba.teds.teradata.qa.artifacts.ArtifactReader import decodeArtifactBytes
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+
+
+class TarballPackage(AssembledPackage):
+    """
+        TarballPackage implements the TeradataArtifacts abstract class for an Assembled Package without extracting it.
+
+        It works by streaming the members of the specified assembled_package.tgz (once) into an in-memory index of
+        File Path to content (bytes). Nothing is written to (or deleted from) the file system.
+
+        The File Paths are built as if the package had been extracted to a (virtual) IN_MEMORY directory e.g.
+        resources/test//IN_MEMORY/TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0/P_D_BAL_001_STD_0.FACT_ACCT_BALN_MNLY.tbl so
+        everything that works with the File Paths of an AssembledPackage (filters, reports etc.) works the same way.
+
+        If an ExtractionPlan is specified only the members that the rules can reach are read into memory (the other
+        members are still listed).
+    """
+
+    IN_MEMORY_DIRECTORY = "IN_MEMORY"
+
+    def __init__(self, packageDirectory, packageFileName, extractionPlan=None):
+        """
+        Constructor. Everything happens in the Constructor. The members of the Package are read into memory to set up
+        everything that is exposed via the public interface.
+
+        :param packageDirectory: The relative (project root) path to the directory containing the Assembled Package.
+        :param packageFileName: The file name of the Assembled Package.
+        :param extractionPlan: An ExtractionPlan (None = read every member).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: TarballPackage(%s, %s)", packageDirectory, packageFileName)
+
+        # Copy Parameters to Local Variables
+        self._packageDirectory = packageDirectory
+        self._packageFileName = packageFileName
+        self._extractionPlan = extractionPlan
+
+        # Nothing is extracted (so there is nothing to delete)
+        self._packageExtracted = False
+        self._extractionDirectory = self.IN_MEMORY_DIRECTORY
+
+        # Read the Package (Can Throw an Exception)
+        self._artifactContents = OrderedDict() # map keyed on file path
+        self._assembledPackageFilesList = []
+        if self._readMembers() == False:
+            raise ValueError("Error Reading Assembled Package: %s" % self.name())
+
+        # Classify (and Sniff) the Files (once)
+        self._artifactIndex = ArtifactIndex(self._assembledPackageFilesList, ArtifactSniffer(),
+                                            self._artifactContents)
+
+        # Initialise the Local Variables
+        self._changeRequestNumber = None
+
+        self._createdObjects = None
+        self._deletedObjects = None
+        self._rolledBackObjects = None
+
+        self._teradataKeywords = None
+
+    def __del__(self):
+        """
+        Destructor. TarballPackage objects don't leave a footprint (there are no extracted files).
+        """
+        self.logger.debug("Destroy: TarballPackage()")
+
+    # PUBLIC METHODS #
+
+    def extractedFilesDirectory(self):
+        """
+        Returns None (the Package is not extracted).
+        """
+        self.logger.debug("Call: extractedFilesDirectory()")
+        return None
+
+    def retrieveArtifactContent(self, filePath):
+        if filePath not in self._artifactContents:
+            raise IOError("Artifact Not Found: %s" % filePath)
+        return self._artifactContents[filePath]
+
+    def retrieveArtifactText(self, filePath):
+        return decodeArtifactBytes(self.retrieveArtifactContent(filePath))
+
+    def retrieveInMemoryArtifacts(self):
+        return self._artifactContents
+
+    # PRIVATE METHODS #
+
+    def _openArtifact(self, filePath):
+        return io.StringIO(self.retrieveArtifactText(filePath))
+
+    def _readMembers(self):
+
+        readOK = False
+        listedFilePaths = set()
+
+        try:
+            # Stream the members (i.e. a single forward pass over the compressed package)
+            with tarfile.open(self._packagePath(), mode="r|*") as tarFile:
+                for member in tarFile:
+                    if not member.isfile():
+                        continue
+                    # Standardise Slashes Up Front for extractObjectNameFromFilePath()
+                    memberName = member.name.replace("\\", "/")
+                    if memberName.startswith("./"):
+                        memberName = memberName[2:]
+                    filePath = self._extractedFilesRelativeDirectory() + memberName
+                    if filePath not in listedFilePaths:
+                        listedFilePaths.add(filePath)
+                        self._assembledPackageFilesList.append(filePath)
+                    if self._extractionPlan is not None and not self._extractionPlan.requiresContent(memberName):
+                        continue
+                    memberFile = tarFile.extractfile(member)
+                    self._artifactContents[filePath] = memberFile.read()
+            readOK = True
+            self.logger.info("Package Read into Memory (%d of %d files) from '%s'", len(self._artifactContents),
+                             len(self._assembledPackageFilesList), self._packagePath())
+
+        except FileNotFoundError as fileNotFoundError:
+            self.logger.error("Package Not Found (Check Working Directory): %s", self._packagePath())
+        except tarfile.TarError as tarError:
+            self.logger.error("Package cannot be read: %s", self._packagePath())
+            self.logger.error(tarError)
+
+        return readOK
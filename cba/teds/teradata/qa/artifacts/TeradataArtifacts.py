@@ -18,6 +18,24 @@ class TeradataArtifacts(Artifacts):
         Returns a list of File Names.
         """
 
+    @abc.abstractmethod
+    def retrieveArtifactIndex(self):
+        """
+        Returns the ArtifactIndex (i.e. the kinds of each file).
+        """
+
+    @abc.abstractmethod
+    def retrieveArtifactContent(self, filePath):
+        """
+        Returns the entire content (bytes) of an artifact.
+        """
+
+    @abc.abstractmethod
+    def retrieveArtifactText(self, filePath):
+        """
+        Returns the entire content (String) of an artifact.
+        """
+
     @abc.abstractmethod
     def retrieveChangeRequestNumber(self):
         """
@@ -0,0 +1,119 @@
+import re
+
+from cba.teds.teradata.qa.rules.PatternParser import containsOpcode, splitLiteralPrefix
+from cba.teds.teradata.qa.rules.Rule import ActionType
+
+"""
+This file defines a multi-pattern matcher for the patternMatch Actions that are executed against the same When Data
+(i.e. the Actions of the Rules that share a When, see RulePlan).
+
+Rather than asking each Action (see Action.executeAction()) to search the data, the patterns of the Actions are
+compiled into one alternation (with a named group per Action) and the data is searched once. Each match tells us
+which Action matched (and the search resumes at the same position with the Actions that haven't matched yet).
+"""
+
+# The parts of a regular expression that don't survive being renumbered (or renamed) in an alternation
+_GROUP_REFERENCE_OPCODES = ("GROUPREF", "GROUPREF_EXISTS", "GROUPREF_IGNORE", "GROUPREF_LOC_IGNORE",
+                            "GROUPREF_UNI_IGNORE")
+
+
+def isCombinableAction(action):
+    """
+        Helper function to identify the Action objects that can be compiled into an ActionMatcher i.e. patternMatch
+        Actions whose pattern has no (global) inline flags, named groups or group references (and can be parsed, see
+        PatternParser).
+
+        :param action: An Action object
+        :returns: True if the Action can be compiled into an ActionMatcher
+    """
+    if action.actionType != ActionType.PatternMatch.value or action.pattern is None:
+        return False
+
+    if action.pattern.flags != re.compile("").flags or action.pattern.groupindex:
+        return False
+
+    return containsOpcode(action.actionData, _GROUP_REFERENCE_OPCODES) is False
+
+
+class ActionMatcher(object):
+    """
+    An ActionMatcher answers which of a list of patternMatch Actions (see isCombinableAction()) match some data with
+    one search of a combined pattern (an alternation with a named group per Action) rather than one search per Action.
+
+    The combined pattern finds the leftmost match of any of the Actions so an Action that hasn't matched yet can only
+    match at (or after) that position. The search resumes there with a combined pattern of the remaining Actions (the
+    combined patterns are compiled once for each set of Actions) until every Action has matched or there are no more
+    matches. The result is exactly the same as searching for each pattern on its own.
+
+    NOTE:  The required literal of an Action (see Action.literal) is checked before the data is searched.
+    """
+
+    def __init__(self, actions):
+        """
+        ActionMatcher Constructor.
+
+        :param actions: A list of Action objects (the Actions that are not combinable are ignored)
+        """
+        self.actions = []
+        for action in actions:
+            if isCombinableAction(action) and action not in self.actions:
+                self.actions.append(action)
+
+        self._patterns = {} # map keyed on the (tuple of) indexes of the actions
+
+    def match(self, data):
+        """
+        Find the Actions whose pattern is found in the data.
+
+        :param data: The data part of a When Data object (String)
+        :returns: A set of the Action objects whose pattern is found in the data
+        """
+        remaining = tuple(index for index, action in enumerate(self.actions)
+                          if action.literal is None or action.literal in data)
+
+        matchedActions = set()
+        position = 0
+        while remaining:
+            match = self._retrievePattern(remaining).search(data, position)
+            if match is None:
+                break
+
+            # The named group of an Action is the outermost group of its alternative (i.e. the last one closed)
+            index = int(match.lastgroup[1:])
+            matchedActions.add(self.actions[index])
+            remaining = tuple(remainingIndex for remainingIndex in remaining if remainingIndex != index)
+            position = match.start()
+
+        return matchedActions
+
+    # PRIVATE METHODS #
+
+    def _retrievePattern(self, indexes):
+        pattern = self._patterns.get(indexes)
+        if pattern is None:
+            pattern = re.compile(self._buildPattern(indexes))
+            self._patterns[indexes] = pattern
+        return pattern
+
+    def _buildPattern(self, indexes):
+        """
+            Build the combined pattern of a set of Actions. The literal prefix that is common to every Action (e.g.
+            "COMPRESS") is taken out of the alternation so the regular expression engine can look for it (quickly)
+            before it tries the alternatives. There is no common prefix if any of the Actions has a top-level
+            alternation (see PatternParser.splitLiteralPrefix()).
+        """
+        splitPatterns = [splitLiteralPrefix(self.actions[index].actionData) for index in indexes]
+
+        commonLength = min(len(literals) for literals, rest in splitPatterns)
+        for position in range(commonLength):
+            if len(set(literals[position][0] for literals, rest in splitPatterns)) > 1:
+                commonLength = position
+                break
+
+        alternatives = []
+        for index, (literals, rest) in zip(indexes, splitPatterns):
+            source = "".join(source for literal, source in literals[commonLength:]) + rest
+            alternatives.append("(?P<a%d>%s)" % (index, source))
+
+        commonPrefix = "".join(re.escape(literal) for literal, source in splitPatterns[0][0][:commonLength])
+        return "%s(?:%s)" % (commonPrefix, "|".join(alternatives))
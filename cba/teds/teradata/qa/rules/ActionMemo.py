@@ -0,0 +1,121 @@
+import cba.teds.utils.Logger
+
+from collections import OrderedDict
+
+
+class ActionMemo(object):
+    """
+    The ActionMemo class provides a bounded (in-memory) memo of the results of the Actions (see
+    Action.executeAction()) so that data that is seen over and over again (e.g. the same RECORD_DELETED_FLAG BYTEINT
+    line in thousands of generated tables) is only evaluated once.
+
+    Each entry is keyed (see buildKey()) on the Action (or anything else that produces a result from the data e.g. an
+    ActionMatcher), the data itself and (for an Action that depends on the package) the package-level fact that it
+    depends on (e.g. the Change Request Number). The least recently used entries are evicted when the memo holds more
+    than maxSize entries or more than maxCharacters characters of data (in total).
+
+    NOTE:  Data longer than maxDataLength (e.g. an entire SCRIPT) is not memoized (it is rarely repeated and the memo
+           would hold on to it).
+    NOTE:  The worst case (with the defaults) is 4M characters of data (4 MB of ASCII, up to 16 MB if every line has
+           a character outside Latin-1) plus about 200 bytes per entry (the key tuple, the String headers and the
+           OrderedDict entry) i.e. about 7 MB (20 MB) per process. Every worker process (see RuleRunner jobs) has a
+           memo of its own, so -j N holds up to N + 1 times that.
+    """
+
+    DEFAULT_MAX_SIZE = 16384 # entries
+    DEFAULT_MAX_CHARACTERS = 4 * 1024 * 1024 # characters (of data, in total)
+    DEFAULT_MAX_DATA_LENGTH = 4096 # characters
+
+    def __init__(self, maxSize=DEFAULT_MAX_SIZE, maxDataLength=DEFAULT_MAX_DATA_LENGTH,
+                 maxCharacters=DEFAULT_MAX_CHARACTERS):
+        """
+        Constructor.
+
+        :param maxSize: The maximum number of entries in the memo.
+        :param maxDataLength: The maximum length of the data that is memoized.
+        :param maxCharacters: The maximum length of all the data in the memo (in total).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: ActionMemo(%s, %s, %s)", maxSize, maxDataLength, maxCharacters)
+
+        self._maxSize = maxSize
+        self._maxDataLength = maxDataLength
+        self._maxCharacters = maxCharacters
+        self._entries = OrderedDict() # map keyed on key (see buildKey()) in least recently used order
+        self._characters = 0 # the length of all the data in the memo
+
+        self.hits = 0
+        self.misses = 0
+
+    # PUBLIC METHODS #
+
+    def buildKey(self, owner, data, packageFact=None):
+        """
+        Build the key for a result.
+
+        :param owner: The Action (or ActionMatcher) that produces the result.
+        :param data: The data part of a When Data object (String).
+        :param packageFact: The package-level fact (e.g. the Change Request Number) that the result depends on.
+        :returns: The key or None (if the data is not memoized).
+        """
+        if len(data) > self._maxDataLength:
+            return None
+        return (owner, packageFact, data)
+
+    def retrieveResult(self, key):
+        """
+        Retrieve the result for a key (and count a hit or a miss).
+
+        :param key: A key (see buildKey()).
+        :returns: The result or None (if there isn't an entry for the key).
+        """
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def storeResult(self, key, result):
+        """
+        Store the result for a key (evicting the least recently used entries if the memo is full).
+
+        :param key: A key (see buildKey()).
+        :param result: The result (anything but None).
+        """
+        if key not in self._entries:
+            self._characters += len(key[2])
+        self._entries[key] = result
+        while len(self._entries) > self._maxSize or (self._characters > self._maxCharacters and
+                                                     len(self._entries) > 1):
+            evictedKey, evictedResult = self._entries.popitem(last=False)
+            self._characters -= len(evictedKey[2])
+
+    def recordHits(self, hits, misses):
+        """
+        Record the hits and misses of another ActionMemo object (e.g. in a worker process).
+        """
+        self.hits += hits
+        self.misses += misses
+
+    def drainHits(self):
+        """
+        Returns the hits and misses since the last drain (and resets them).
+        """
+        drained = (self.hits, self.misses)
+        self.hits = 0
+        self.misses = 0
+        return drained
+
+    def hitRate(self):
+        lookups = self.hits + self.misses
+        return (100.0 * self.hits / lookups) if lookups > 0 else 0.0
+
+    def logHitRate(self):
+        self.logger.info("Action Memo: %d hits, %d misses (%.1f%% hit rate)", self.hits, self.misses, self.hitRate())
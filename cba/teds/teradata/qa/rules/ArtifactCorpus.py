@@ -0,0 +1,139 @@
+import bisect
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from cba.teds.teradata.qa.rules.PatternParser import containsOpcode
+from cba.teds.teradata.qa.rules.Rule import WhenData, WhenScope, WhenType
+
+"""
+This file defines a corpus of artifacts i.e. the content of a group of artifacts (e.g. every CREATE_TABLE artifact)
+in one contiguous buffer, so that a LINE When (a regular expression) is searched for across the whole group by the
+regular expression engine (in C) instead of line by line (in Python).
+"""
+
+# The parts of a regular expression that depend on what surrounds a match (so a match in the corpus might not be a
+# match in the line or the other way around)
+_CONTEXT_OPCODES = ("AT", "ASSERT", "ASSERT_NOT", "ATOMIC_GROUP", "POSSESSIVE_REPEAT", "GROUPREF_EXISTS")
+
+
+def isCorpusWhen(when):
+    """
+        Helper function to identify the When objects that can be searched for in an ArtifactCorpus i.e. LINE
+        MATCHES_PATTERN Whens whose pattern doesn't depend on what surrounds a match (no anchors, lookarounds, atomic
+        groups or possessive repeats). A pattern that can't be parsed (see PatternParser) is searched for line by line.
+
+        :param when: A When object
+        :returns: True if the When can be searched for in an ArtifactCorpus
+    """
+    if when.type != WhenType.MatchesPattern.value or when.scope != WhenScope.Line.value:
+        return False
+
+    return containsOpcode(when.value, _CONTEXT_OPCODES) is False
+
+
+class ArtifactCorpus(object):
+    """
+    An ArtifactCorpus holds the content of a group of artifacts in one contiguous buffer along with the offset that
+    each artifact starts at.
+
+    A When is searched for across the buffer (see findWhenData()). Each match is mapped back to its artifact (with
+    searchsorted() if NumPy is installed, otherwise bisect) and to its line (with find() and rfind() on the buffer),
+    and the line is confirmed with When.isConditionMatched() so the result is exactly the same as evaluating the
+    When line by line. The search then resumes at the next line (a line is only matched once).
+
+    NOTE:  The artifacts are separated by a newline (if they don't end with one) so a line never spans two artifacts.
+           The newline is not part of the WhenData (the same as the last line of the artifact).
+    """
+
+    def __init__(self):
+        """
+        ArtifactCorpus Constructor.
+        """
+        self._parts = []
+        self._filePaths = []
+        self._fileStarts = []
+        self._addedNewlines = set() # offsets of the newlines that separate the artifacts
+        self._length = 0
+
+        self.buffer = None
+
+    # PUBLIC METHODS #
+
+    def appendArtifact(self, filePath, text):
+        """
+        Append the content of an artifact to the corpus.
+
+        :param filePath: The Artifact Name (i.e. a File Path for Assembled Package Checks)
+        :param text: The content of the artifact (String)
+        """
+        if len(text) == 0:
+            return
+
+        if not text.endswith("\n"):
+            self._addedNewlines.add(self._length + len(text))
+            text += "\n"
+
+        self._filePaths.append(filePath)
+        self._fileStarts.append(self._length)
+        self._parts.append(text)
+        self._length += len(text)
+        self.buffer = None
+
+    def retrieveArtifactCount(self):
+        return len(self._filePaths)
+
+    def retrieveLineCount(self):
+        return self._retrieveBuffer().count("\n")
+
+    def findWhenData(self, when):
+        """
+        Find the lines (of every artifact in the corpus) that match a When (see isCorpusWhen()).
+
+        :param when: A When object
+        :returns: A list of WhenData objects (in artifact and line order, each one is a span of the buffer)
+        """
+        buffer = self._retrieveBuffer()
+
+        # Nothing in the corpus can match without the required literal (see When.literal)
+        if when.literal is not None and when.literal not in buffer:
+            return []
+
+        lineSpans = []
+        search = when.pattern.search
+        position = 0
+        match = search(buffer, position)
+        while match is not None:
+            start = buffer.rfind("\n", 0, match.start()) + 1
+            end = buffer.find("\n", match.start()) + 1
+            position = end
+            if end - 1 in self._addedNewlines:
+                end -= 1
+            if when.isConditionMatched(buffer[start:end]):
+                lineSpans.append((start, end))
+            match = search(buffer, position)
+
+        fileIndexes = self._retrieveFileIndexes([start for start, end in lineSpans])
+
+        return [WhenData(self._filePaths[fileIndex], buffer, start, end)
+                for fileIndex, (start, end) in zip(fileIndexes, lineSpans)]
+
+    # PRIVATE METHODS #
+
+    def _retrieveBuffer(self):
+        if self.buffer is None:
+            self.buffer = "".join(self._parts)
+            self._parts = [self.buffer]
+        return self.buffer
+
+    def _retrieveFileIndexes(self, offsets):
+        """
+        Map each offset (in the buffer) to the index of the artifact that contains it.
+        """
+        if numpy is not None and len(offsets) > 0:
+            fileStarts = numpy.asarray(self._fileStarts, dtype=numpy.int64)
+            return (numpy.searchsorted(fileStarts, numpy.asarray(offsets, dtype=numpy.int64), side="right") - 1).tolist()
+
+        return [bisect.bisect_right(self._fileStarts, offset) - 1 for offset in offsets]
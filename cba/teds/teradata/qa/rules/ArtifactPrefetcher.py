@@ -0,0 +1,113 @@
+import cba.teds.utils.Logger
+import queue
+import threading
+import time
+
+
+class ArtifactPrefetcher(object):
+    """
+    An ArtifactPrefetcher reads the upcoming artifacts of a list in one or more background (reader) threads so that
+    reading an artifact (e.g. from a slow disk or NFS) overlaps with evaluating the rules against the previous one.
+
+    Each reader thread reads every n-th artifact (of n readers) into its own bounded queue so the artifacts are
+    handed back in the same order as the list and no more than depth artifacts are held in memory at once (the
+    readers wait for the evaluator when the queues are full).
+
+    Usage:
+
+    1.  Constructor - Starts the reader threads.
+
+    2.  retrieveNextArtifact() - Waits for (and returns) the next artifact of the list.
+
+    3.  close() - Stops the reader threads (e.g. if not every artifact is retrieved).
+
+    NOTE:  The time spent waiting for the readers (i.e. the evaluator is idle while an artifact is read) is recorded in
+           waitTime.
+    """
+
+    def __init__(self, filePaths, readArtifact, depth = 8, readers = 1):
+        """
+        ArtifactPrefetcher Constructor.
+
+        :param filePaths: The list of Artifact Names (i.e. File Paths for Assembled Package Checks).
+        :param readArtifact: The function that reads an artifact (from its File Path) in a reader thread.
+        :param depth: The maximum number of artifacts that are read ahead of the evaluator.
+        :param readers: The number of reader threads.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: ArtifactPrefetcher(%d artifacts, depth = %d, readers = %d)", len(filePaths), depth,
+                          readers)
+
+        self._filePaths = filePaths
+        self._readArtifact = readArtifact
+        self._readers = max(1, min(readers, depth, len(filePaths) or 1))
+        self._queues = [queue.Queue(max(1, depth // self._readers)) for reader in range(self._readers)]
+        self._stopped = threading.Event()
+        self._position = 0
+
+        self.waitTime = 0.0
+
+        self._threads = []
+        for reader in range(self._readers):
+            thread = threading.Thread(target=self._readArtifacts, args=(reader,),
+                                      name="ArtifactPrefetcher-%d" % reader, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # PUBLIC METHODS #
+
+    def retrieveNextArtifact(self):
+        """
+        Wait for (and return) the next artifact of the list.
+
+        :returns: A tuple of the File Path and the result of readArtifact() (or None if it raised an exception)
+        """
+        if self._position >= len(self._filePaths):
+            raise IndexError("No More Artifacts")
+
+        started = time.perf_counter()
+        filePath, artifact = self._queues[self._position % self._readers].get()
+        self.waitTime += time.perf_counter() - started
+
+        self._position += 1
+        return filePath, artifact
+
+    def close(self):
+        """
+        Stop the reader threads (and discard the artifacts that have been read but not retrieved).
+        """
+        self.logger.debug("Call: ArtifactPrefetcher.close()")
+
+        self._stopped.set()
+        for reader, thread in enumerate(self._threads):
+            while thread.is_alive():
+                # A reader might be waiting for room in its queue
+                self._drainQueue(self._queues[reader])
+                thread.join(0.01)
+            self._drainQueue(self._queues[reader])
+
+    # PRIVATE METHODS #
+
+    def _readArtifacts(self, reader):
+        for position in range(reader, len(self._filePaths), self._readers):
+            if self._stopped.is_set():
+                return
+
+            filePath = self._filePaths[position]
+            try:
+                artifact = self._readArtifact(filePath)
+            except Exception:
+                # The evaluator reads (and reports) the artifact itself
+                artifact = None
+            self._queues[reader].put((filePath, artifact))
+
+    def _drainQueue(self, artifactQueue):
+        try:
+            while True:
+                artifactQueue.get_nowait()
+        except queue.Empty:
+            pass
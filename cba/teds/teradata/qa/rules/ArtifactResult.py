@@ -0,0 +1,64 @@
+MESSAGE_SEPARATOR = " _BR_ "
+
+
+class ArtifactResult(object):
+    """
+    The ArtifactResult class holds the results (findings) of the checks for one artifact i.e. one test case of the
+    JUnit Report (see JunitReportWriter).
+
+    (Our World -> Test Case World)
+    Failure -> Failure
+    Warning -> Error
+    Information ->  StdOut
+
+    The messages are kept in lists (an artifact can have thousands of findings) and only joined (with _BR_, see the
+    XSLT) when they are read. failure_message, error_message and stdout have the same names (and values) as the
+    attributes of a junit_xml TestCase.
+    """
+
+    def __init__(self, name, classname=None):
+        """
+        Constructor.
+
+        :param name: The name of the test case (i.e. the shortened artifact name).
+        :param classname: The class name of the test case.
+        """
+        self.name = name
+        self.classname = classname
+
+        self.failureMessages = []
+        self.warningMessages = []
+        self.informationMessages = []
+
+    # PUBLIC METHODS #
+
+    def recordFailure(self, failureMessage):
+        self._recordMessage(self.failureMessages, failureMessage)
+
+    def recordWarning(self, warningMessage):
+        self._recordMessage(self.warningMessages, warningMessage)
+
+    def recordInformation(self, informationMessage):
+        self._recordMessage(self.informationMessages, informationMessage)
+
+    @property
+    def failure_message(self):
+        return self._joinMessages(self.failureMessages)
+
+    @property
+    def error_message(self):
+        return self._joinMessages(self.warningMessages)
+
+    @property
+    def stdout(self):
+        return self._joinMessages(self.informationMessages)
+
+    # PRIVATE METHODS #
+
+    def _recordMessage(self, messages, message):
+        # An empty first message is not recorded (the same as a junit_xml TestCase)
+        if message or messages:
+            messages.append(message)
+
+    def _joinMessages(self, messages):
+        return MESSAGE_SEPARATOR.join(messages) if messages else None
@@ -0,0 +1,77 @@
+import cba.teds.utils.Logger
+
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import ArtifactKind, classifyArtifact
+from cba.teds.teradata.qa.rules.Rule import WhenFilter, WhenScope
+from cba.teds.teradata.qa.rules.RulePlan import RulePlan
+from cba.teds.teradata.qa.rules.RuleSetCache import loadRuleSet
+from cba.teds.teradata.qa.rules.RuleRunner import retrieveFilterTypesForArtifactKinds
+
+
+class ExtractionPlan(object):
+    """
+    The ExtractionPlan class works out (from a rules file) which members of an Assembled Package have to be extracted
+    (or read) for the rules to be run, so that an AssembledPackage (or a TarballPackage) can skip the rest.
+
+    The content of a member is required if:
+
+    - It is read by the package-level checks i.e. the Version File (Change Request Number) and the drop, rollback and
+      backup scripts (the object counts).
+    - One of its filter groups (see RuleRunner._retrieveFilterGroupsForArtifact()) has a LINE or SCRIPT When that is
+      referenced by a rule (see RulePlan).
+
+    Archives (.gz/.tar) are never scanned so they are never required. The other members are still listed by the
+    package (FILE_PATH Whens and the created object counts only need the File Path) but their content is not
+    extracted.
+    """
+
+    # The kinds of artifact read by the package-level checks (see AssembledPackage)
+    PACKAGE_ARTIFACT_KINDS = (ArtifactKind.Version, ArtifactKind.DropTables, ArtifactKind.DropViews,
+                              ArtifactKind.RollbackDropTables, ArtifactKind.RollbackDropViews, ArtifactKind.BackupViews)
+
+    def __init__(self, rulesFile):
+        """
+        Constructor.
+
+        :param rulesFile: The relative (project root) path to the rules (XML) file.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: ExtractionPlan(%s)", rulesFile)
+
+        ruleReader = loadRuleSet(rulesFile)
+
+        # The filters (WhenFilter values) that have a When that reads the content of an artifact
+        self._contentFilters = set()
+        rulePlan = RulePlan(ruleReader.retrieveListOfWhenConditions(), ruleReader.retrieveListOfRules())
+        for when in rulePlan.retrieveWhens().values():
+            if when.scope in (WhenScope.Line.value, WhenScope.Script.value):
+                self._contentFilters.add(when.filter)
+
+    # PUBLIC METHODS #
+
+    def requiresContent(self, filePath):
+        """
+        Check if the content of an artifact is required to run the rules (see the class description).
+
+        :param filePath: A File Path (or tar member name).
+        :returns: True if the artifact has to be extracted (or read)
+        """
+        artifactKinds = classifyArtifact(filePath)
+        for artifactKind in artifactKinds:
+            if artifactKind in self.PACKAGE_ARTIFACT_KINDS:
+                return True
+
+        if filePath.endswith(".gz") or filePath.endswith(".tar"):
+            return False
+
+        if WhenFilter.All.value in self._contentFilters:
+            return True
+
+        for filterType in retrieveFilterTypesForArtifactKinds(artifactKinds):
+            if filterType.value in self._contentFilters:
+                return True
+
+        return False
@@ -0,0 +1,369 @@
+import cba.teds.utils.Logger
+import xml.etree.ElementTree as ET
+
+from urllib.parse import quote
+
+"""
+This file renders the Quality Check Report (HTML) of a Teradata Package Check in Python. It produces the same report
+as resources/teradataQualityCheckTransform.xsl (run by Ant, see resources/teradataQualityCheckBuild.xml) in a single
+pass over the findings, without a JVM and without building the XML document in memory.
+"""
+
+STASH_URL = "https://stash.odp.cba/projects/GDW/repos/gdw/browse"
+BUILD_URL = "http://build.dev.cba/viewLog.html?buildId="
+PACKAGE_URL = "http://build.dev.cba/repository/download/GDW_DeveloperTools_PackageTeradata/%s:id/assembled_package.tgz"
+CONFLUENCE_URL = ("http://knowit.cba/display/BICD/TEDS-160+%28Teradata+Quality+Assurance%29+-+Detailed+Requirements"
+                  "#TEDS-160(TeradataQualityAssurance)-DetailedRequirements-")
+
+_HEAD = """<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
+<html>
+   <head>
+      <meta http-equiv="Content-Type" content="text/html; charset=US-ASCII">
+      <title>Teradata Quality Check</title>
+      <style type="text/css">
+                    h1 {
+                    font-family: verdana,arial,sans-serif;
+                    font-size:15px;
+                    }
+                    h2, h3 {
+                    font-family: verdana,arial,sans-serif;
+                    font-size:13px;
+                    }
+                    p {
+                    font-family: verdana,arial,sans-serif;
+                    font-size:11px;
+                    }
+                    table {
+                    font-family: verdana,arial,sans-serif;
+                    font-size:11px;
+                    color:#333333;
+                    border-width: 1px;
+                    border-color: #ccc;
+                    border-collapse: collapse;
+                    border-top-left-radius: 2em;
+                    }
+                    table th {
+                    border-width: 1px;
+                    padding: 8px;
+                    border-style: solid;
+                    border-color: #ccc;
+                    background: -webkit-linear-gradient(top, #FFE784, #FFCC00);
+                    }
+                    table td {
+                    border-width: 1px;
+                    padding: 8px;
+                    border-style: solid;
+                    border-color: #ccc;
+                    background-color: #ffffff;
+                    }
+                    label {
+                    padding-right: 20px;
+                    vertical-align: top;
+                    }
+                    .Warning {
+                    font-weight:bold; color:orange;
+                    }
+                    .Failure {
+                    font-weight:bold; color:red;
+                    }
+                </style>
+      <script>
+                function toggleRows(checkBoxId, className) {
+                    if (document.getElementById(checkBoxId).checked) {
+                        showRows(className);
+                    }
+                    else {
+                        hideRows(className);
+                    }
+                }
+                function hideRows(className) {
+                    var rows = document.getElementsByClassName(className), i;
+                    for (i = 0; i < rows.length; ++i) {
+                      rows[i].style.display = 'none';
+                    }
+                }
+                function showRows(className) {
+                    var rows = document.getElementsByClassName(className), i;
+                    for (i = 0; i < rows.length; ++i) {
+                      rows[i].style.display = '';
+                    }
+                }
+                </script>
+   </head>
+   <body onload="toggleRows('showInformationRows', 'informationRow');toggleRows('showPassRows', 'passRow');">
+"""
+
+_FILTERS = """      <p><label><input id="showFailureRows" type="checkbox" checked onclick="javascript:toggleRows('showFailureRows', 'failureRow');">Show Error Rows</label><label><input id="showWarningRows" type="checkbox" checked onclick="javascript:toggleRows('showWarningRows', 'warningRow');">Show Warning Rows</label><label><input id="showInformationRows" type="checkbox" onclick="javascript:toggleRows('showInformationRows', 'informationRow');">Show Information Rows</label><label><input id="showPassRows" type="checkbox" onclick="javascript:toggleRows('showPassRows', 'passRow');">Show Pass Rows</label></p>
+"""
+
+_TEST_CASE_HEADER = """         <tr valign="top">
+            <th>Artifact Name</th>
+            <th>Status</th>
+            <th>Detail</th>
+         </tr>
+"""
+
+
+def _escapeText(text):
+    # US-ASCII output (the same as the XSLT) so anything else is a character reference
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+def _escapeAttribute(value):
+    value = value.replace("&", "&amp;").replace("\"", "&quot;")
+    return value.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+def _escapeUri(uri):
+    # The HTML output method escapes the non-ASCII characters of a URI (href) attribute
+    return _escapeAttribute(quote(uri, safe="".join(chr(code) for code in range(32, 127))))
+
+
+def _substringBefore(text, separator):
+    # XPath substring-before()
+    index = text.find(separator)
+    return text[:index] if index > -1 else ""
+
+
+def _substringAfter(text, separator):
+    # XPath substring-after()
+    index = text.find(separator)
+    return text[index + len(separator):] if index > -1 else ""
+
+
+def replaceBreaks(text):
+    """
+        Helper function to render a message with a <br> for each _BR_ (see RuleRunner) e.g.
+
+            From : Backup Tables must contain ... _BR_ Backup Table Comments must contain ...
+            TO   : Backup Tables must contain ... <br> Backup Table Comments must contain ...
+
+        :param text: The text of a message.
+        :returns: The (escaped) HTML
+    """
+    return "<br>".join(_escapeText(part) for part in text.split("_BR_"))
+
+
+def injectConfluenceLinks(text):
+    """
+        Helper function to render a message with a link to the (Confluence) requirement for each [[A-n]] e.g.
+
+            From : Create Table Statements must contain MULTISET ([[A-2]])
+            TO   : Create Table Statements must contain MULTISET (<a target="_blank" href="...A-2">link to Confluence</a>)
+
+        :param text: The text of a message.
+        :returns: The (escaped) HTML
+    """
+    html = []
+    while "[[" in text:
+        html.append(replaceBreaks(_substringBefore(text, "[[")))
+        html.append('<a target="_blank" href="%s">link to Confluence</a>' %
+                    _escapeUri(CONFLUENCE_URL + _substringBefore(_substringAfter(text, "[["), "]]")))
+        text = _substringAfter(text, "]]")
+    html.append(replaceBreaks(text))
+    return "".join(html)
+
+
+def readJunitReport(junitFileName):
+    """
+        Helper function to read the test suites of a JUnit Report (see JunitReportWriter) one element at a time.
+
+        A failure (or error) without a message is read as the message N/A. A test case without a failure (error or
+        system-out) has a failure_message (error_message or stdout) of None.
+
+        :param junitFileName: The file path of the JUnit Report.
+        :returns: A list of tuples of (test suite name, number of tests, list of test cases (see ReportTestCase))
+    """
+    testSuites = []
+    testCases = []
+    for event, element in ET.iterparse(junitFileName, events=("end",)):
+        if element.tag == "testcase":
+            testCase = ReportTestCase(element.get("name", ""))
+            failure = element.find("failure")
+            if failure is not None:
+                testCase.failure_message = failure.get("message", "N/A")
+            error = element.find("error")
+            if error is not None:
+                testCase.error_message = error.get("message", "N/A")
+            systemOut = element.find("system-out")
+            if systemOut is not None:
+                testCase.stdout = systemOut.text or ""
+            testCases.append(testCase)
+            element.clear()
+        elif element.tag == "testsuite":
+            testSuites.append((element.get("name", ""), int(element.get("tests", 0)), testCases))
+            testCases = []
+            element.clear()
+
+    return testSuites
+
+
+class ReportTestCase(object):
+    """
+    A ReportTestCase is a test case read from a JUnit Report (see readJunitReport()).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.failure_message = None
+        self.error_message = None
+        self.stdout = None
+
+
+class HtmlReportWriter(object):
+    """
+    The HtmlReportWriter class writes the Quality Check Report (HTML) straight to a file (or any object with a write()
+    method) one test case at a time.
+
+    A test case can be an ArtifactResult (see RuleRunner.generateHtmlReport()), a ReportTestCase (see
+    readJunitReport()) or a junit_xml TestCase. A test case has a failure (or warning, or information) when its
+    failure_message (or error_message, or stdout) is not None.
+    """
+
+    def __init__(self, reportFile, branchName="", qaBuildId="", qaBuildTime="", packagerBuildId=""):
+        """
+        Constructor. The parameters are the same as the parameters of the XSLT (see teradataQualityCheckBuild.xml).
+
+        :param reportFile: The (open) file to write the report to.
+        :param branchName: The branch that was packaged.
+        :param qaBuildId: The (TeamCity) build id of the Quality Checks.
+        :param qaBuildTime: The time of the Quality Checks (e.g. 14:30 26-05-2015).
+        :param packagerBuildId: The (TeamCity) build id of the Packaging build.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: HtmlReportWriter(%s, %s, %s, %s)", branchName, qaBuildId, qaBuildTime,
+                          packagerBuildId)
+
+        self._reportFile = reportFile
+        self._branchName = branchName or ""
+        self._qaBuildId = qaBuildId or ""
+        self._qaBuildTime = qaBuildTime or ""
+        self._packagerBuildId = packagerBuildId or ""
+
+    # PUBLIC METHODS #
+
+    def writeReport(self, testSuites):
+        """
+        Write the Quality Check Report.
+
+        :param testSuites: A list of tuples of (test suite name, number of tests, list of test cases)
+        """
+        self.logger.debug("Call: writeReport(%d test suites)", len(testSuites))
+
+        write = self._reportFile.write
+
+        write(_HEAD)
+        self._writePageHeader(write)
+        self._writeSummary(write, testSuites)
+
+        for testSuiteName, tests, testCases in sorted(testSuites, key=lambda testSuite: testSuite[0]):
+            write('      <a name="%s"></a><h2>Quality Checks for\n                %s</h2>\n' %
+                  (_escapeAttribute(testSuiteName), _escapeText(testSuiteName)))
+            write(_FILTERS)
+            write('      <table>\n')
+            write(_TEST_CASE_HEADER)
+            for testCase in sorted(testCases, key=lambda testCase: testCase.name):
+                self._writeTestCase(write, testCase)
+            write('      </table>\n')
+
+        write('   </body>\n</html>\n')
+
+    # PRIVATE METHODS #
+
+    def _writePageHeader(self, write):
+        packagerBuildLink = _escapeUri(BUILD_URL + self._packagerBuildId)
+        qaBuildLink = _escapeUri(BUILD_URL + self._qaBuildId)
+
+        write('      <h1>Quality Check Report</h1>\n')
+        write('      <p>\n            This report presents the results of the automated Quality Checks when run against\n'
+              '            <b>%s</b>\n            at\n            <b>%s</b>\n            .\n' %
+              (_escapeText(self._branchName), _escapeText(self._qaBuildTime)))
+        write('            <br><br>\n            TeamCity Packaging Build Link:\n'
+              '            <a target="_blank" href="%s">%s</a><br>\n' %
+              (packagerBuildLink, _escapeText(BUILD_URL + self._packagerBuildId)))
+        write('            TeamCity Quality Checks Link:\n'
+              '            <a target="_blank" href="%s">%s</a><br></p>\n' %
+              (qaBuildLink, _escapeText(BUILD_URL + self._qaBuildId)))
+
+    def _writeSummary(self, write, testSuites):
+        testCount = 0
+        failureCount = 0
+        errorCount = 0
+        for testSuiteName, tests, testCases in testSuites:
+            testCount += tests
+            for testCase in testCases:
+                if testCase.failure_message is not None:
+                    failureCount += 1
+                elif testCase.error_message is not None:
+                    errorCount += 1
+
+        if testCount > 0:
+            successRate = "%.2f%%" % (100.0 * (testCount - failureCount - errorCount) / testCount)
+        else:
+            successRate = "NaN"
+
+        summaryClass = ""
+        if failureCount > 0:
+            summaryClass = "Failure"
+        elif errorCount > 0:
+            summaryClass = "Warning"
+
+        write('      <h2>Summary</h2>\n      <table>\n')
+        write('         <tr valign="top">\n            <th>Tests</th>\n            <th>Failures</th>\n'
+              '            <th>Warnings</th>\n            <th>Success Rate</th>\n         </tr>\n')
+        write('         <tr valign="top" class="%s">\n            <td>%d</td>\n            <td>%d</td>\n'
+              '            <td>%d</td>\n            <td>%s</td>\n         </tr>\n      </table>\n' %
+              (summaryClass, testCount, failureCount, errorCount, successRate))
+
+    def _writeTestCase(self, write, testCase):
+        failureMessage = testCase.failure_message
+        errorMessage = testCase.error_message
+        stdout = testCase.stdout
+
+        if failureMessage is not None:
+            rowClass = "failureRow"
+        elif errorMessage is not None:
+            rowClass = "warningRow"
+        elif stdout is not None:
+            rowClass = "informationRow"
+        else:
+            rowClass = "passRow"
+
+        if testCase.name.startswith("/TERADATA"):
+            link = '<a target="_blank" href="%s">Stash Link</a>' % _escapeUri(
+                "%s%s?at=refs%%2Fheads%%2F%s" % (STASH_URL, testCase.name, self._branchName))
+        else:
+            link = '<a target="_blank" href="%s">Package Link</a>' % _escapeUri(PACKAGE_URL % self._packagerBuildId)
+
+        write('         <tr valign="top" class="%s">\n' % rowClass)
+        write('            <td>%s\n                            (%s)\n            </td>\n' %
+              (_escapeText(testCase.name), link))
+
+        # The same (order of) cases as the XSLT i.e. the information of a failure is not shown
+        if failureMessage is not None and errorMessage is not None:
+            status = '<span class="Failure">Failure and Warning</span>'
+            details = [injectConfluenceLinks(failureMessage), injectConfluenceLinks(errorMessage)]
+        elif failureMessage is not None:
+            status = '<span class="Failure">Failure</span>'
+            details = [injectConfluenceLinks(failureMessage)]
+        elif errorMessage is not None and stdout is not None:
+            status = '<span class="Warning">Warning and Information</span>'
+            details = [injectConfluenceLinks(errorMessage), replaceBreaks(stdout)]
+        elif errorMessage is not None:
+            status = '<span class="Warning">Warning</span>'
+            details = [injectConfluenceLinks(errorMessage)]
+        elif stdout is not None:
+            status = '<span class="Information">Information</span>'
+            details = [replaceBreaks(stdout)]
+        else:
+            status = '<span>Success</span>'
+            details = []
+
+        write('            <td>%s</td>\n' % status)
+        write('            <td>%s</td>\n' % "".join("<p>%s</p>" % detail for detail in details))
+        write('         </tr>\n')
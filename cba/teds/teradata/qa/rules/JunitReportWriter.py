@@ -0,0 +1,117 @@
+import cba.teds.utils.Logger
+import re
+
+
+# junit_xml removes the illegal XML characters after the document is serialized (as ASCII, everything else is a
+# character reference by then). A carriage return is escaped in an attribute (so it survives) but not in text.
+_ILLEGAL_TEXT_CHARACTERS = re.compile("[\x00-\x08\x0b-\x1f\x7f]")
+_ILLEGAL_ATTRIBUTE_CHARACTERS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
+def _escapeText(text):
+    text = _ILLEGAL_TEXT_CHARACTERS.sub("", text)
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+
+def _escapeAttribute(value):
+    value = _ILLEGAL_ATTRIBUTE_CHARACTERS.sub("", value)
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+
+class JunitReportWriter(object):
+    """
+    The JunitReportWriter class writes a JUnit Report one test case at a time straight to a file (or any object with
+    a write() method) instead of building the whole document in memory first.
+
+    The report is the same (byte for byte) as the (pretty printed) report of junit_xml.TestSuite.to_file() so the
+    XSLT (and anything else that reads the report) doesn't change. A test case can be an ArtifactResult or a junit_xml
+    TestCase (only the name, classname, failure_message, error_message and stdout are written).
+    """
+
+    def __init__(self, reportFile):
+        """
+        Constructor.
+
+        :param reportFile: The (open) file to write the report to.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: JunitReportWriter()")
+
+        self._reportFile = reportFile
+
+    # PUBLIC METHODS #
+
+    def writeTestSuite(self, name, testCases, properties=None):
+        """
+        Write a JUnit Report with one test suite.
+
+        :param name: The name of the test suite.
+        :param testCases: A list of test cases (see ArtifactResult).
+        :param properties: An (ordered) map of the properties of the test suite.
+        """
+        self.logger.debug("Call: writeTestSuite(%s, %d test cases)", name, len(testCases))
+
+        write = self._reportFile.write
+
+        failures = 0
+        errors = 0
+        for testCase in testCases:
+            if testCase.failure_message:
+                failures += 1
+            if testCase.error_message:
+                errors += 1
+
+        write('<?xml version="1.0" ?>\n<testsuites>\n')
+        write('\t<testsuite name="%s" failures="%d" errors="%d" skipped="0" time="0" tests="%d"' %
+              (_escapeAttribute(str(name)), failures, errors, len(testCases)))
+
+        if not properties and len(testCases) == 0:
+            write('/>\n</testsuites>\n')
+            return
+
+        write('>\n')
+
+        if properties:
+            write('\t\t<properties>\n')
+            for propertyName, propertyValue in properties.items():
+                write('\t\t\t<property name="%s" value="%s"/>\n' %
+                      (_escapeAttribute(str(propertyName)), _escapeAttribute(str(propertyValue))))
+            write('\t\t</properties>\n')
+
+        for testCase in testCases:
+            self._writeTestCase(write, testCase)
+
+        write('\t</testsuite>\n</testsuites>\n')
+
+    # PRIVATE METHODS #
+
+    def _writeTestCase(self, write, testCase):
+
+        write('\t\t<testcase name="%s"' % _escapeAttribute(str(testCase.name)))
+        if testCase.classname:
+            write(' classname="%s"' % _escapeAttribute(str(testCase.classname)))
+
+        failureMessage = testCase.failure_message
+        errorMessage = testCase.error_message
+        stdout = testCase.stdout
+
+        if not (failureMessage or errorMessage or stdout):
+            write('/>\n')
+            return
+
+        write('>\n')
+        if failureMessage:
+            write('\t\t\t<failure type="failure" message="%s"/>\n' % _escapeAttribute(failureMessage))
+        if errorMessage:
+            write('\t\t\t<error type="error" message="%s"/>\n' % _escapeAttribute(errorMessage))
+        if stdout:
+            stdout = _escapeText(stdout)
+            if stdout:
+                write('\t\t\t<system-out>%s</system-out>\n' % stdout)
+            else:
+                write('\t\t\t<system-out/>\n')
+        write('\t\t</testcase>\n')
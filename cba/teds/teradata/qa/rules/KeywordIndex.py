@@ -0,0 +1,96 @@
+import cba.teds.utils.Logger
+
+
+# The KeywordIndex for each keywords file (loaded once per process, see loadKeywordIndex())
+_keywordIndexes = {}
+
+
+def loadKeywordIndex(filePath):
+    """
+        Helper function to load a KeywordIndex from a keywords file (one keyword per line e.g.
+        resources/Teradata_Reserved_Words.csv). Each file is only read once per process.
+
+        :param filePath: The relative (project root) path to the keywords file
+        :returns keywordIndex: The KeywordIndex for the keywords file
+    """
+    keywordIndex = _keywordIndexes.get(filePath)
+    if keywordIndex is None:
+        logger = cba.teds.utils.Logger.getLogger()
+
+        keywords = []
+        file = open(filePath)
+        try:
+            for line in file:
+                keyword = line.rstrip() # remove new line character
+                keyword += ' '
+                keywords.append(keyword)
+        except Exception as exception:
+            logger.error("loadKeywordIndex() ERROR IN READING FILE(%s)" % filePath)
+            logger.error(exception)
+        file.close()
+
+        keywordIndex = KeywordIndex(keywords)
+        _keywordIndexes[filePath] = keywordIndex
+
+    return keywordIndex
+
+
+class KeywordIndex(object):
+    """
+    The KeywordIndex class answers the question "does this line begin with one of the keywords?" with a single lookup
+    (rather than one String.find() per keyword).
+
+    Each keyword is a prefix (e.g. "ABORT " i.e. the keyword and a trailing space). The usual keyword (a single token
+    and a trailing space) is stored in a set of tokens and looked up with the leading token of the line. Any other
+    keyword is kept as a plain prefix and checked with String.startswith().
+
+    A KeywordIndex can be iterated (and measured) like the list of keywords it was built from.
+    """
+
+    def __init__(self, keywords):
+        """
+        Constructor.
+
+        :param keywords: A list of keywords (String) e.g. ["ABORT ", "ABS "]
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: KeywordIndex(%d keywords)", len(keywords))
+
+        self._keywords = list(keywords)
+
+        self._tokens = set()
+        prefixes = []
+        for keyword in self._keywords:
+            token = keyword[:-1]
+            if keyword.endswith(" ") and token.find(" ") == -1:
+                self._tokens.add(token)
+            else:
+                prefixes.append(keyword)
+        self._prefixes = tuple(prefixes)
+
+    def __iter__(self):
+        return iter(self._keywords)
+
+    def __len__(self):
+        return len(self._keywords)
+
+    # PUBLIC METHODS #
+
+    def beginsWithKeyword(self, line):
+        """
+        Check if a line begins with a keyword (ignoring any leading white space).
+
+        :param line: A line (String)
+        :returns: True if the line begins with a keyword
+        """
+        line = line.lstrip()
+
+        tokenEndIndex = line.find(" ")
+        if tokenEndIndex > -1 and line[:tokenEndIndex] in self._tokens:
+            return True
+
+        return len(self._prefixes) > 0 and line.startswith(self._prefixes)
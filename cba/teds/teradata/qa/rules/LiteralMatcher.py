@@ -0,0 +1,159 @@
+
+import re
+
+from collections import deque
+from cba.teds.teradata.qa.rules.Rule import WhenScope, WhenType
+
+"""
+This file defines a multi-literal matcher for the literal (CONTAINS and BEGINS_WITH) When conditions.
+
+Rather than asking each When (see When.isConditionMatched()) whether a line matches, the literal values of a group
+of Whens (e.g. all of the CREATE_TABLE Whens) are compiled into one Aho-Corasick automaton and every line is inspected
+once, no matter how many literal Whens there are.
+"""
+
+
+def isLiteralWhen(when):
+    """
+        Helper function to identify the When objects that can be compiled into a LiteralMatcher.
+
+        :param when: A When object
+        :returns: True if the When is a CONTAINS or BEGINS_WITH When that is evaluated against the artifact content
+    """
+    return (when.type in (WhenType.Contains.value, WhenType.BeginsWith.value) and
+            when.scope in (WhenScope.Line.value, WhenScope.Script.value))
+
+
+class LiteralMatcher(object):
+    """
+    A LiteralMatcher is an Aho-Corasick automaton compiled from a list of literal When objects.
+
+    BEGINS_WITH Whens are resolved by walking the trie from the root along the start of the line (the walk stops as
+    soon as the line leaves the trie, which is usually after a character or two). CONTAINS Whens are resolved by
+    running the automaton (with failure links) over the line. A single (C level) regular expression that recognises
+    any of the CONTAINS literals is used as a gate so that lines containing none of them are rejected without
+    walking the automaton in Python.
+
+    NOTE:  The line is expected to have been stripped (the same as When.isConditionMatched()).
+    """
+
+    def __init__(self, whens):
+        """
+        LiteralMatcher Constructor.
+
+        :param whens: A list of literal (see isLiteralWhen()) When objects
+        """
+
+        self.whens = [when for when in whens if isLiteralWhen(when)]
+
+        # State 0 is the root of the trie
+        self._goto = [{}]
+        self._fail = [0]
+        self._containsOutput = [()]
+        self._beginsWithOutput = [()]
+
+        self._alwaysMatched = []
+        containsValues = set()
+
+        for when in self.whens:
+            if when.value == "":
+                # Every (stripped) line contains and begins with an empty string
+                self._alwaysMatched.append(when)
+                continue
+
+            state = self._addLiteral(when.value)
+            if when.type == WhenType.Contains.value:
+                self._containsOutput[state] += (when,)
+                containsValues.add(when.value)
+            else:
+                self._beginsWithOutput[state] += (when,)
+
+        self._buildFailureLinks()
+
+        self._containsGate = None
+        if containsValues:
+            self._containsGate = re.compile("|".join(re.escape(value) for value in
+                                                     sorted(containsValues, key=len, reverse=True)))
+        self._hasBeginsWith = any(self._beginsWithOutput)
+
+    def match(self, line):
+        """
+        Match a (stripped) line against every literal When in the matcher.
+
+        :param line: The line (String)
+        :returns: A set of the When objects whose condition is matched
+        """
+
+        matchedWhens = set(self._alwaysMatched)
+
+        goto = self._goto
+
+        if self._hasBeginsWith:
+            state = 0
+            for character in line:
+                state = goto[state].get(character)
+                if state is None:
+                    break
+                if self._beginsWithOutput[state]:
+                    matchedWhens.update(self._beginsWithOutput[state])
+
+        if self._containsGate is not None:
+            gateMatch = self._containsGate.search(line)
+            if gateMatch:
+                fail = self._fail
+                containsOutput = self._containsOutput
+                state = 0
+                for character in line[gateMatch.start():]:
+                    while state and character not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(character, 0)
+                    if containsOutput[state]:
+                        matchedWhens.update(containsOutput[state])
+
+        return matchedWhens
+
+    def __str__(self):
+        return "LiteralMatcher: {whens: (%s), states: (%d)}" % (", ".join(when.name for when in self.whens),
+                                                                len(self._goto))
+
+    # PRIVATE METHODS #
+
+    def _addLiteral(self, literal):
+        """
+        Add a literal to the trie and return the state that recognises it.
+        """
+
+        state = 0
+        for character in literal:
+            nextState = self._goto[state].get(character)
+            if nextState is None:
+                nextState = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._containsOutput.append(())
+                self._beginsWithOutput.append(())
+                self._goto[state][character] = nextState
+            state = nextState
+
+        return state
+
+    def _buildFailureLinks(self):
+        """
+        Build the failure links (breadth first) and merge the CONTAINS output of each state with its failure state.
+        """
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, nextState in self._goto[state].items():
+                queue.append(nextState)
+
+                failState = self._fail[state]
+                while failState and character not in self._goto[failState]:
+                    failState = self._fail[failState]
+                failState = self._goto[failState].get(character, 0)
+                if failState == nextState:
+                    failState = 0
+
+                self._fail[nextState] = failState
+                self._containsOutput[nextState] += self._containsOutput[failState]
@@ -0,0 +1,226 @@
+try:
+    # Python 3.11+ (sre_parse is deprecated)
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    try:
+        import sre_parse
+        import sre_constants
+    except ImportError:
+        sre_parse = None
+        sre_constants = None
+
+"""
+This file is the one place that looks inside a regular expression i.e. the parse tree that the re module builds from a
+pattern (see RequiredLiteral, ArtifactCorpus and ActionMatcher).
+
+The parser (re._parser, sre_parse before Python 3.11) is not a public API of the re module so every function here
+falls back to the answer that doesn't optimize anything (no literal, no prefix, unknown opcodes) when the parser is
+missing or a pattern can't be parsed (or walked).
+"""
+
+# The characters that (unescaped) are not literals in a regular expression, and the ones that repeat the item before
+_SPECIAL_CHARACTERS = ".^$*+?{}[]|()\\"
+_REPEAT_CHARACTERS = "*+?{"
+
+# The repeats (empty if there isn't a parser)
+_REPEATS = tuple(getattr(sre_constants, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+                 if hasattr(sre_constants, name))
+
+
+def parsePattern(pattern):
+    """
+        Helper function to parse a regular expression.
+
+        :param pattern: A regular expression (String)
+        :returns: The parse tree (a list of (opcode, argument) items) or None (if the pattern can't be parsed)
+    """
+    if sre_parse is None:
+        return None
+
+    try:
+        return sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+
+def containsOpcode(pattern, opcodeNames):
+    """
+        Helper function to find out if any part of a regular expression (e.g. inside a group, a repeat or an
+        alternative) is one of a list of opcodes.
+
+        :param pattern: A regular expression (String)
+        :param opcodeNames: The names of the opcodes (e.g. "AT", "GROUPREF"), a name this Python doesn't have is ignored
+        :returns: True or False, or None (if the pattern can't be parsed)
+    """
+    parsedPattern = parsePattern(pattern)
+    if parsedPattern is None:
+        return None
+
+    try:
+        return _containsOpcode(parsedPattern, _retrieveOpcodes(opcodeNames))
+    except Exception:
+        return None
+
+
+def collectRequiredLiterals(pattern):
+    """
+        Helper function to collect the literals of a regular expression that are not optional i.e. the runs of
+        literal characters outside of any alternation, optional repeat or case insensitive group.
+
+        :param pattern: A regular expression (String)
+        :returns: A list of the literals (Strings, possibly empty) or an empty list (if the pattern can't be parsed)
+    """
+    parsedPattern = parsePattern(pattern)
+    if parsedPattern is None:
+        return []
+
+    literals = []
+    try:
+        _collectRequiredLiterals(parsedPattern, literals)
+    except Exception:
+        return []
+
+    return literals
+
+
+def containsTopLevelBranch(pattern):
+    """
+        Helper function to identify a regular expression with a top-level alternation e.g. "COMPRESS\\s\\(|FOO" (whose
+        literal prefix only belongs to its first alternative).
+
+        The source is scanned (rather than the parse tree) because the parser folds the common prefix of the
+        alternatives (e.g. "COMPRESSA|COMPRESSB" is parsed as "COMPRESS[AB]").
+
+        :param pattern: A regular expression (String)
+        :returns: True if there is a | outside of any group (or character class)
+    """
+    depth = 0
+    position = 0
+    while position < len(pattern):
+        character = pattern[position]
+        if character == "\\":
+            position += 2
+            continue
+        if character == "[":
+            # A ] straight after the [ (or [^) is a literal
+            position += 1
+            if position < len(pattern) and pattern[position] == "^":
+                position += 1
+            if position < len(pattern) and pattern[position] == "]":
+                position += 1
+            while position < len(pattern) and pattern[position] != "]":
+                position += 2 if pattern[position] == "\\" else 1
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+        position += 1
+    return False
+
+
+def splitLiteralPrefix(pattern):
+    """
+        Helper function to split a regular expression into its literal prefix and the rest of the pattern e.g.
+        "COMPRESS" and "\\s?\\(" for "COMPRESS\\s?\\(".
+
+        The prefix is never longer than the run of literals that the parse tree starts with (i.e. the first required
+        literal, see collectRequiredLiterals()). A pattern with a top-level alternation (see containsTopLevelBranch())
+        or that can't be parsed doesn't have a prefix.
+
+        :param pattern: A regular expression (String)
+        :returns: A list of the (literal, source) pairs of the prefix and the rest of the pattern (String)
+    """
+    if containsTopLevelBranch(pattern):
+        return [], pattern
+
+    parsedPattern = parsePattern(pattern)
+    if parsedPattern is None:
+        return [], pattern
+
+    maxLength = 0
+    for op, av in parsedPattern:
+        if op is not sre_constants.LITERAL:
+            break
+        maxLength += 1
+
+    literals = []
+    position = 0
+    while position < len(pattern) and len(literals) < maxLength:
+        character = pattern[position]
+        if character == "\\":
+            if position + 1 >= len(pattern) or pattern[position + 1].isalnum():
+                break
+            literal, end = pattern[position + 1], position + 2
+        elif character in _SPECIAL_CHARACTERS:
+            break
+        else:
+            literal, end = character, position + 1
+
+        # A literal that is repeated is not part of the prefix
+        if end < len(pattern) and pattern[end] in _REPEAT_CHARACTERS:
+            break
+        literals.append((literal, pattern[position:end]))
+        position = end
+
+    return literals, pattern[position:]
+
+
+def _retrieveOpcodes(opcodeNames):
+    return tuple(getattr(sre_constants, name) for name in opcodeNames if hasattr(sre_constants, name))
+
+
+def _retrieveSubpatterns(op, av):
+    # The parse trees inside an item (e.g. the alternatives of a BRANCH or the pattern of a repeat)
+    if op is sre_constants.BRANCH:
+        return av[1]
+    if op is sre_constants.SUBPATTERN:
+        return [av[-1]]
+    if op in _REPEATS:
+        return [av[2]]
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return [av[1]]
+    if op is getattr(sre_constants, "ATOMIC_GROUP", None):
+        return [av]
+    if op is sre_constants.GROUPREF_EXISTS:
+        return [subpattern for subpattern in av[1:] if subpattern is not None]
+    return []
+
+
+def _containsOpcode(parsedPattern, opcodes):
+    for op, av in parsedPattern:
+        if op in opcodes:
+            return True
+        if any(_containsOpcode(subpattern, opcodes) for subpattern in _retrieveSubpatterns(op, av)):
+            return True
+    return False
+
+
+def _collectRequiredLiterals(parsedPattern, literals):
+    # Each run of LITERAL items (in a sequence that is required) is a required literal
+    run = []
+    for op, av in parsedPattern:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if op is sre_constants.AT:
+            # An anchor (e.g. \b) doesn't consume anything so the run continues
+            continue
+
+        literals.append("".join(run))
+        run = []
+
+        if op is sre_constants.SUBPATTERN:
+            addFlags = av[1]
+            if not addFlags & sre_constants.SRE_FLAG_IGNORECASE:
+                _collectRequiredLiterals(av[-1], literals)
+        elif op in _REPEATS:
+            minimum, maximum, repeatedPattern = av
+            if minimum >= 1:
+                _collectRequiredLiterals(repeatedPattern, literals)
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            _collectRequiredLiterals(av, literals)
+
+    literals.append("".join(run))
@@ -0,0 +1,34 @@
+import re
+
+from cba.teds.teradata.qa.rules.PatternParser import collectRequiredLiterals
+
+"""
+This file extracts the required literal of a regular expression i.e. a String that every match of the pattern must
+contain (e.g. "TITLE" for the "Database Column" When).
+
+A line (or a script) that doesn't contain the required literal can't match the pattern so a (fast) substring test is
+enough to reject it (see When.isConditionMatched() and Action.executeAction()) and the regular expression is only
+run against the lines that pass.
+"""
+
+
+def extractRequiredLiteral(pattern):
+    """
+        Helper function to extract the (longest) required literal of a regular expression.
+
+        Only the literals that are not optional (i.e. outside of any alternation or optional repeat) are considered.
+        A case insensitive pattern doesn't have a required literal.
+
+        :param pattern: A regular expression (String)
+        :returns: The required literal (String) or None (if the pattern doesn't have one)
+    """
+    try:
+        if re.compile(pattern).flags & re.IGNORECASE:
+            return None
+    except (re.error, RecursionError):
+        return None
+
+    literals = collectRequiredLiterals(pattern)
+
+    requiredLiteral = max(literals, key=len) if literals else ""
+    return requiredLiteral if requiredLiteral else None
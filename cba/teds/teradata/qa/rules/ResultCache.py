@@ -0,0 +1,212 @@
+import cba.teds.utils.Logger
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+
+# The name of an entry (see _entryPath()) i.e. the key (a SHA-1 hex digest) and the name of its sub-directory
+_ENTRY_NAME_PATTERN = re.compile(r"^[0-9a-f]{40}\.json$")
+_ENTRY_DIRECTORY_PATTERN = re.compile(r"^[0-9a-f]{2}$")
+
+
+class ResultCache(object):
+    """
+    The ResultCache class provides a persistent (on-disk) cache of the findings for each artifact of a package so that
+    artifacts that have not changed between two builds don't need to be scanned again.
+
+    Each entry is a small JSON file (under a two character sub-directory) named after its key. The key is built (see
+    buildKey()) from a hash of the rule set, the artifact name and a hash of the content of the artifact.
+
+    Entries are evicted (see evict()) when they haven't been used for maxAge seconds and (oldest first) when the cache
+    grows beyond maxSize bytes.
+
+    NOTE:  Only the entries are counted (and evicted), anything else in the cache directory (e.g. a rulesets/
+           directory of compiled rule sets, see RuleSetCache) is left alone.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024 # 256 MB
+    DEFAULT_MAX_AGE = 30 * 24 * 60 * 60 # 30 Days
+
+    def __init__(self, cacheDirectory, maxSize=DEFAULT_MAX_SIZE, maxAge=DEFAULT_MAX_AGE):
+        """
+        Constructor.
+
+        :param cacheDirectory: The path of the directory that holds the cache (it is created if necessary).
+        :param maxSize: The maximum size (in bytes) of the cache.
+        :param maxAge: The maximum age (in seconds since it was last used) of an entry.
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: ResultCache(%s, %s, %s)", cacheDirectory, maxSize, maxAge)
+
+        self._cacheDirectory = cacheDirectory
+        self._maxSize = maxSize
+        self._maxAge = maxAge
+
+        self.hits = 0
+        self.misses = 0
+
+        if not os.path.exists(self._cacheDirectory):
+            os.makedirs(self._cacheDirectory)
+
+    # PUBLIC METHODS #
+
+    @staticmethod
+    def buildKey(ruleSetHash, artifactName, content):
+        """
+        Build the key for an artifact.
+
+        :param ruleSetHash: A hash (String) that identifies the rule set (and anything else the findings depend on).
+        :param artifactName: The name (String) of the artifact (the filters and FILE_PATH Whens depend on it).
+        :param content: The content of the artifact (any bytes-like object).
+        :returns: The key (String)
+        """
+        contentHash = hashlib.sha1(content).hexdigest()
+        return hashlib.sha1(("%s|%s|%s" % (ruleSetHash, artifactName, contentHash)).encode("utf-8")).hexdigest()
+
+    def retrieveFindings(self, key):
+        """
+        Retrieve the findings for a key.
+
+        :param key: A key (see buildKey()).
+        :returns: A list of findings or None (if there isn't an entry for the key).
+        """
+
+        entryPath = self._entryPath(key)
+
+        findings = None
+        try:
+            with open(entryPath) as entryFile:
+                findings = [tuple(finding) for finding in json.load(entryFile)]
+            # Touch the entry (eviction is based on when an entry was last used)
+            os.utime(entryPath, None)
+        except (IOError, OSError, ValueError, TypeError):
+            findings = None
+
+        if findings is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return findings
+
+    def storeFindings(self, key, findings):
+        """
+        Store the findings for a key.
+
+        :param key: A key (see buildKey()).
+        :param findings: A list of findings (tuples of numbers and Strings).
+        """
+
+        entryPath = self._entryPath(key)
+        entryDirectory = os.path.dirname(entryPath)
+
+        try:
+            if not os.path.exists(entryDirectory):
+                os.makedirs(entryDirectory)
+
+            # Write to a temporary file and rename it so that a concurrent reader never sees a partial entry
+            fileDescriptor, temporaryPath = tempfile.mkstemp(dir=entryDirectory)
+            with os.fdopen(fileDescriptor, "w") as entryFile:
+                json.dump(findings, entryFile)
+            os.replace(temporaryPath, entryPath)
+        except (IOError, OSError) as exception:
+            self.logger.warn("Result Cache Entry cannot be stored (%s): %s", entryPath, exception)
+
+    def recordHit(self, cached):
+        """
+        Record a hit (or a miss) for a lookup made by another ResultCache object (e.g. in a worker process).
+
+        :param cached: True for a hit, False for a miss.
+        """
+        if cached:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def hitRate(self):
+        lookups = self.hits + self.misses
+        return (100.0 * self.hits / lookups) if lookups > 0 else 0.0
+
+    def logHitRate(self):
+        self.logger.info("Result Cache: %d hits, %d misses (%.1f%% hit rate)", self.hits, self.misses, self.hitRate())
+
+    def evict(self):
+        """
+        Evict the entries that haven't been used for maxAge seconds and then (least recently used first) as many
+        entries as necessary to bring the cache under maxSize bytes.
+
+        :returns: The number of entries evicted.
+        """
+
+        self.logger.debug("Call: ResultCache.evict()")
+
+        now = time.time()
+        evicted = 0
+
+        entries = []
+        for entryPath in self._listEntryPaths():
+            try:
+                entryStat = os.stat(entryPath)
+            except OSError:
+                continue
+            if now - entryStat.st_mtime > self._maxAge:
+                evicted += self._removeEntry(entryPath)
+            else:
+                entries.append((entryStat.st_mtime, entryStat.st_size, entryPath))
+
+        cacheSize = sum(entrySize for entryTime, entrySize, entryPath in entries)
+        if cacheSize > self._maxSize:
+            for entryTime, entrySize, entryPath in sorted(entries):
+                if cacheSize <= self._maxSize:
+                    break
+                evicted += self._removeEntry(entryPath)
+                cacheSize -= entrySize
+
+        if evicted > 0:
+            self.logger.info("Result Cache: %d entries evicted", evicted)
+
+        return evicted
+
+    # PRIVATE METHODS #
+
+    def _entryPath(self, key):
+        return os.path.join(self._cacheDirectory, key[:2], key + ".json")
+
+    def _listEntryPaths(self):
+        """
+            List the paths of the entries i.e. the <key>.json files in the two character sub-directories (see
+            _entryPath())
+        """
+        entryPaths = []
+        try:
+            directoryNames = os.listdir(self._cacheDirectory)
+        except OSError:
+            return entryPaths
+
+        for directoryName in directoryNames:
+            entryDirectory = os.path.join(self._cacheDirectory, directoryName)
+            if not _ENTRY_DIRECTORY_PATTERN.match(directoryName) or not os.path.isdir(entryDirectory):
+                continue
+            try:
+                fileNames = os.listdir(entryDirectory)
+            except OSError:
+                continue
+            for fileName in fileNames:
+                if _ENTRY_NAME_PATTERN.match(fileName) and fileName.startswith(directoryName):
+                    entryPaths.append(os.path.join(entryDirectory, fileName))
+
+        return entryPaths
+
+    def _removeEntry(self, entryPath):
+        try:
+            os.remove(entryPath)
+            return 1
+        except OSError:
+            return 0
@@ -9,6 +9,7 @@ XML file (e.g. resources\teradataQualityCheckRules.xml) it should all make sense
 """
 
 from enum import Enum
+from cba.teds.teradata.qa.rules.RequiredLiteral import extractRequiredLiteral
 import re
 
 
@@ -138,9 +139,14 @@ class When(object):
     type = the type (WhenType) that is used to specify the type of search
     value = the value (String) that is searched for (subject to filter, scope and type)
     data = a list of resultant objects (WhenData) that match the criteria
+    pattern = the compiled value (for a MATCHES_PATTERN When, None otherwise)
+    literal = a String that every match of the pattern contains (see extractRequiredLiteral(), None if there isn't one)
+
+    NOTE:  The pattern is compiled by the Constructor so an invalid pattern raises re.error (see RuleReader).
+    NOTE:  The pattern is only searched for in data that contains the literal.
     """
 
-    def __init__(self, name, value, type, scope, filter):
+    def __init__(self, name, value, type, scope, filter, extractLiteral=True):
         """
         When Constructor.
 
@@ -149,6 +155,7 @@ class When(object):
         :param type: Type (WhenType Enum)
         :param scope: Scope (WhenScope) Enum
         :param filter: Filter (WhenFilter) Enum
+        :param extractLiteral: Set to False if the literal is already known (e.g. a compiled rule set, see RuleReader)
         """
         self.name = name
         self.value = value
@@ -157,6 +164,13 @@ class When(object):
         self.filter = filter
         self.data = []
 
+        self.pattern = None
+        self.literal = None
+        if self.type == WhenType.MatchesPattern.value:
+            self.pattern = re.compile(self.value)
+            if extractLiteral:
+                self.literal = extractRequiredLiteral(self.value)
+
     def isConditionMatched(self, data):
         isDataMatched = False
         tmpLine = data.lstrip().rstrip()
@@ -165,7 +179,9 @@ class When(object):
         elif self.type == WhenType.BeginsWith.value and tmpLine.startswith(self.value) :
             isDataMatched = True
         elif self.type == WhenType.MatchesPattern.value:
-            if re.search(self.value ,tmpLine) : # This is doing the patter match
+            if self.literal is not None and self.literal not in tmpLine:
+                isDataMatched = False
+            elif self.pattern.search(tmpLine) : # This is doing the patter match
                 isDataMatched = True
 
         return isDataMatched
@@ -182,17 +198,35 @@ class WhenData(object):
 
     artifactName = a name (String) that identifies the artifact (e.g. file path)
     data = the data (String) in the artifact that matches the criteria
+
+    The data can be held as a (start, end) span of a source String (e.g. the ArtifactCorpus buffer) so that WhenData
+    objects can share one copy of the artifacts. The data is only sliced out of the source the first time it is used
+    (and kept, so it is sliced once). A span that covers the entire source (e.g. a line that was already sliced to be
+    matched, see RuleRunner._scanArtifact()) is returned without a copy.
     """
 
-    def __init__(self, artifactName, data):
+    __slots__ = ("artifactName", "source", "start", "end", "_data")
+
+    def __init__(self, artifactName, data, start=0, end=None):
         """
         WhenData Constructor.
 
         :param artifactName: Artifact Name (String)
-        :param data: Data (String)
+        :param data: Data (String) or the source (String) of the span
+        :param start: The start of the span (in data)
+        :param end: The end of the span (in data), defaults to the end of data
         """
         self.artifactName = artifactName
-        self.data = data
+        self.source = data
+        self.start = start
+        self.end = len(data) if end is None else end
+        self._data = data if self.start == 0 and self.end == len(data) else None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self.source[self.start:self.end]
+        return self._data
 
     def __str__(self):
         return "WhenData: {artifactName: (%s), data: (%s)}" % (self.artifactName, self.data)
@@ -205,15 +239,21 @@ class Action(object):
     name = a name (String) that identifies the action (e.g. Check for Multiset Statement)
     actionType = the type of action (ActionType) (e.g. textMatch)
     actionData = the data (String) to support the actionType
+    pattern = the compiled actionData (for a patternMatch Action, None otherwise)
+    literal = a String that every match of the pattern contains (see extractRequiredLiteral(), None if there isn't one)
+
+    NOTE:  The pattern is compiled by the Constructor so an invalid pattern raises re.error (see RuleReader).
+    NOTE:  The pattern is only searched for in data that contains the literal.
     """
 
-    def __init__(self, name, actionType, actionData):
+    def __init__(self, name, actionType, actionData, extractLiteral=True):
         """
         Action Constructor.
 
         :param name: Action Name (String)
         :param actionType: Action Type (ActionType Enum)
         :param actionData: Data (String)
+        :param extractLiteral: Set to False if the literal is already known (e.g. a compiled rule set, see RuleReader)
         """
 
         # Initialize Logging
@@ -223,6 +263,13 @@ class Action(object):
         self.actionType = actionType
         self.actionData = actionData
 
+        self.pattern = None
+        self.literal = None
+        if self.actionType == ActionType.PatternMatch.value:
+            self.pattern = re.compile(self.actionData)
+            if extractLiteral:
+                self.literal = extractRequiredLiteral(self.actionData)
+
     def __str__(self):
         return "Action: {name: (%s), actionType: (%s), actionData: (%s)}" % (self.name, self.actionType, self.actionData)
 
@@ -239,7 +286,9 @@ class Action(object):
 
         if self.actionType == ActionType.PatternMatch.value:
             # re.search() will return None if the pattern (in actionData) is not present (in data)
-            if re.search(self.actionData, data) is None:
+            if self.literal is not None and self.literal not in data:
+                actionRequired = True
+            elif self.pattern.search(data) is None:
                 actionRequired = True
         elif self.actionType == ActionType.TextMatch.value:
             # String.find() will return -1 if the text (in actionData) is not present (in data)
@@ -255,17 +304,11 @@ class Action(object):
             if data.find(crNumber) == -1:
                 actionRequired = True
         elif self.actionType == ActionType.ContainsTeradataKeywords.value:
-            # this will retrieve String Array (teradataKeywords)
+            # this will retrieve a KeywordIndex (teradataKeywords)
             teradataKeywords = assembledPackage.retrieveTeradataKeywords()
-            whenData = data.lstrip()
-            for keyword in teradataKeywords:
-                # keyword = keyword + ' '   #
-                # Action is required if the db line is begin with Teradata Keywords
-                if whenData.find(keyword) == 0:
-                    # print('data ', data)
-                    # print(' - - keyword = %s, FIND = %d' % (keyword, whenData.find(keyword) ) )
-                    actionRequired = True
-                    break
+            # Action is required if the db line is begin with Teradata Keywords
+            if teradataKeywords.beginsWithKeyword(data):
+                actionRequired = True
 
         else:
             self.logger.warn("Action Type '%s' Not Implemented", self.actionType)
@@ -0,0 +1,97 @@
+import cba.teds.utils.Logger
+
+from collections import OrderedDict
+from cba.teds.teradata.qa.rules.Rule import WhenFilter
+
+# The order of the filters in a RulePlan (ALL first, then the order of WhenFilter)
+_FILTER_ORDER = dict((whenFilter.value, position) for position, whenFilter in enumerate(WhenFilter))
+
+
+class RulePlan(object):
+    """
+    A RulePlan is the plan for evaluating a rule set (see RuleReader) i.e. the Whens that have to be evaluated and the
+    Rules (Actions) that have to be executed against the data of each When.
+
+    - A When that is not referenced by a Rule is dropped (it doesn't need to be evaluated at all).
+    - The Rules are grouped by When so that each When Data is visited once with all of its Actions.
+    - The steps (one per When) are sorted by filter (and then by the first Rule that references the When).
+
+    NOTE:  The indexes of the Rules (in the rule set) are kept so that the results can be recorded in the same order
+           as a Rule by Rule evaluation (see RuleRunner.runRules()).
+    """
+
+    def __init__(self, whens, rules):
+        """
+        RulePlan Constructor.
+
+        :param whens: A map (keyed on name) of When objects (see RuleReader.retrieveListOfWhenConditions()).
+        :param rules: A list of Rule objects (see RuleReader.retrieveListOfRules()).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: RulePlan(%d whens, %d rules)", len(whens), len(rules))
+
+        self._rules = rules
+
+        ruleIndexes = OrderedDict() # map keyed on When object (in the order of the first Rule that references it)
+        for ruleIndex, rule in enumerate(rules):
+            ruleIndexes.setdefault(rule.when, []).append(ruleIndex)
+
+        referencedWhens = [when for when in ruleIndexes]
+        referencedWhens.sort(key=lambda when: _FILTER_ORDER.get(when.filter, len(_FILTER_ORDER)))
+
+        self._steps = [(when, ruleIndexes[when]) for when in referencedWhens]
+        self._whens = OrderedDict((when.name, when) for when in referencedWhens)
+        self._droppedWhens = [whenName for whenName in whens if whenName not in self._whens]
+
+        if self._droppedWhens:
+            self.logger.debug("Dropped Whens (not referenced by a Rule): %s", ", ".join(self._droppedWhens))
+
+    # PUBLIC METHODS #
+
+    def retrieveSteps(self):
+        """
+        Returns the steps of the plan i.e. a list of (When object, list of Rule indexes) sorted by filter.
+        """
+        return self._steps
+
+    def retrieveWhens(self):
+        """
+        Returns a map (keyed on name) of the When objects that have to be evaluated (in the order of the steps).
+        """
+        return self._whens
+
+    def retrieveDroppedWhens(self):
+        """
+        Returns the list of the names of the When objects that are not referenced by a Rule.
+        """
+        return self._droppedWhens
+
+    def explain(self):
+        """
+        Describe the plan (e.g. for CheckTeradataPackage --explain).
+
+        :returns: A description of the plan (String)
+        """
+        lines = ["Rule Plan: %d Whens, %d Rules (%d Whens dropped)" % (len(self._steps), len(self._rules),
+                                                                     len(self._droppedWhens))]
+        filter = None
+        for when, ruleIndexes in self._steps:
+            if when.filter != filter:
+                filter = when.filter
+                lines.append("  Filter %s" % filter)
+            lines.append("    When \"%s\" (%s %s \"%s\")" % (when.name, when.scope, when.type, when.value))
+            for ruleIndex in ruleIndexes:
+                rule = self._rules[ruleIndex]
+                lines.append("      Rule %d: Action \"%s\" (%s) %s" % (ruleIndex + 1, rule.action.name, rule.level,
+                                                                   rule.message))
+
+        if self._droppedWhens:
+            lines.append("  Dropped Whens (not referenced by a Rule)")
+            for whenName in self._droppedWhens:
+                lines.append("    When \"%s\"" % whenName)
+
+        return "\n".join(lines)
@@ -1,5 +1,6 @@
 
 import cba.teds.utils.Logger
+import re
 
 from cba.teds.teradata.qa.rules.Rule import *
 
@@ -12,6 +13,12 @@ class RuleReader(object):
 
     Create an object by passing in an XML file and a root node and then retrieve objects using the various
     retrieve* methods.
+
+    The rules are validated as they are read. A When or an Action that is incomplete (or has an invalid pattern) and a
+    Rule that refers to an unknown (or invalid) When or Action is reported (see retrieveErrors()) and left out.
+
+    A RuleReader can also be created from a compiled rule set (see compileRuleSet() and RuleSetCache) instead of the
+    XML file.
     """
 
     # TODO:  Some of these are in Enums (use the Enum values)
@@ -42,12 +49,14 @@ class RuleReader(object):
 
 
     # TODO:  Remove the default value
-    def __init__(self, ruleFile, parentNode="assembledTeradataPackageChecks"):
+    def __init__(self, ruleFile, parentNode="assembledTeradataPackageChecks", compiledRuleSet=None):
         """
         Constructor. Everything happens in the Constructor. The rule file is read and the objects are created.
 
         :param ruleFile: The relative (project root) path to the directory containing the rule file.
         :param parentNode: The name of the XML node that the whens/actions/rules are under.
+        :param compiledRuleSet: A compiled rule set (see compileRuleSet()) to create the objects from (the rule file
+                                is not read).
         :returns
         """
 
@@ -63,8 +72,12 @@ class RuleReader(object):
         self.__whens = {}
         self.__actions = {}
         self.__rules = []
+        self.__errors = []
 
-        self._readRules()
+        if compiledRuleSet is None:
+            self._readRules()
+        else:
+            self._loadCompiledRuleSet(compiledRuleSet)
 
     # PUBLIC METHODS #
 
@@ -83,6 +96,37 @@ class RuleReader(object):
         self.logger.debug("RuleReader.retrieveListOfRules()")
         return self.__rules
 
+    def retrieveErrors(self):
+        """
+        Returns a list of the errors (String) found in the rules (e.g. an invalid pattern or an unknown When).
+        """
+        self.logger.debug("RuleReader.retrieveErrors()")
+        return self.__errors
+
+    def compileRuleSet(self):
+        """
+        Compile the rules into a (JSON friendly) rule set that a RuleReader can be created from without reading (or
+        validating) the rule file again. The Rules refer to their When and Action by position.
+
+        The required literal of each pattern (see extractRequiredLiteral()) is part of the rule set so it isn't
+        extracted again. The patterns themselves are compiled again (compiled patterns can't be serialized).
+
+        :returns: A map of "whens", "actions", "rules" and "errors"
+        """
+        self.logger.debug("RuleReader.compileRuleSet()")
+
+        whenNames = list(self.__whens.keys())
+        actionNames = list(self.__actions.keys())
+
+        whens = [[when.name, when.value, when.type, when.scope, when.filter, when.literal]
+                 for when in self.__whens.values()]
+        actions = [[action.name, action.actionType, action.actionData, action.literal]
+                   for action in self.__actions.values()]
+        rules = [[whenNames.index(rule.when.name), actionNames.index(rule.action.name), rule.level, rule.message]
+                 for rule in self.__rules]
+
+        return {"whens": whens, "actions": actions, "rules": rules, "errors": list(self.__errors)}
+
     # PRIVATE METHODS #
 
     def _readRules(self):
@@ -95,13 +139,13 @@ class RuleReader(object):
             root = tree.getroot()
             for rootChild in root:
                 if rootChild.tag == self.__ASSEMBLED_TERADATA_PACKAGE_CHECKS:
-                    for child in rootChild.getchildren():
+                    for child in list(rootChild):
                         if child.tag == self.__WHENS:
-                            self._buildWhens(child.getchildren())
+                            self._buildWhens(list(child))
                         elif child.tag == self.__ACTIONS:
-                            self._buildActions(child.getchildren())
+                            self._buildActions(list(child))
                         elif child.tag == self.__QA_CHECK_RULES:
-                            self._buildRules(child.getchildren())
+                            self._buildRules(list(child))
 
         except Exception as exception:
             self.logger.error("Error in RuleReader.readRules(): %s", exception)
@@ -111,9 +155,16 @@ class RuleReader(object):
         Parse a list of WHEN nodes
         """
         for when in listOfWhen:
-            self.__whens[when.attrib[self.__NAME]] = When(when.attrib[self.__NAME], when.attrib[self.__VALUE],
-                                                          when.attrib[self.__TYPE], when.attrib[self.__SCOPE],
-                                                          when.attrib[self.__FILTER])
+            try:
+                self.__whens[when.attrib[self.__NAME]] = When(when.attrib[self.__NAME], when.attrib[self.__VALUE],
+                                                              when.attrib[self.__TYPE], when.attrib[self.__SCOPE],
+                                                              when.attrib[self.__FILTER])
+            except KeyError as keyError:
+                self._reportError("When %s has no %s attribute" % (when.attrib, keyError))
+            except re.error as patternError:
+                self._reportError("When '%s' has an invalid pattern (%s): %s" % (when.attrib[self.__NAME],
+                                                                                 when.attrib[self.__VALUE],
+                                                                                 patternError))
 
     def _buildActions(self, listOfActions):
         """
@@ -121,19 +172,70 @@ class RuleReader(object):
         """
         for action in listOfActions:
             actionType = self.__getActionType(action)
-            self.__actions[action.attrib[self.__NAME]] = Action(action.attrib[self.__NAME], actionType,
-                                                                action.attrib[actionType])
+            if actionType == "":
+                self._reportError("Action %s has an unknown Action Type" % action.attrib)
+                continue
+            try:
+                self.__actions[action.attrib[self.__NAME]] = Action(action.attrib[self.__NAME], actionType,
+                                                                    action.attrib[actionType])
+            except KeyError as keyError:
+                self._reportError("Action %s has no %s attribute" % (action.attrib, keyError))
+            except re.error as patternError:
+                self._reportError("Action '%s' has an invalid pattern (%s): %s" % (action.attrib[self.__NAME],
+                                                                                   action.attrib[actionType],
+                                                                                   patternError))
 
     def _buildRules(self, listOfRules):
         """
         Parse a list of RULE nodes
         """
         for rule in listOfRules:
-            whenName = rule.attrib[self.__WHEN]
-            actionName = rule.attrib[self.__ACTION]
-            when = self.__whens[whenName]
-            action = self.__actions[actionName]
-            self.__rules.append(Rule(when, action, rule.attrib[self.__LEVEL], rule.attrib[self.__MESSAGE]))
+            try:
+                whenName = rule.attrib[self.__WHEN]
+                actionName = rule.attrib[self.__ACTION]
+                level = rule.attrib[self.__LEVEL]
+                message = rule.attrib[self.__MESSAGE]
+            except KeyError as keyError:
+                self._reportError("Rule %s has no %s attribute" % (rule.attrib, keyError))
+                continue
+
+            when = self.__whens.get(whenName)
+            action = self.__actions.get(actionName)
+            if when is None:
+                self._reportError("Rule (%s) refers to an unknown (or invalid) When '%s'" % (message, whenName))
+            elif action is None:
+                self._reportError("Rule (%s) refers to an unknown (or invalid) Action '%s'" % (message, actionName))
+            else:
+                self.__rules.append(Rule(when, action, level, message))
+
+    def _loadCompiledRuleSet(self, compiledRuleSet):
+        """
+        Create the objects from a compiled rule set (see compileRuleSet())
+        """
+        whens = []
+        for name, value, type, scope, filter, literal in compiledRuleSet["whens"]:
+            when = When(name, value, type, scope, filter, extractLiteral=False)
+            when.literal = literal
+            whens.append(when)
+
+        actions = []
+        for name, actionType, actionData, literal in compiledRuleSet["actions"]:
+            action = Action(name, actionType, actionData, extractLiteral=False)
+            action.literal = literal
+            actions.append(action)
+
+        for when in whens:
+            self.__whens[when.name] = when
+        for action in actions:
+            self.__actions[action.name] = action
+        for whenIndex, actionIndex, level, message in compiledRuleSet["rules"]:
+            self.__rules.append(Rule(whens[whenIndex], actions[actionIndex], level, message))
+
+        self.__errors.extend(compiledRuleSet["errors"])
+
+    def _reportError(self, error):
+        self.logger.error("Error in RuleReader (%s): %s", self.__ruleFile, error)
+        self.__errors.append(error)
 
     def __getActionType(self, node):
         """
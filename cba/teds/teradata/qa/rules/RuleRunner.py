@@ -1,8 +1,144 @@
+import hashlib
+import io
+import multiprocessing
 import re
-from junit_xml import TestSuite, TestCase
-from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+import time
+from collections import OrderedDict
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import ArtifactKind, classifyArtifact
+from cba.teds.teradata.qa.artifacts.ArtifactReader import decodeArtifactBytes, iterateLines, readArtifactText
+from cba.teds.teradata.qa.artifacts.SharedArtifactContents import SharedArtifactContents
+from cba.teds.teradata.qa.rules.ActionMatcher import ActionMatcher
+from cba.teds.teradata.qa.rules.ActionMemo import ActionMemo
+from cba.teds.teradata.qa.rules.ArtifactCorpus import ArtifactCorpus, isCorpusWhen
+from cba.teds.teradata.qa.rules.ArtifactPrefetcher import ArtifactPrefetcher
+from cba.teds.teradata.qa.rules.ArtifactResult import ArtifactResult
+from cba.teds.teradata.qa.rules.HtmlReportWriter import HtmlReportWriter
+from cba.teds.teradata.qa.rules.JunitReportWriter import JunitReportWriter
+from cba.teds.teradata.qa.rules.LiteralMatcher import LiteralMatcher, isLiteralWhen
+from cba.teds.teradata.qa.rules.ResultCache import ResultCache
+from cba.teds.teradata.qa.rules.RulePlan import RulePlan
+from cba.teds.teradata.qa.rules.RuleSetCache import loadRuleSet
+from cba.teds.teradata.qa.rules.RuleStatistics import RuleStatistics
 from cba.teds.teradata.qa.rules.Rule import *
 
+def shortenArtifactName(artifactName):
+    """
+        Helper function to make the artifact name shorter (for the report) e.g.
+
+            From : resources/test//EXTRACTED_FILES_20150526161812/TERADATA\P_D_BAL_001\P_D_BAL_001_STD_0\P_D_BAL_001_STD_0.FACT_LEND_PAL_MNLY.tbl
+            TO   : \P_D_TXM_001\P_D_INP_001_STD_0\P_D_INP_001_STD_0.SB_69_1_1_F_CARD_BALN_MNLY.tbl
+
+        :param artifactName: The Artifact Name (i.e. a File Path for Assembled Package Checks)
+        :returns artifactName: The shortened Artifact Name
+    """
+    teradataDirectoryIndex = artifactName.find("TERADATA")
+    if teradataDirectoryIndex > -1:
+        artifactName = artifactName[teradataDirectoryIndex-1:]
+
+    dbaiDirectoryIndex = artifactName.find("DBAI")
+    if dbaiDirectoryIndex > -1:
+        artifactName = artifactName[dbaiDirectoryIndex-1:]
+
+    return artifactName
+
+
+# The Filter Type (WhenFilter) of each kind of artifact (in the order the Filter Types are applied)
+_FILTER_TYPES_BY_KIND = OrderedDict([(ArtifactKind.Table, WhenFilter.CreateTable),
+                                     (ArtifactKind.View, WhenFilter.CreateView),
+                                     (ArtifactKind.Comment, WhenFilter.CreateComment),
+                                     (ArtifactKind.AutoBackupTables, WhenFilter.CreateBackupTable),
+                                     (ArtifactKind.AutoBackupViews, WhenFilter.CreateBackupView)])
+
+
+def retrieveFilterTypesForArtifactKinds(artifactKinds):
+    """
+        Helper function to map the kinds of an artifact (see ArtifactIndex) to its Filter Types.
+
+        :param artifactKinds: A tuple of ArtifactKind (e.g. (ArtifactKind.Table,))
+        :returns filterTypes: A list of WhenFilter (e.g. [WhenFilter.CreateTable])
+    """
+    filterTypes = []
+    for artifactKind in artifactKinds:
+        filterType = _FILTER_TYPES_BY_KIND.get(artifactKind)
+        if filterType is not None:
+            filterTypes.append(filterType)
+
+    return filterTypes
+
+
+class PackageFacts(object):
+    """
+    PackageFacts is a lightweight (picklable) stand-in for an Artifacts object that answers the package-level
+    questions an Action can ask (i.e. the Change Request Number and the Teradata Keywords) and the ArtifactIndex of
+    the package (so the artifacts are not classified again).
+
+    It is handed to the worker processes when the rules are run in parallel (the Artifacts object itself owns the
+    extracted files and must stay in the parent process). If the artifacts are only held in memory (e.g. a
+    TarballPackage) their content is handed over as well (as SharedArtifactContents so that it isn't copied into each
+    worker process).
+    """
+
+    def __init__(self, changeRequestNumber, teradataKeywords, artifactContents = None, artifactIndex = None):
+        self._changeRequestNumber = changeRequestNumber
+        self._teradataKeywords = teradataKeywords
+        self._artifactContents = artifactContents
+        self._artifactIndex = artifactIndex
+
+    def retrieveArtifactIndex(self):
+        return self._artifactIndex
+
+    def retrieveChangeRequestNumber(self):
+        return self._changeRequestNumber
+
+    def retrieveTeradataKeywords(self):
+        return self._teradataKeywords
+
+    def retrieveArtifactContent(self, filePath):
+        if self._artifactContents is None:
+            with open(filePath, "rb") as file:
+                return file.read()
+        if filePath not in self._artifactContents:
+            raise IOError("Artifact Not Found: %s" % filePath)
+        return self._artifactContents[filePath]
+
+    def retrieveArtifactText(self, filePath):
+        if self._artifactContents is None:
+            return readArtifactText(filePath)
+        return decodeArtifactBytes(self.retrieveArtifactContent(filePath))
+
+    def retrieveInMemoryArtifacts(self):
+        return self._artifactContents
+
+
+# The RuleRunner of a worker process (see RuleRunner._runRulesInParallel())
+_workerRuleRunner = None
+
+
+def _initialiseWorker(rulesFile, packageFacts, cacheDirectory, collectStatistics, ruleSetHash):
+    global _workerRuleRunner
+    _workerRuleRunner = RuleRunner(rulesFile, packageFacts, collectWhenData=False, cacheDirectory=cacheDirectory,
+                                   collectStatistics=collectStatistics)
+
+    # The rule set hash (see _retrieveRuleSetHash()) is calculated once by the parent process
+    _workerRuleRunner._ruleSetHash = ruleSetHash
+
+
+def _evaluateArtifactInWorker(filePath):
+    findings, cached = _workerRuleRunner._retrieveArtifactFindings(filePath)
+
+    # The statistics of each artifact are handed back with its findings (and merged by the parent process)
+    statistics = None
+    if _workerRuleRunner._statistics is not None:
+        statistics = _workerRuleRunner._statistics.drain()
+
+    # The same goes for the hits (and misses) of the ActionMemo
+    memoHits = None
+    if _workerRuleRunner._actionMemo is not None:
+        memoHits = _workerRuleRunner._actionMemo.drainHits()
+
+    return findings, cached, statistics, memoHits
+
+
 class RuleRunner(object):
     """
     The RuleRunner class was designed to be used by a Artifacts implementation class (e.g. AssembledPackage) to run
@@ -20,9 +156,59 @@ class RuleRunner(object):
     NOTE:  The XML output is transformed (by TeamCity) using resources/teradataQualityCheckTransform.xsl.
     NOTE:  Maps/Sets are used to help optimise the implementation.
     NOTE:  There are a couple of hard-coded rules (i.e. _runObjectCountRules() and _recordChangeNumber()).
+    NOTE:  The rules are evaluated according to a RulePlan i.e. the Whens that are not referenced by a rule are not
+           evaluated and the data of each When is visited once with all of its Actions (see explainPlan()). The
+           patternMatch Actions of a When are searched for with one ActionMatcher (one search instead of one per
+           Action).
+    NOTE:  The results of the Actions are memoized (see ActionMemo) so that the same data (e.g. the same line in many
+           generated tables) is only evaluated once. The hit rate is logged by runRules().
+    NOTE:  The content of an artifact that was found to be binary, oversized or non-text when the package was indexed
+           (see ArtifactSniffer) is not scanned (only its File Path is checked). Each one is recorded (as information)
+           in the report.
+    NOTE:  If jobs > 1 the data is not collected by the Constructor. Instead runRules() splits the artifacts across
+           a pool of worker processes that each collect the data and evaluate the rules for their share of the
+           artifacts. The results are merged in the same order as a serial run (so the report is identical).
+    NOTE:  If streaming is True the data is not collected by the Constructor either. Instead runRules() collects the
+           data for one artifact at a time, evaluates the rules against it and records the results straight away
+           (nothing is kept in the When.data lists) so memory is bounded by the largest artifact (not the package).
+    NOTE:  If a cacheDirectory is specified the findings for each artifact are kept in a ResultCache (keyed on the
+           rule set and the content of the artifact) so unchanged artifacts are not scanned again by the next run.
+           The cache implies streaming (or parallel) evaluation.
+    NOTE:  If collectStatistics is True the time spent (and the work done) by each When and each Action is recorded
+           in a RuleStatistics object and reported as properties of the JUnit test suite (see generateReport()).
+    NOTE:  If corpus is True the LINE pattern Whens of each filter group are searched for in one ArtifactCorpus (the
+           content of every artifact of the group) instead of line by line. This only applies when the When data is
+           collected in this process (i.e. not streaming or parallel).
+    NOTE:  If prefetch is > 0 the artifacts are read ahead (up to prefetch artifacts) by readers background threads
+           while the rules are evaluated (see ArtifactPrefetcher) when the When data is collected in this process.
     """
 
-    def __init__(self, rulesFile, assembledPackage = None):
+    # Change this to invalidate every ResultCache entry (e.g. when the findings are calculated differently)
+    RESULT_CACHE_VERSION = 2
+
+    def __init__(self, rulesFile, assembledPackage = None, jobs = 1, collectWhenData = True, streaming = False,
+                 cacheDirectory = None, collectStatistics = False, ruleReader = None, corpus = False, prefetch = 0,
+                 readers = 1, actionMemoSize = ActionMemo.DEFAULT_MAX_SIZE):
+        """
+        RuleRunner Constructor.
+
+        :param rulesFile: The relative (project root) path to the rules (XML) file.
+        :param assembledPackage: Our Artifacts object (AssembledPackage).
+        :param jobs: The number of worker processes used to run the rules (1 = run the rules in this process).
+        :param collectWhenData: Set to False to skip collecting the data (e.g. a worker process).
+        :param streaming: Set to True to evaluate the rules one artifact at a time (see runRules()).
+        :param cacheDirectory: The path of a directory for a ResultCache (None = don't cache the findings).
+        :param collectStatistics: Set to True to record the time spent (and the work done) by each When and Action.
+        :param ruleReader: A RuleReader that has already read the rulesFile (None = load the rulesFile, see
+                           RuleSetCache.loadRuleSet()). It can only be
+                           shared by RuleRunners that don't collect the When data (e.g. streaming).
+        :param corpus: Set to True to search for the LINE pattern Whens across all of the artifacts of each filter group
+                       at once (see ArtifactCorpus) when the When data is collected.
+        :param prefetch: The number of artifacts that are read ahead of the evaluation when the When data is collected
+                         (0 = read each artifact when it is evaluated).
+        :param readers: The number of (background) reader threads if the artifacts are read ahead.
+        :param actionMemoSize: The maximum number of Action results that are memoized (0 = don't memoize).
+        """
 
         # Initialize Logging
         self.logger = cba.teds.utils.Logger.getLogger()
@@ -31,24 +217,64 @@ class RuleRunner(object):
         self.logger.debug("Create: RuleRunner(%s, %s)", rulesFile, assembledPackage)
 
         # e.g. rulesFile = "resources/newTeradataQualityCheckRules.xml"
-        ruleReader = RuleReader(rulesFile)
+        if ruleReader is None:
+            ruleReader = loadRuleSet(rulesFile)
 
         self._assembledPackage = assembledPackage
+        self._artifactIndex = assembledPackage.retrieveArtifactIndex() if assembledPackage is not None else None
+        self._rulesFile = rulesFile
+        self._jobs = max(1, jobs)
+        self._streaming = streaming or cacheDirectory is not None
+        self._corpus = corpus
+        self._prefetch = prefetch
+        self._readers = readers
+
+        self._cacheDirectory = cacheDirectory
+        self._resultCache = ResultCache(cacheDirectory) if cacheDirectory is not None else None
+        self._ruleSetHash = None
+        self._changeRequestRuleSetHash = None
+        self._changeRequestFilters = None # set of the filter groups with a rule that depends on the CR Number
 
-        self._whens = ruleReader.retrieveListOfWhenConditions()
         self._actions = ruleReader.retrieveListOfActions()
         self._rules = ruleReader.retrieveListOfRules()
 
-        self._testCases = {} # map keyed on artifact name
+        # Only the Whens that are referenced by a rule are evaluated
+        whenConditions = ruleReader.retrieveListOfWhenConditions()
+        self._plan = RulePlan(whenConditions, self._rules)
+        self._whens = self._plan.retrieveWhens()
+
+        # The filter types of every When in the rules file (a filter type whose Whens were all dropped by the plan is
+        # not an invalid filter type, see _retrieveFilterGroupsForArtifact())
+        self._ruleSetFilters = set(when.filter for when in whenConditions.values())
+
+        self._statistics = None
+        if collectStatistics:
+            self._statistics = RuleStatistics(list(self._whens.keys()),
+                                              [action.name for action in self._actions.values()])
+
+        self._testCases = OrderedDict() # map keyed on artifact name
+        self._testCaseOrder = {} # map keyed on artifact name (see _recordArtifactFindings())
 
         self._filterMaps = {}
         self._scopeMaps = {}
+        self._literalMatchers = {} # map keyed on filter type
+        self._actionMatchers = {} # map keyed on When object
+
+        self._actionMemo = ActionMemo(actionMemoSize) if actionMemoSize > 0 else None
+        self._actionPackageFacts = {} # map keyed on action type (see _retrieveActionPackageFact())
 
         # Build When Maps (scopeMaps and filterMaps)
         self._buildWhenMaps()
 
+        # Compile the literal Whens of each filter group into a LiteralMatcher
+        self._buildLiteralMatchers()
+
+        # Compile the patternMatch Actions of each When into an ActionMatcher
+        self._buildActionMatchers()
+
         # Collect when data from the assembledPackage if when condition is matched
-        self._buildWhenDataFromAssembledPackage(assembledPackage)
+        if collectWhenData and self._jobs == 1 and not self._streaming:
+            self._buildWhenDataFromAssembledPackage(assembledPackage)
 
     # PUBLIC METHODS
 
@@ -67,33 +293,45 @@ class RuleRunner(object):
         self._recordChangeNumber()
 
         # Rules from XML File
-        for rule in self._rules:
+        if self._jobs > 1 or self._streaming:
+            if self._jobs > 1:
+                self._runRulesInParallel()
+            else:
+                self._runRulesStreaming()
+            self._recordSkippedArtifacts()
+
+            if self._resultCache is not None:
+                self._resultCache.logHitRate()
+                self._resultCache.evict()
+            if self._actionMemo is not None:
+                self._actionMemo.logHitRate()
+            return
+
+        # Each When Data is visited once (with all of the Actions of the When), the results are then recorded rule by
+        # rule (and When Data by When Data) so the test cases are created (and filled) in the order of the rules
+        findingsByRule = [[] for rule in self._rules]
+        for when, ruleIndexes in self._plan.retrieveSteps():
+            for whenData in when.data:
+                artifactName = shortenArtifactName(whenData.artifactName)
+                # Execute actions
+                actionsRequired = self._executeActions(when, ruleIndexes, whenData.data)
+                for ruleIndex, actionRequired in zip(ruleIndexes, actionsRequired):
+                    findingsByRule[ruleIndex].append((artifactName, actionRequired))
+
+        for ruleIndex, rule in enumerate(self._rules):
             message = rule.message
             level = rule.level
 
-            for whenData in rule.when.data:
-                artifactName = whenData.artifactName
-
-                """
-                    Make the artifact name shorter e.g
-                        From : resources/test//EXTRACTED_FILES_20150526161812/TERADATA\P_D_BAL_001\P_D_BAL_001_STD_0\P_D_BAL_001_STD_0.FACT_LEND_PAL_MNLY.tbl
-                        TO   : \P_D_TXM_001\P_D_INP_001_STD_0\P_D_INP_001_STD_0.SB_69_1_1_F_CARD_BALN_MNLY.tbl
-                """
-                teradataDirectoryIndex = artifactName.find("TERADATA")
-                if teradataDirectoryIndex > -1:
-                    artifactName = artifactName[teradataDirectoryIndex-1:]
-
-                dbaiDirectoryIndex = artifactName.find("DBAI")
-                if dbaiDirectoryIndex > -1:
-                    artifactName = artifactName[dbaiDirectoryIndex-1:]
-
+            for artifactName, actionRequired in findingsByRule[ruleIndex]:
                 testCase = self._retrieveTestCase(artifactName)
-
-                # Execute action
-                actionRequired = rule.action.executeAction(whenData.data, self._assembledPackage)
                 if actionRequired:
                     self._recordTestResult(testCase, message, level)
 
+        self._recordSkippedArtifacts()
+
+        if self._actionMemo is not None:
+            self._actionMemo.logHitRate()
+
     def generateReport(self, junitFileName):
         """
         This is the public interface to generate the Junit Report for the Teradata Quality Checks
@@ -103,17 +341,404 @@ class RuleRunner(object):
 
         self.logger.debug("Create: RuleRunner.generateReport (%s)" % junitFileName)
 
-        testSuite = TestSuite("Teradata Package Check")
-        for testCaseName in self._testCases:
-            testCase = self._testCases.get(testCaseName)
-            testSuite.test_cases.append(testCase)
-
         with open(junitFileName, "w") as reportFile:
-            TestSuite.to_file(reportFile, [testSuite])
-        reportFile.close()
+            self._writeReport(reportFile)
+
+    def generateReportXml(self):
+        """
+        This is the public interface to generate the Junit Report for the Teradata Quality Checks as a String
+        :return: the Junit Report (XML)
+        """
+
+        self.logger.debug("Create: RuleRunner.generateReportXml")
+
+        reportFile = io.StringIO()
+        self._writeReport(reportFile)
+        return reportFile.getvalue()
+
+    def generateHtmlReport(self, htmlFileName, branchName = "", qaBuildId = "", qaBuildTime = "", packagerBuildId = ""):
+        """
+        This is the public interface to generate the Quality Check Report (HTML) straight from the results (see
+        HtmlReportWriter) i.e. without the JUnit Report and the XSLT
+        :param htmlFileName: the file path of the html file
+        :param branchName: the branch that was packaged
+        :param qaBuildId: the (TeamCity) build id of the Quality Checks
+        :param qaBuildTime: the time of the Quality Checks
+        :param packagerBuildId: the (TeamCity) build id of the Packaging build
+        :return:
+        """
+
+        self.logger.debug("Create: RuleRunner.generateHtmlReport (%s)" % htmlFileName)
+
+        testCases = list(self._testCases.values())
+        with open(htmlFileName, "w", encoding="ascii") as reportFile:
+            HtmlReportWriter(reportFile, branchName, qaBuildId, qaBuildTime, packagerBuildId).writeReport(
+                [("Teradata Package Check", len(testCases), testCases)])
+
+    def explainPlan(self):
+        """
+        This is the public interface to describe the plan (see RulePlan) that the rules are evaluated by
+        :return: A description of the plan (String)
+        """
+        return self._plan.explain()
+
+    def retrieveTestCases(self):
+        """
+        This is the public interface to retrieve the results i.e. a Test Case for each Artifact (in report order)
+        :return: a list of Test Cases (see ArtifactResult)
+        """
+
+        return list(self._testCases.values())
+
+    def writeStatistics(self, statsFileName):
+        """
+        This is the public interface to write the statistics (see RuleStatistics) to a (JSON) stats file
+        :param statsFileName: the file path of the stats file
+        :return:
+        """
+
+        self.logger.debug("Create: RuleRunner.writeStatistics (%s)" % statsFileName)
+
+        if self._statistics is None:
+            self.logger.warn("Statistics were not collected (see collectStatistics)")
+            return
+
+        self._statistics.writeStatistics(statsFileName)
 
     # PRIVATE METHODS
 
+    def _runRulesInParallel(self):
+        """
+            This function evaluates the rules (from the XML File) using a pool of worker processes.
+
+            Each worker evaluates the Whens and Actions for its share of the artifacts (see _evaluateArtifact()) and
+            returns a compact list of (rule index, number of times the action is required) for each artifact. The
+            results are then replayed rule by rule (and artifact by artifact) i.e. in the same order as the serial
+            implementation in runRules() so the test cases (and the report) are identical.
+
+            The workers read the extracted files themselves. Artifacts that are only held in memory are put in shared
+            memory once (see SharedArtifactContents) rather than being pickled for each worker.
+        """
+        self.logger.debug("Create: RuleRunner._runRulesInParallel (%d jobs)", self._jobs)
+
+        fileList = self._assembledPackage.retrieveAssembledPackageFilesList()
+
+        sharedArtifactContents = None
+        inMemoryArtifacts = self._assembledPackage.retrieveInMemoryArtifacts()
+        if inMemoryArtifacts is not None:
+            sharedArtifactContents = SharedArtifactContents(inMemoryArtifacts)
+
+        try:
+            # The extracted files stay with the Artifacts object, the workers just need the package-level facts
+            packageFacts = self._retrievePackageFacts(sharedArtifactContents)
+
+            ruleSetHash = self._retrieveRuleSetHash() if self._resultCache is not None else None
+
+            chunkSize = max(1, len(fileList) // (self._jobs * 4))
+            pool = multiprocessing.Pool(self._jobs, _initialiseWorker, (self._rulesFile, packageFacts,
+                                                                        self._cacheDirectory,
+                                                                        self._statistics is not None, ruleSetHash))
+            try:
+                artifactFindings = pool.map(_evaluateArtifactInWorker, fileList, chunkSize)
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            if sharedArtifactContents is not None:
+                sharedArtifactContents.release()
+
+        findingsByRule = [[] for rule in self._rules]
+        for fileIndex, (findings, cached, statistics, memoHits) in enumerate(artifactFindings):
+            if self._resultCache is not None and cached is not None:
+                self._resultCache.recordHit(cached)
+            if self._statistics is not None and statistics is not None:
+                self._statistics.merge(statistics)
+            if self._actionMemo is not None and memoHits is not None:
+                self._actionMemo.recordHits(*memoHits)
+            for ruleIndex, actionRequiredCount in findings:
+                findingsByRule[ruleIndex].append((fileIndex, actionRequiredCount))
+
+        for ruleIndex, rule in enumerate(self._rules):
+            for fileIndex, actionRequiredCount in findingsByRule[ruleIndex]:
+                testCase = self._retrieveTestCase(shortenArtifactName(fileList[fileIndex]))
+                for count in range(actionRequiredCount):
+                    self._recordTestResult(testCase, rule.message, rule.level)
+
+    def _runRulesStreaming(self):
+        """
+            This function evaluates the rules (from the XML File) one artifact at a time.
+
+            The when data for an artifact is collected, passed through the actions and recorded in the test cases as
+            soon as it is produced (and then discarded). Test cases are put back in the order that the serial
+            implementation in runRules() creates them once every artifact has been evaluated.
+        """
+        self.logger.debug("Create: RuleRunner._runRulesStreaming")
+
+        fileList = self._assembledPackage.retrieveAssembledPackageFilesList()
+        for fileIndex, filePath in enumerate(fileList):
+            findings, cached = self._retrieveArtifactFindings(filePath)
+            self._recordArtifactFindings(fileIndex, filePath, findings)
+
+        self._orderTestCases()
+
+    def _recordArtifactFindings(self, fileIndex, filePath, findings):
+        """
+            This function records the findings (see _evaluateArtifact()) for a single artifact in the test cases.
+
+            The serial implementation in runRules() creates test cases rule by rule (and artifact by artifact) so the
+            position of each test case is remembered as the lowest (rule index, file index) that touched it.
+        """
+        artifactName = shortenArtifactName(filePath)
+        for ruleIndex, actionRequiredCount in findings:
+            testCase = self._retrieveTestCase(artifactName)
+
+            testCaseOrder = (ruleIndex, fileIndex)
+            if artifactName not in self._testCaseOrder or testCaseOrder < self._testCaseOrder[artifactName]:
+                self._testCaseOrder[artifactName] = testCaseOrder
+
+            rule = self._rules[ruleIndex]
+            for count in range(actionRequiredCount):
+                self._recordTestResult(testCase, rule.message, rule.level)
+
+    def _orderTestCases(self):
+        """
+            This function sorts the test cases by the position remembered in _recordArtifactFindings(). Test cases
+            without a position (i.e. the hard-coded rules) stay at the top (in the order they were created).
+        """
+        testCaseNames = sorted(self._testCases, key=lambda testCaseName: self._testCaseOrder.get(testCaseName, (-1, -1)))
+        self._testCases = OrderedDict((testCaseName, self._testCases[testCaseName]) for testCaseName in testCaseNames)
+
+    def _writeReport(self, reportFile):
+        """
+            This function writes the (JUnit) Test Suite of the results (and the statistics if they are collected) one
+            Test Case at a time (see JunitReportWriter)
+        """
+        properties = None
+        if self._statistics is not None:
+            properties = self._statistics.buildProperties()
+
+        JunitReportWriter(reportFile).writeTestSuite("Teradata Package Check", list(self._testCases.values()),
+                                                     properties)
+
+    def _retrievePackageFacts(self, artifactContents=None):
+        """
+            This function retrieves the package-level facts that the actions of the rules depend on (see PackageFacts).
+
+        :param artifactContents: The content of the in-memory artifacts to hand over (None = the in-memory artifacts
+                                 of the Artifacts object, if any).
+        """
+        actionTypes = set(rule.action.actionType for rule in self._rules)
+
+        changeRequestNumber = None
+        if ActionType.ContainsCrNumber.value in actionTypes:
+            changeRequestNumber = self._assembledPackage.retrieveChangeRequestNumber()
+
+        teradataKeywords = None
+        if ActionType.ContainsTeradataKeywords.value in actionTypes:
+            teradataKeywords = self._assembledPackage.retrieveTeradataKeywords()
+
+        if artifactContents is None:
+            artifactContents = self._assembledPackage.retrieveInMemoryArtifacts()
+
+        return PackageFacts(changeRequestNumber, teradataKeywords, artifactContents, self._artifactIndex)
+
+    def _retrieveRuleSetHash(self):
+        """
+            This function retrieves a hash that identifies the rule set (the rules file and the Teradata Keywords
+            that the actions depend on) for the ResultCache keys. The Change Request Number is only added for the
+            artifacts that it matters to (see _retrieveArtifactRuleSetHash()).
+        """
+        if self._ruleSetHash is None:
+            ruleSetHash = hashlib.sha1(("RESULT_CACHE_VERSION:%d|" % self.RESULT_CACHE_VERSION).encode("utf-8"))
+            with open(self._rulesFile, "rb") as rulesFile:
+                ruleSetHash.update(rulesFile.read())
+
+            packageFacts = self._retrievePackageFacts()
+            if packageFacts.retrieveTeradataKeywords() is not None:
+                ruleSetHash.update(("|KEYWORDS:%s" % "|".join(packageFacts.retrieveTeradataKeywords())).encode("utf-8"))
+
+            self._ruleSetHash = ruleSetHash.hexdigest()
+
+        return self._ruleSetHash
+
+    def _retrieveArtifactRuleSetHash(self, filePath):
+        """
+            This function retrieves the rule set hash (see _retrieveRuleSetHash()) for the ResultCache key of an
+            artifact. The Change Request Number is part of it only if a rule that depends on it (i.e. a
+            containsCrNumber Action) applies to the artifact, so a new Change Request doesn't invalidate the findings
+            of every other artifact.
+        """
+        if self._changeRequestFilters is None:
+            self._changeRequestFilters = set()
+            for when, ruleIndexes in self._plan.retrieveSteps():
+                if any(self._rules[ruleIndex].action.actionType == ActionType.ContainsCrNumber.value
+                       for ruleIndex in ruleIndexes):
+                    self._changeRequestFilters.add(when.filter)
+
+        if not self._changeRequestFilters.intersection(self._retrieveFilterGroupsForArtifact(filePath)):
+            return self._retrieveRuleSetHash()
+
+        if self._changeRequestRuleSetHash is None:
+            changeRequestRuleSetHash = "%s|CR_NUMBER:%s" % (self._retrieveRuleSetHash(),
+                                                             self._assembledPackage.retrieveChangeRequestNumber())
+            self._changeRequestRuleSetHash = hashlib.sha1(changeRequestRuleSetHash.encode("utf-8")).hexdigest()
+
+        return self._changeRequestRuleSetHash
+
+    def _retrieveArtifactFindings(self, filePath):
+        """
+            This function retrieves the findings for a single artifact (see _evaluateArtifact()) from the ResultCache
+            or (if they aren't in the cache) evaluates the artifact and stores the findings in the ResultCache.
+
+        :param filePath: The Artifact Name (i.e. a File Path for Assembled Package Checks).
+        :return: A tuple of the findings and a flag that is True for a cache hit, False for a cache miss or None if
+                 the cache wasn't used.
+        """
+        # If the file extension is zip or tar file, there is nothing to evaluate (or cache)
+        if self._resultCache is None or filePath.endswith(".gz") or filePath.endswith(".tar"):
+            return self._evaluateArtifact(filePath), None
+
+        # Nor is there any point reading an artifact whose content is not scanned
+        if self._isSkippedArtifact(filePath):
+            return self._evaluateArtifact(filePath), None
+
+        try:
+            content = self._readArtifactContent(filePath)
+        except (IOError, OSError):
+            return self._evaluateArtifact(filePath), None
+
+        key = ResultCache.buildKey(self._retrieveArtifactRuleSetHash(filePath), shortenArtifactName(filePath), content)
+        findings = self._resultCache.retrieveFindings(key)
+        if findings is not None:
+            return findings, True
+
+        findings = self._evaluateArtifact(filePath, content)
+        self._resultCache.storeFindings(key, findings)
+        return findings, False
+
+    def _evaluateArtifact(self, filePath, content=None):
+        """
+            This function collects the when data for a single artifact and evaluates the rules against it (without
+            touching the When.data lists).
+
+        :param filePath: The Artifact Name (i.e. a File Path for Assembled Package Checks).
+        :param content: The content (bytes) of the artifact if it has already been read (None = read the file).
+        :return: A list of (rule index, number of times the action is required) for each rule with when data.
+        """
+        filterGroups = self._retrieveFilterGroupsForArtifact(filePath)
+        artifactWhenData = self._scanArtifact(filePath, self._retrieveWhensForFilterGroups(filterGroups),
+                                              self._retrieveLiteralMatchersForFilterGroups(filterGroups), content)
+
+        findings = []
+        for when, ruleIndexes in self._plan.retrieveSteps():
+            whenDataList = artifactWhenData.get(when)
+            if whenDataList:
+                actionRequiredCounts = [0] * len(ruleIndexes)
+                for whenData in whenDataList:
+                    actionsRequired = self._executeActions(when, ruleIndexes, whenData.data)
+                    for position, actionRequired in enumerate(actionsRequired):
+                        if actionRequired:
+                            actionRequiredCounts[position] += 1
+                findings.extend(zip(ruleIndexes, actionRequiredCounts))
+
+        # The findings are in the order of the rules (see _recordArtifactFindings())
+        findings.sort()
+        return findings
+
+    def _executeActions(self, when, ruleIndexes, data):
+        """
+            This function executes the Actions of the rules of a When (see RulePlan) against the data (String) of a
+            When Data. The patternMatch Actions are resolved by the ActionMatcher of the When (if there is one).
+
+        :return: A list of flags (one for each rule) that are True if the action is required
+        """
+        actionMatcher = self._actionMatchers.get(when)
+        if actionMatcher is None:
+            return [self._executeAction(self._rules[ruleIndex].action, data) for ruleIndex in ruleIndexes]
+
+        started = time.perf_counter() if self._statistics is not None else 0.0
+        key = self._actionMemo.buildKey(actionMatcher, data) if self._actionMemo is not None else None
+        matchedActions = self._actionMemo.retrieveResult(key) if key is not None else None
+        if matchedActions is None:
+            matchedActions = actionMatcher.match(data)
+            if key is not None:
+                self._actionMemo.storeResult(key, matchedActions)
+        matcherTime = (time.perf_counter() - started) / len(actionMatcher.actions) if self._statistics is not None else 0.0
+
+        actionsRequired = []
+        for ruleIndex in ruleIndexes:
+            action = self._rules[ruleIndex].action
+            if action in actionMatcher.actions:
+                # A patternMatch Action is required if its pattern is not found
+                actionRequired = action not in matchedActions
+                if self._statistics is not None:
+                    self._statistics.recordAction(action.name, matcherTime, 1, 1 if actionRequired else 0)
+            else:
+                actionRequired = self._executeAction(action, data)
+            actionsRequired.append(actionRequired)
+
+        return actionsRequired
+
+    def _executeAction(self, action, data):
+        """
+            This function executes an Action against the data (String) of a When Data (and records the statistics for
+            the Action). The result is memoized (see ActionMemo) along with the package-level fact (if any) that the
+            Action depends on.
+        """
+        started = time.perf_counter() if self._statistics is not None else 0.0
+
+        key = None
+        if self._actionMemo is not None:
+            key = self._actionMemo.buildKey(action, data, self._retrieveActionPackageFact(action))
+        actionRequired = self._actionMemo.retrieveResult(key) if key is not None else None
+        if actionRequired is None:
+            actionRequired = action.executeAction(data, self._assembledPackage)
+            if key is not None:
+                self._actionMemo.storeResult(key, actionRequired)
+
+        if self._statistics is not None:
+            self._statistics.recordAction(action.name, time.perf_counter() - started, 1, 1 if actionRequired else 0)
+        return actionRequired
+
+    def _retrieveActionPackageFact(self, action):
+        """
+            This function retrieves the package-level fact (i.e. the Change Request Number or the Teradata Keywords)
+            that the result of an Action depends on (None if it only depends on the data)
+        """
+        if action.actionType not in (ActionType.ContainsCrNumber.value, ActionType.ContainsTeradataKeywords.value):
+            return None
+
+        if action.actionType not in self._actionPackageFacts:
+            if action.actionType == ActionType.ContainsCrNumber.value:
+                packageFact = self._assembledPackage.retrieveChangeRequestNumber()
+            else:
+                packageFact = self._assembledPackage.retrieveTeradataKeywords()
+            self._actionPackageFacts[action.actionType] = packageFact
+
+        return self._actionPackageFacts[action.actionType]
+
+    def _isSkippedArtifact(self, filePath):
+        """
+            This function checks whether the content of an artifact is skipped i.e. it was found to be binary,
+            oversized or non-text when the package was indexed (see ArtifactSniffer)
+        """
+        return self._artifactIndex is not None and self._artifactIndex.retrieveSkipReason(filePath) is not None
+
+    def _recordSkippedArtifacts(self):
+        """
+            This function records (as information) that the content of each skipped artifact was not checked. It is
+            called once the rules have been evaluated so the test cases are in the same order whichever way the rules
+            were evaluated.
+        """
+        if self._artifactIndex is None:
+            return
+
+        for filePath in self._artifactIndex.retrieveSkippedFilePaths():
+            testCase = self._retrieveTestCase(shortenArtifactName(filePath))
+            skipReason = self._artifactIndex.retrieveSkipReason(filePath)
+            informationMessage = "The content of this artifact was not checked (%s)" % skipReason.value
+            self._recordTestResult(testCase, informationMessage, RuleLevel.Information.value)
+
     def _recordChangeNumber(self):
         crNumber = self._assembledPackage.retrieveChangeRequestNumber()
         testCase = self._retrieveTestCase(".Change Record Number")
@@ -204,35 +829,315 @@ class RuleRunner(object):
         # Add when to filterMap (inner) map
         filterMap[whenKey] = self._whens[whenKey]
 
+    def _buildLiteralMatchers(self):
+        """
+            This function compiles the literal (CONTAINS and BEGINS_WITH) Whens of each filter group (see filterMaps)
+            into one LiteralMatcher so that each line is inspected once no matter how many literal Whens exist
+        """
+        self.logger.debug("Create: RuleRunner._buildLiteralMatchers")
+        for filter in self._filterMaps:
+            literalWhens = [when for when in self._filterMaps[filter].values() if isLiteralWhen(when)]
+            if literalWhens:
+                self._literalMatchers[filter] = LiteralMatcher(literalWhens)
+
+    def _buildActionMatchers(self):
+        """
+            This function compiles the patternMatch Actions of the rules of each When (see RulePlan) into one
+            ActionMatcher so that each When Data is searched once no matter how many patternMatch Actions there are
+        """
+        self.logger.debug("Create: RuleRunner._buildActionMatchers")
+        for when, ruleIndexes in self._plan.retrieveSteps():
+            actionMatcher = ActionMatcher([self._rules[ruleIndex].action for ruleIndex in ruleIndexes])
+            if len(actionMatcher.actions) > 1:
+                self._actionMatchers[when] = actionMatcher
+
     def _buildWhenDataFromAssembledPackage(self, assembledPackage):
         """
             This function will scan all the files from the assembledPackage
             and populate when data (if when condition is matched)
+
+            Each file is read exactly once (see _scanArtifact()) and every applicable When is evaluated during that
+            single read. If prefetch is > 0 the files are read ahead by background threads (see ArtifactPrefetcher)
+            and the time spent waiting for them (I/O) versus evaluating the Whens is logged.
         :param assembledPackage:
         :return:
         """
         self.logger.debug("Create: RuleRunner._buildWhenDataFromAssembledPackage")
 
+        # The LINE pattern Whens of each filter group are searched for in an ArtifactCorpus (see isCorpusWhen())
+        corpora = {}
+        corpusWhens = {}
+        if self._corpus:
+            for filter in self._filterMaps:
+                whens = [when for when in self._filterMaps[filter].values() if isCorpusWhen(when)]
+                if whens:
+                    corpora[filter] = ArtifactCorpus()
+                    corpusWhens[filter] = whens
+
         fileList = assembledPackage.retrieveAssembledPackageFilesList()
-        for filePath in fileList:
 
-            ## setup for ALL files
-            allFillterWhenMap = self._filterMaps.get("ALL")
-            for allWhenName in allFillterWhenMap:
-                self._buildWhenData(filePath, allFillterWhenMap.get(allWhenName))
+        prefetcher = None
+        if self._prefetch > 0 and len(fileList) > 0:
+            prefetcher = ArtifactPrefetcher(fileList, self._prefetchArtifactText, self._prefetch, self._readers)
+        evaluationTime = 0.0
+
+        try:
+            for filePath in fileList:
+                text = None
+                if prefetcher is not None:
+                    filePath, text = prefetcher.retrieveNextArtifact()
+                started = time.perf_counter()
+
+                filterGroups = self._retrieveFilterGroupsForArtifact(filePath)
+                whens = self._retrieveWhensForFilterGroups(filterGroups)
+
+                # The artifact is read here (once) so that it can be added to the corpora, the corpus Whens are then
+                # left out of the scan (an archive, a skipped artifact or an artifact that can't be read is scanned as
+                # usual)
+                corpusGroups = [filterGroup for filterGroup in filterGroups if filterGroup in corpora]
+                if corpusGroups and not (filePath.endswith(".gz") or filePath.endswith(".tar")
+                                         or self._isSkippedArtifact(filePath)):
+                    if text is None:
+                        try:
+                            text = self._readArtifactText(filePath)
+                        except Exception:
+                            text = None
+                    if text is not None:
+                        excludedWhens = set()
+                        for filterGroup in corpusGroups:
+                            corpora[filterGroup].appendArtifact(filePath, text)
+                            excludedWhens.update(corpusWhens[filterGroup])
+                        whens = [when for when in whens if when not in excludedWhens]
+
+                artifactWhenData = self._scanArtifact(filePath, whens,
+                                                      self._retrieveLiteralMatchersForFilterGroups(filterGroups),
+                                                      text=text)
+                for when in artifactWhenData:
+                    when.data.extend(artifactWhenData[when])
+
+                evaluationTime += time.perf_counter() - started
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+
+        if prefetcher is not None:
+            self.logger.info(" Prefetch       = %.3f seconds waiting on I/O, %.3f seconds evaluating (%d artifacts, depth = %d, readers = %d)"
+                             % (prefetcher.waitTime, evaluationTime, len(fileList), self._prefetch, self._readers))
+
+        for filter in corpora:
+            corpus = corpora[filter]
+            for when in corpusWhens[filter]:
+                started = time.perf_counter()
+                whenData = corpus.findWhenData(when)
+                when.data.extend(whenData)
+                if self._statistics is not None:
+                    self._statistics.recordWhen(when.name, time.perf_counter() - started,
+                                                corpus.retrieveArtifactCount(), corpus.retrieveLineCount(),
+                                                len(whenData))
+
+    def _retrieveFilterGroupsForArtifact(self, filePath):
+        """
+        This function will retrieve the list of filter groups (i.e. keys of the filterMaps) that apply to a specified
+        Artifact i.e. the ALL filter followed by each of the Filter Types of the Artifact.
+
+        :param filePath:  The Artifact Name (i.e. a File Path for Assembled Package Checks).
+        :return:  A List of Filter Type values (String).
+        """
+
+        filterGroups = []
+
+        ## setup for ALL files
+        if WhenFilter.All.value in self._filterMaps:
+            filterGroups.append(WhenFilter.All.value)
+
+        # we need to know if we care about file
+        # retrieve a list of filterType(s) of the file
+        for filterType in self._retrieveFilterTypesForArtifact(filePath):
+            if filterType.value in self._filterMaps:
+                filterGroups.append(filterType.value)
+            elif filterType.value not in self._ruleSetFilters:
+                self.logger.warn("Invalid Filter Type : %s", filterType.value)
+
+        return filterGroups
+
+    def _retrieveWhensForArtifact(self, filePath):
+        """
+        This function will retrieve the list of When objects that apply to a specified Artifact.
+
+        :param filePath:  The Artifact Name (i.e. a File Path for Assembled Package Checks).
+        :return:  A List of When objects.
+        """
+
+        return self._retrieveWhensForFilterGroups(self._retrieveFilterGroupsForArtifact(filePath))
+
+    def _retrieveWhensForFilterGroups(self, filterGroups):
+        whens = []
+        for filterGroup in filterGroups:
+            whens.extend(self._filterMaps[filterGroup].values())
+        return whens
+
+    def _retrieveLiteralMatchersForFilterGroups(self, filterGroups):
+        return [self._literalMatchers[filterGroup] for filterGroup in filterGroups if filterGroup in self._literalMatchers]
+
+    def _scanArtifact(self, filePath, whens, literalMatchers=(), content=None, text=None):
+        """
+            This function builds the "when data" for a list of When objects in a single pass over the file
+
+            - FILE_PATH Whens are resolved against the file path (the file is not opened)
+            - LINE Whens are evaluated against every line as it is read
+            - SCRIPT Whens are evaluated against the same lines and share one copy of the script
+
+            The file is memory-mapped and decoded once (see readArtifactText()) and the lines are spans of that text.
+            - Whens compiled into one of the literalMatchers are resolved by the matcher (once per line)
+            - The file is not read at all if its content is skipped (see ArtifactIndex.retrieveSkipReason())
+        :param filePath:
+        :param whens:
+        :param literalMatchers:
+        :param content: The content (bytes) of the file if it has already been read (None = read the file)
+        :param text: The content (String) of the file if it has already been read and decoded
+        :return: A map (keyed on When object) of the list of WhenData objects collected from the file
+        """
+        artifactWhenData = {}
+
+        # If the file extension is zip or tar file, we do not need to collect the when data
+        if filePath.endswith(".gz") or filePath.endswith(".tar"):
+            return artifactWhenData
+
+        matcherWhens = set()
+        for literalMatcher in literalMatchers:
+            matcherWhens.update(literalMatcher.whens)
+
+        # The time spent by each When (and each LiteralMatcher) is only measured if the statistics are collected
+        timed = self._statistics is not None
+        whenTimes = {}
+
+        lineWhens = []
+        scriptWhens = []
+        for when in whens:
+            if when.scope == WhenScope.Line.value:
+                lineWhens.append(when)
+            elif when.scope == WhenScope.Script.value:
+                scriptWhens.append(when)
+            elif when.scope == WhenScope.FilePath.value:
+                if timed:
+                    started = time.perf_counter()
+                if when.isConditionMatched(filePath) == True :
+                    artifactWhenData.setdefault(when, []).append(WhenData(filePath,filePath))
+                if timed:
+                    whenTimes[when] = time.perf_counter() - started
+
+        if (len(lineWhens) == 0 and len(scriptWhens) == 0) or self._isSkippedArtifact(filePath):
+            if timed:
+                self._recordScanStatistics(whens, literalMatchers, artifactWhenData, whenTimes, 0)
+            return artifactWhenData
+
+        # Whens that are not resolved by a LiteralMatcher are evaluated one at a time
+        lineWhensToEvaluate = [when for when in lineWhens if when not in matcherWhens]
+        scriptWhensToEvaluate = [when for when in scriptWhens if when not in matcherWhens]
+
+        lineCount = 0
+        matchedScriptWhens = set()
+        try:
+            if text is None:
+                text = self._readArtifactText(filePath) if content is None else decodeArtifactBytes(content)
+
+            # A pattern can't match a line of an artifact that doesn't contain its required literal (see When.literal)
+            lineWhensToEvaluate = [when for when in lineWhensToEvaluate if when.literal is None or when.literal in text]
+            scriptWhensToEvaluate = [when for when in scriptWhensToEvaluate
+                                     if when.literal is None or when.literal in text]
+
+            for start, end in iterateLines(text):
+                line = text[start:end]
+                lineCount += 1
+                if literalMatchers:
+                    strippedLine = line.strip()
+                    for literalMatcher in literalMatchers:
+                        if timed:
+                            started = time.perf_counter()
+                        for when in literalMatcher.match(strippedLine):
+                            if when.scope == WhenScope.Line.value:
+                                artifactWhenData.setdefault(when, []).append(WhenData(filePath,line))
+                            else:
+                                matchedScriptWhens.add(when)
+                        if timed:
+                            whenTimes[literalMatcher] = whenTimes.get(literalMatcher, 0.0) + time.perf_counter() - started
+                for when in lineWhensToEvaluate:
+                    if timed:
+                        started = time.perf_counter()
+                    if when.isConditionMatched(line) == True :
+                        artifactWhenData.setdefault(when, []).append(WhenData(filePath,line))
+                    if timed:
+                        whenTimes[when] = whenTimes.get(when, 0.0) + time.perf_counter() - started
+                for when in scriptWhensToEvaluate:
+                    if when not in matchedScriptWhens:
+                        if timed:
+                            started = time.perf_counter()
+                        if when.isConditionMatched(line) == True :
+                            matchedScriptWhens.add(when)
+                        if timed:
+                            whenTimes[when] = whenTimes.get(when, 0.0) + time.perf_counter() - started
+        except Exception as exception:
+            self.logger.error("ERROR IN READING FILE : (%s)" % filePath)
+            self.logger.error(exception)
+
+        # if when condition is matched, the entire content of the script will be stored in the whenData (every
+        # SCRIPT When shares the same copy of the script)
+        for when in scriptWhens:
+            if when in matchedScriptWhens:
+                artifactWhenData.setdefault(when, []).append(WhenData(filePath,text))
+
+        if timed:
+            self._recordScanStatistics(whens, literalMatchers, artifactWhenData, whenTimes, lineCount)
+
+        return artifactWhenData
+
+    def _recordScanStatistics(self, whens, literalMatchers, artifactWhenData, whenTimes, lineCount):
+        """
+            This function records the statistics (see RuleStatistics) of a single _scanArtifact()
+        """
+        for when in whens:
+            lines = 0 if when.scope == WhenScope.FilePath.value else lineCount
+            self._statistics.recordWhen(when.name, whenTimes.get(when, 0.0), 1, lines,
+                                        len(artifactWhenData.get(when, ())))
+        for literalMatcher in literalMatchers:
+            matches = sum(len(artifactWhenData.get(when, ())) for when in literalMatcher.whens)
+            self._statistics.recordWhen("Literal Matcher (%s)" % literalMatcher.whens[0].filter,
+                                        whenTimes.get(literalMatcher, 0.0), 1, lineCount, matches)
+
+    def _prefetchArtifactText(self, filePath):
+        """
+            This function reads the entire content (String) of an artifact in a reader thread (see
+            ArtifactPrefetcher). Only the artifacts that _scanArtifact() would read are read (None otherwise).
+
+            The content is read into memory (the read releases the GIL) rather than memory-mapped (the pages of a
+            mapping are read while it is decoded i.e. while holding the GIL).
+        """
+        if filePath.endswith(".gz") or filePath.endswith(".tar") or self._isSkippedArtifact(filePath):
+            return None
 
+        whens = self._retrieveWhensForArtifact(filePath)
+        if not any(when.scope in (WhenScope.Line.value, WhenScope.Script.value) for when in whens):
+            return None
 
-            # we need to know if we care about file
-            # looping through every files and retrieve a list of filterType(s) of each file
-            filterTypes = self._retrieveFilterTypesForArtifact(filePath)
+        return decodeArtifactBytes(self._readArtifactContent(filePath))
 
-            for filterType in filterTypes:
-                filterWhenMap = self._filterMaps.get(filterType.value) # Get a list of WhenMap for a particular filter type (e.g CREATE_TABLE filter)
-                if filterWhenMap:
-                    for whenName in filterWhenMap:
-                        self._buildWhenData(filePath, filterWhenMap.get(whenName))
-                else:
-                    self.logger.warn("Invalid Filter Type : ", filterType.value)
+    def _readArtifactText(self, filePath):
+        """
+            This function reads the entire content (String) of an artifact from our Artifacts object (see
+            readArtifactText())
+        """
+        if self._assembledPackage is None:
+            return readArtifactText(filePath)
+        return self._assembledPackage.retrieveArtifactText(filePath)
+
+    def _readArtifactContent(self, filePath):
+        """
+            This function reads the entire content (bytes) of an artifact from our Artifacts object
+        """
+        if self._assembledPackage is None:
+            with open(filePath, "rb") as file:
+                return file.read()
+        return self._assembledPackage.retrieveArtifactContent(filePath)
 
     def _buildWhenData(self, filePath, when):
         """
@@ -242,71 +1147,24 @@ class RuleRunner(object):
         :return:
         """
         self.logger.debug("Create: RuleRunner._buildWhenData")
-        # If the file extension is zip or tar file, we do not need to collect the when data
-        if filePath.endswith(".gz") or filePath.endswith(".tar"):
-            return
-
-        if when.scope == WhenScope.Line.value :
-            # Logic to collect when data for "LINE" scope
-            file = None
-            try:
-                file = open(filePath)
-                for line in file:
-                    if when.isConditionMatched(line) == True :
-                        when.data.append(WhenData(filePath,line))
-            except Exception as exception:
-                self.logger.error("ERROR IN READING FILE for WhenScope.Line : (%s)" % filePath)
-                self.logger.error(exception)
-            if file :
-                file.close()
-        elif when.scope == WhenScope.Script.value:
-            # Logic to collect when data for "SCRIPT" scope
-            file = None
-
-            whenData = ""
-            isWhenConditionMatch = False
-            try:
-                file = open(filePath)
-                for line in file:
-                    if when.isConditionMatched(line) == True :
-                        isWhenConditionMatch = True
-                    whenData += line
-            except Exception as exception:
-                self.logger.error("ERROR IN READING FILE for WhenScope.Script : (%s)" % filePath)
-                self.logger.error(exception)
-            if file :
-                file.close()
-
-            # if when condition is matched, the entire content of the script will be stored in the whenData
-            if isWhenConditionMatch == True:
-                when.data.append(WhenData(filePath,whenData))
-        elif when.scope == WhenScope.FilePath.value:
-            if when.isConditionMatched(filePath) == True :
-                when.data.append(WhenData(filePath,filePath))
+        for whenData in self._scanArtifact(filePath, [when]).get(when, []):
+            when.data.append(whenData)
 
     def _retrieveFilterTypesForArtifact(self, artifactName):
         """
-        This function will retrieve a list of Filter Types (WhenFilter) for a specified Artifact
+        This function will retrieve a list of Filter Types (WhenFilter) for a specified Artifact (the kinds of the
+        artifacts of the package are looked up in its ArtifactIndex)
 
         :param artifactName:  The Artifact Name (i.e. a File Path for Assembled Package Checks).
         :return:  A List of Filer Types (WhenFilter).
         """
 
-        filterTypes = []
-
-        if artifactName.endswith(".tbl"):
-            filterTypes.append(WhenFilter.CreateTable)
-        elif artifactName.endswith(".viw"):
-            filterTypes.append(WhenFilter.CreateView)
-        elif artifactName.endswith(".cmt"):
-            filterTypes.append(WhenFilter.CreateComment)
-
-        if artifactName.find("Auto_Backup_Tables") > -1:
-            filterTypes.append(WhenFilter.CreateBackupTable)
-        elif artifactName.find("Auto_Backup_Views") > -1:
-            filterTypes.append(WhenFilter.CreateBackupView)
+        if self._artifactIndex is not None:
+            artifactKinds = self._artifactIndex.retrieveArtifactKinds(artifactName)
+        else:
+            artifactKinds = classifyArtifact(artifactName)
 
-        return filterTypes
+        return retrieveFilterTypesForArtifactKinds(artifactKinds)
 
     def _retrieveTestCase(self, artifactName):
         """
@@ -322,7 +1180,7 @@ class RuleRunner(object):
         testCase = self._testCases.get(artifactName)
 
         if testCase == None:
-            testCase = TestCase(artifactName, artifactName)
+            testCase = ArtifactResult(artifactName, artifactName)
             self._testCases[artifactName] = testCase
 
         return testCase
@@ -345,16 +1203,12 @@ class RuleRunner(object):
         Warning -> Error
         Information ->  StdOut
 
-        :param testCase: Test Case Object.
-        :param failureMessage: A String that describes the Failure.  
+        :param testCase: Test Case Object (ArtifactResult).
+        :param failureMessage: A String that describes the Failure.
         """
 
-        # Append failure messages if necessary
-        if testCase.failure_message:
-            failureMessage = ("%s _BR_ %s" % (testCase.failure_message, failureMessage) )
-
-        # This will replace any existing failure messages
-        testCase.add_failure_info(failureMessage)
+        # The messages are joined (with _BR_) when the report is written
+        testCase.recordFailure(failureMessage)
 
     def _recordTestWarning(self, testCase, warningMessage):
         """
@@ -365,16 +1219,12 @@ class RuleRunner(object):
         Warning -> Error
         Information ->  StdOut
 
-        :param testCase: Test Case Object.
+        :param testCase: Test Case Object (ArtifactResult).
         :param warningMessage: A String that describes the Warning.
         """
 
-        # Append warning messages if necessary
-        if testCase.error_message:
-            warningMessage = ("%s _BR_ %s" % (testCase.error_message, warningMessage) )
-
-        # This will replace any existing warning messages
-        testCase.add_error_info(warningMessage)
+        # The messages are joined (with _BR_) when the report is written
+        testCase.recordWarning(warningMessage)
 
     def _recordTestInformation(self, testCase, informationMessage):
         """
@@ -385,14 +1235,10 @@ class RuleRunner(object):
         Warning -> Error
         Information ->  StdOut
 
-        :param testCase: Test Case Object.
+        :param testCase: Test Case Object (ArtifactResult).
         :param informationMessage: A String that describes the Information.
         """
 
-        # Append information messages if necessary
-        if testCase.stdout:
-            informationMessage = ("%s _BR_ %s" % (testCase.stdout, informationMessage) )
-
-        # This will replace any existing information messages
-        testCase.stdout = informationMessage
+        # The messages are joined (with _BR_) when the report is written
+        testCase.recordInformation(informationMessage)
 
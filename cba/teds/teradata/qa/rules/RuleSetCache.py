@@ -0,0 +1,135 @@
+import cba.teds.utils.Logger
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+
+
+# Change this to invalidate every compiled rule set (e.g. when RuleReader.compileRuleSet() changes)
+RULE_SET_VERSION = 2
+
+# The compiled rule sets of this process (map keyed on the rule set hash, see buildRuleSetHash())
+_compiledRuleSets = {}
+_compiledRuleSetsLock = threading.Lock()
+
+
+def buildRuleSetHash(rulesFile, parentNode="assembledTeradataPackageChecks"):
+    """
+        Helper function to build the hash (key) of a compiled rule set from the content of the rules (XML) file.
+
+        :param rulesFile: The relative (project root) path to the rules (XML) file.
+        :param parentNode: The name of the XML node that the whens/actions/rules are under.
+        :returns: The hash (String)
+    """
+    ruleSetHash = hashlib.sha1(("RULE_SET_VERSION:%d|%s|" % (RULE_SET_VERSION, parentNode)).encode("utf-8"))
+    with open(rulesFile, "rb") as ruleFile:
+        ruleSetHash.update(ruleFile.read())
+
+    return ruleSetHash.hexdigest()
+
+
+def retrieveDefaultRuleSetDirectory(rulesFile):
+    """
+        Helper function to build the path of the directory that the compiled rule sets of a rules (XML) file are
+        looked for in by default i.e. a rulesets directory next to the rules file (see CompileTeradataRules).
+    """
+    return os.path.join(os.path.dirname(rulesFile), "rulesets")
+
+
+def retrieveRuleSetPath(ruleSetDirectory, ruleSetHash):
+    """
+        Helper function to build the path of a compiled rule set (in a rule set directory).
+    """
+    return os.path.join(ruleSetDirectory, ruleSetHash + ".json")
+
+
+def loadRuleSet(rulesFile, ruleSetDirectory=None, parentNode="assembledTeradataPackageChecks"):
+    """
+        Load the rules from the compiled rule set of the rules (XML) file. The rules file is only read (and validated)
+        by a RuleReader when its content has not been compiled before (by this process, by CompileTeradataRules or, if
+        a ruleSetDirectory is specified, by an earlier run). The compiled rule set is keyed on the content hash of the
+        rules file so a modified rules file is always compiled again.
+
+        The compiled rule set is looked for in the ruleSetDirectory or, if it isn't specified, in the default rule set
+        directory next to the rules file (see retrieveDefaultRuleSetDirectory()). A rule set compiled by this process
+        is only stored in a ruleSetDirectory that is specified (the directory of the rules file is left alone).
+
+        NOTE: Every call returns a new RuleReader (with new When objects) so the When.data lists are never shared.
+        NOTE: Loading a compiled rule set skips reading (and validating) the XML and extracting the required literals
+              of the patterns. The patterns are still compiled (see When and Action) when the RuleReader is created,
+              compiled patterns can't be serialized.
+
+        :param rulesFile: The relative (project root) path to the rules (XML) file.
+        :param ruleSetDirectory: The path of a directory to keep the compiled rule set in (None = look for it next to
+                                 the rules file but only keep it in this process).
+        :param parentNode: The name of the XML node that the whens/actions/rules are under.
+        :returns: A RuleReader
+    """
+    logger = cba.teds.utils.Logger.getLogger()
+
+    try:
+        ruleSetHash = buildRuleSetHash(rulesFile, parentNode)
+    except (IOError, OSError):
+        # Let the RuleReader report the missing rules file
+        return RuleReader(rulesFile, parentNode)
+
+    storeRuleSet = ruleSetDirectory is not None
+    ruleSetPath = retrieveRuleSetPath(ruleSetDirectory if storeRuleSet else retrieveDefaultRuleSetDirectory(rulesFile),
+                                      ruleSetHash)
+
+    with _compiledRuleSetsLock:
+        compiledRuleSet = _compiledRuleSets.get(ruleSetHash)
+
+    if compiledRuleSet is not None:
+        # Compiled by this process (e.g. without a ruleSetDirectory) but not stored in this ruleSetDirectory yet
+        if storeRuleSet and not os.path.exists(ruleSetPath):
+            _writeRuleSet(ruleSetPath, compiledRuleSet)
+    else:
+        compiledRuleSet = _readRuleSet(ruleSetPath)
+
+    if compiledRuleSet is None:
+        ruleReader = RuleReader(rulesFile, parentNode)
+        compiledRuleSet = ruleReader.compileRuleSet()
+        if storeRuleSet:
+            _writeRuleSet(ruleSetPath, compiledRuleSet)
+    else:
+        logger.debug("Loading Compiled Rule Set %s for '%s'", ruleSetHash, rulesFile)
+        try:
+            ruleReader = RuleReader(rulesFile, parentNode, compiledRuleSet)
+        except Exception as exception:
+            # e.g. an old (or damaged) rule set file
+            logger.warn("Compiled Rule Set %s cannot be loaded (%s), reading '%s'", ruleSetHash, exception, rulesFile)
+            ruleReader = RuleReader(rulesFile, parentNode)
+            compiledRuleSet = ruleReader.compileRuleSet()
+
+    with _compiledRuleSetsLock:
+        _compiledRuleSets[ruleSetHash] = compiledRuleSet
+
+    return ruleReader
+
+
+def _readRuleSet(ruleSetPath):
+    try:
+        with open(ruleSetPath) as ruleSetFile:
+            return json.load(ruleSetFile)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _writeRuleSet(ruleSetPath, compiledRuleSet):
+    ruleSetDirectory = os.path.dirname(ruleSetPath)
+
+    try:
+        if not os.path.exists(ruleSetDirectory):
+            os.makedirs(ruleSetDirectory)
+
+        # Write to a temporary file and rename it so that a concurrent reader never sees a partial rule set
+        fileDescriptor, temporaryPath = tempfile.mkstemp(dir=ruleSetDirectory)
+        with os.fdopen(fileDescriptor, "w") as ruleSetFile:
+            json.dump(compiledRuleSet, ruleSetFile)
+        os.replace(temporaryPath, ruleSetPath)
+    except (IOError, OSError) as exception:
+        cba.teds.utils.Logger.getLogger().warn("Compiled Rule Set cannot be stored (%s): %s", ruleSetPath, exception)
@@ -0,0 +1,131 @@
+import cba.teds.utils.Logger
+import json
+
+from collections import OrderedDict
+
+
+class RuleStatistics(object):
+    """
+    The RuleStatistics class accumulates (for a RuleRunner) how much work each When and each Action does so that a
+    slow (or hot) rule can be found after a rule change.
+
+    For each When: the time spent evaluating it, the files and lines it inspected and the number of matches (i.e.
+    When Data) it produced. Literal Whens are evaluated together by a LiteralMatcher so their time is recorded against
+    the LiteralMatcher (e.g. "Literal Matcher (CREATE_TABLE)").
+
+    For each Action: the time spent executing it, the number of When Data it inspected and the number of findings (i.e.
+    the number of times the action was required).
+
+    The statistics are reported as properties of the JUnit test suite (see buildProperties()) and optionally written
+    to a (JSON) stats file (see writeStatistics()).
+    """
+
+    WHEN_COUNTERS = ("time", "files", "lines", "matches")
+    ACTION_COUNTERS = ("time", "evaluations", "findings")
+
+    def __init__(self, whenNames=(), actionNames=()):
+        """
+        Constructor.
+
+        :param whenNames: The names of the Whens (in the order they should be reported).
+        :param actionNames: The names of the Actions (in the order they should be reported).
+        """
+
+        # Initialize Logging
+        self.logger = cba.teds.utils.Logger.getLogger()
+
+        # Always Log (Debug) Constructors, Destructors and Public Methods
+        self.logger.debug("Create: RuleStatistics()")
+
+        self._whens = OrderedDict() # map keyed on when name
+        for whenName in whenNames:
+            self._retrieveCounters(self._whens, whenName, self.WHEN_COUNTERS)
+
+        self._actions = OrderedDict() # map keyed on action name
+        for actionName in actionNames:
+            self._retrieveCounters(self._actions, actionName, self.ACTION_COUNTERS)
+
+    # PUBLIC METHODS #
+
+    def recordWhen(self, whenName, time=0.0, files=0, lines=0, matches=0):
+        counters = self._retrieveCounters(self._whens, whenName, self.WHEN_COUNTERS)
+        counters["time"] += time
+        counters["files"] += files
+        counters["lines"] += lines
+        counters["matches"] += matches
+
+    def recordAction(self, actionName, time=0.0, evaluations=0, findings=0):
+        counters = self._retrieveCounters(self._actions, actionName, self.ACTION_COUNTERS)
+        counters["time"] += time
+        counters["evaluations"] += evaluations
+        counters["findings"] += findings
+
+    def retrieveWhenStatistics(self, whenName):
+        return self._whens.get(whenName)
+
+    def retrieveActionStatistics(self, actionName):
+        return self._actions.get(actionName)
+
+    def drain(self):
+        """
+        Return the statistics (as plain maps that can be sent between processes) and reset them to zero.
+
+        :returns: A tuple of (when statistics, action statistics)
+        """
+        drained = (self._whens, self._actions)
+        self._whens = OrderedDict((whenName, OrderedDict((counter, 0) for counter in self.WHEN_COUNTERS))
+                                  for whenName in drained[0])
+        self._actions = OrderedDict((actionName, OrderedDict((counter, 0) for counter in self.ACTION_COUNTERS))
+                                    for actionName in drained[1])
+        return drained
+
+    def merge(self, statistics):
+        """
+        Add the statistics returned by drain() (e.g. in a worker process) to these statistics.
+
+        :param statistics: A tuple of (when statistics, action statistics)
+        """
+        whens, actions = statistics
+        for whenName in whens:
+            self.recordWhen(whenName, **whens[whenName])
+        for actionName in actions:
+            self.recordAction(actionName, **actions[actionName])
+
+    def buildProperties(self):
+        """
+        Build the properties (for a JUnit test suite) e.g.
+
+            "When: Create Table Statement" = "time=0.001234 files=12 lines=345 matches=12"
+
+        :returns: An ordered map of property name to value (String)
+        """
+        properties = OrderedDict()
+        for whenName in self._whens:
+            counters = self._whens[whenName]
+            properties["When: %s" % whenName] = "time=%.6f files=%d lines=%d matches=%d" % (
+                counters["time"], counters["files"], counters["lines"], counters["matches"])
+        for actionName in self._actions:
+            counters = self._actions[actionName]
+            properties["Action: %s" % actionName] = "time=%.6f evaluations=%d findings=%d" % (
+                counters["time"], counters["evaluations"], counters["findings"])
+        return properties
+
+    def writeStatistics(self, statsFileName):
+        """
+        Write the statistics to a (JSON) stats file.
+
+        :param statsFileName: The file path of the stats file.
+        """
+        self.logger.debug("Call: writeStatistics(%s)", statsFileName)
+
+        with open(statsFileName, "w") as statsFile:
+            json.dump(OrderedDict([("whens", self._whens), ("actions", self._actions)]), statsFile, indent=2)
+
+    # PRIVATE METHODS #
+
+    def _retrieveCounters(self, countersMap, name, counterNames):
+        counters = countersMap.get(name)
+        if counters is None:
+            counters = OrderedDict((counter, 0) for counter in counterNames)
+            countersMap[name] = counters
+        return counters
@@ -0,0 +1,53 @@
+import unittest
+
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import *
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testArtifactIndex(unittest.TestCase):
+    """
+    Unit Tests for the ArtifactIndex Class.
+
+    These are currently configured to run using "test_assembled_package.tgz" in "resources/test/".
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+        self._assembledPackage = AssembledPackage("resources/test/", "test_assembled_package.tgz")
+        self._filePaths = self._assembledPackage.retrieveAssembledPackageFilesList()
+        self._artifactIndex = self._assembledPackage.retrieveArtifactIndex()
+
+    def test_classifyArtifact(self):
+        self.assertEqual(classifyArtifact("TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0.FACT_ACCT_BALN_MNLY.tbl"),
+                         (ArtifactKind.Table,), "Check Table")
+        self.assertEqual(classifyArtifact("TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0.FACT_ACCT_BALN_MNLY.viw"),
+                         (ArtifactKind.View,), "Check View")
+        self.assertEqual(classifyArtifact("TERADATA/C1234567_Rollback_Drop_Tables.sql"),
+                         (ArtifactKind.DropTables, ArtifactKind.RollbackDropTables), "Check Rollback Drop Tables")
+        self.assertEqual(classifyArtifact("TERADATA/C1234567_Auto_Backup_Views.sql"),
+                         (ArtifactKind.AutoBackupViews, ArtifactKind.BackupViews), "Check Auto Backup Views")
+        self.assertEqual(classifyArtifact("TERADATA/RELEASE/BICD/2.123/Version.txt"), (ArtifactKind.Version,),
+                         "Check Version File")
+        self.assertEqual(classifyArtifact("TERADATA/readme.md"), (), "Check Unclassified")
+
+    def test_retrieveFilePaths(self):
+        self.assertEqual(len(self._artifactIndex), len(self._filePaths), "Check Every File Indexed")
+        for kind in ArtifactKind:
+            self.assertEqual(self._artifactIndex.retrieveFilePaths(kind),
+                             [filePath for filePath in self._filePaths if kind in classifyArtifact(filePath)],
+                             "Check File Paths of %s" % kind.name)
+            for fileId in self._artifactIndex.retrieveFileIds(kind):
+                self.assertIn(kind, self._artifactIndex.retrieveArtifactKinds(
+                    self._artifactIndex.retrieveFilePath(fileId)), "Check Kinds of File %d" % fileId)
+
+    def test_retrieveArtifactKinds(self):
+        for filePath in self._filePaths:
+            self.assertEqual(self._artifactIndex.retrieveArtifactKinds(filePath), classifyArtifact(filePath),
+                             "Check Kinds of %s" % filePath)
+        # A File Path outside the package is classified on the fly
+        self.assertEqual(self._artifactIndex.retrieveArtifactKinds("imaginary_file_path.cmt"), (ArtifactKind.Comment,),
+                         "Check Imaginary File")
@@ -0,0 +1,59 @@
+
+import os
+import tempfile
+import unittest
+
+from cba.teds.teradata.qa.artifacts.ArtifactReader import *
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testArtifactReader(unittest.TestCase):
+    """
+    Unit Tests for the ArtifactReader Helper Functions.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def _readLinesInTextMode(self, filePath):
+        with open(filePath) as file:
+            return [line for line in file]
+
+    def test_readArtifactText(self):
+        # Every file in the good package must read the same as a file opened in text mode
+        for root, directoryNames, fileNames in os.walk("resources/test/goodPackage"):
+            for fileName in fileNames:
+                filePath = os.path.join(root, fileName)
+                text = readArtifactText(filePath)
+                self.assertEqual([text[start:end] for start, end in iterateLines(text)],
+                                 self._readLinesInTextMode(filePath), "Check Lines: %s" % filePath)
+
+    def test_readArtifactTextNewlines(self):
+        temporaryFile = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            temporaryFile.write(b"CREATE MULTISET TABLE\r\nP_D_BAL_001\rCOMPRESS (0,1)\nNO NEWLINE")
+            temporaryFile.close()
+
+            text = readArtifactText(temporaryFile.name)
+            self.assertEqual(text, "CREATE MULTISET TABLE\nP_D_BAL_001\nCOMPRESS (0,1)\nNO NEWLINE", "Check Text")
+            self.assertEqual([text[start:end] for start, end in iterateLines(text)],
+                             self._readLinesInTextMode(temporaryFile.name), "Check Lines")
+        finally:
+            os.remove(temporaryFile.name)
+
+    def test_readArtifactTextEmptyFile(self):
+        temporaryFile = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            temporaryFile.close()
+            self.assertEqual(readArtifactText(temporaryFile.name), "", "Check Empty Text")
+            self.assertEqual(list(iterateLines("")), [], "Check No Lines")
+        finally:
+            os.remove(temporaryFile.name)
+
+    def test_readArtifactTextImaginaryFile(self):
+        self.assertRaises(IOError, readArtifactText, "imaginary_file_path.tbl")
+
+
+if __name__ == "__main__":
+    unittest.main()
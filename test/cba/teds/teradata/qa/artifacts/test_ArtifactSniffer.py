@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import ArtifactIndex
+from cba.teds.teradata.qa.artifacts.ArtifactSniffer import *
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testArtifactSniffer(unittest.TestCase):
+    """
+    Unit Tests for the ArtifactSniffer Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_sniffContent(self):
+        artifactSniffer = ArtifactSniffer(maxSize=1024, sniffLength=16)
+
+        self.assertIsNone(artifactSniffer.sniffContent("TERADATA/readme.md", b"CREATE TABLE T (C INTEGER);\n"),
+                          "Check Text")
+        self.assertIsNone(artifactSniffer.sniffContent("TERADATA/readme.md", b""), "Check Empty")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/extract.dat", b"ABC\x00DEF"), ArtifactSkipReason.Binary,
+                         "Check NUL Bytes")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/extract.dat", b"\x01\x02\x03ABCDEFGH"),
+                         ArtifactSkipReason.NonText, "Check Control Characters")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/logo.PNG", b"CREATE TABLE"),
+                         ArtifactSkipReason.DeniedExtension, "Check Denied Extension")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/extract.csv", b"A,B\n" * 300),
+                         ArtifactSkipReason.Oversized, "Check Oversized")
+
+        # Only the head of the content is sniffed (and an allowed extension is only sniffed for NUL bytes)
+        self.assertIsNone(artifactSniffer.sniffContent("TERADATA/extract.dat", b"A" * 16 + b"\x00"), "Check Head")
+        self.assertIsNone(artifactSniffer.sniffContent("TERADATA/T.tbl", b"\x01\x02\x03ABCDEFGH"),
+                          "Check Allowed Extension")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/T.tbl", b"\x00"), ArtifactSkipReason.Binary,
+                         "Check Allowed Extension NUL Bytes")
+
+        # An archive is left to the RuleRunner
+        self.assertIsNone(artifactSniffer.sniffContent("diff.tar.gz", b"\x1f\x8b\x08\x00"), "Check Archive")
+
+    def test_sniffContentEncoding(self):
+        artifactSniffer = ArtifactSniffer(sniffLength=4)
+        artifactSniffer._encoding = "utf-8"
+
+        # A character that is cut off by the end of the head is not an error (unless it is the end of the content)
+        self.assertIsNone(artifactSniffer.sniffContent("TERADATA/readme.md", "ABCé".encode("utf-8")),
+                          "Check Partial Character")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/readme.md", b"AB\xc3"), ArtifactSkipReason.NonText,
+                         "Check Truncated Character")
+        self.assertEqual(artifactSniffer.sniffContent("TERADATA/readme.md", b"A\xffBC"), ArtifactSkipReason.NonText,
+                         "Check Undecodable")
+
+    def test_sniffFile(self):
+        directory = tempfile.mkdtemp()
+        try:
+            filePaths = []
+            for fileName, content in (("T.tbl", b"CREATE TABLE T (C INTEGER);\n"), ("image.bin", b"\x89PNG\x00\x00"),
+                                      ("notes", b"Some Notes\n"), ("extract.sql", b"SELECT\x00\x00\x01")):
+                filePath = os.path.join(directory, fileName)
+                with open(filePath, "wb") as file:
+                    file.write(content)
+                filePaths.append(filePath)
+            missingFilePath = os.path.join(directory, "missing.bin")
+            filePaths.append(missingFilePath)
+
+            artifactSniffer = ArtifactSniffer()
+            self.assertIsNone(artifactSniffer.sniffFile(filePaths[0]), "Check Text")
+            self.assertEqual(artifactSniffer.sniffFile(filePaths[1]), ArtifactSkipReason.Binary, "Check Binary")
+            self.assertEqual(artifactSniffer.sniffFile(filePaths[3]), ArtifactSkipReason.Binary,
+                             "Check Allowed Extension NUL Bytes")
+            self.assertIsNone(artifactSniffer.sniffFile(missingFilePath), "Check Missing File")
+
+            # The ArtifactIndex sniffs every artifact (once)
+            artifactIndex = ArtifactIndex(filePaths, artifactSniffer)
+            self.assertEqual(artifactIndex.retrieveSkippedFilePaths(), [filePaths[1], filePaths[3]], "Check Skipped")
+            self.assertEqual(artifactIndex.retrieveSkipReason(filePaths[1]), ArtifactSkipReason.Binary,
+                             "Check Skip Reason")
+            self.assertIsNone(artifactIndex.retrieveSkipReason(filePaths[2]), "Check Not Skipped")
+            self.assertEqual(ArtifactIndex(filePaths).retrieveSkippedFilePaths(), [], "Check Not Sniffed")
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
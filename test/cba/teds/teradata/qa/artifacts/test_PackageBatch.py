@@ -0,0 +1,85 @@
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+import cba.teds.teradata.qa.artifacts.PackageBatch
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.PackageBatch import *
+from cba.teds.teradata.qa.artifacts.PackageGenerator import PackageGenerator
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testPackageBatch(unittest.TestCase):
+    """
+    Unit Tests for the PackageBatch Class.
+
+    The batch is "test_assembled_package.tgz" in "resources/test/" and a couple of generated (see PackageGenerator)
+    packages.
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+        self._rulesFile = "resources/teradataQualityCheckRules.xml"
+        self._workDirectory = tempfile.mkdtemp(prefix="PACKAGE_BATCH_")
+
+        self._packagePaths = ["resources/test/test_assembled_package.tgz"]
+        for seed in range(2):
+            packageFileName = "generated_assembled_package_%d.tgz" % seed
+            PackageGenerator(10, 5, faultRate=0.5, seed=seed).generateTarball(self._workDirectory, packageFileName)
+            self._packagePaths.append(self._workDirectory + "/" + packageFileName)
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self._workDirectory, ignore_errors=True)
+
+    def _retrieveTestCases(self, junitFileName):
+        # The object counts are printed from sets (the order depends on the process)
+        testCases = []
+        for testCase in ET.parse(junitFileName).getroot().iter("testcase"):
+            if testCase.get("name") != ".Object Counts":
+                testCases.append(ET.tostring(testCase))
+        return testCases
+
+    def test_retrieveJunitFileName(self):
+        self.assertEqual(retrieveJunitFileName("output", "resources/test/test_assembled_package.tgz"),
+                         "output/junit-test_assembled_package.xml", "Check JUnit File Name")
+
+    def test_runChecks(self):
+        outputDirectory = self._workDirectory + "/batch"
+        os.makedirs(outputDirectory)
+
+        packageBatch = PackageBatch(self._packagePaths + [self._workDirectory + "/missing_assembled_package.tgz"],
+                                    self._rulesFile, jobs=2)
+        results = packageBatch.runChecks(outputDirectory, outputDirectory + "/summary.xml")
+        self.assertEqual([result[0] for result in results], packageBatch._packagePaths, "Check Batch Order")
+
+        # Each report is the same as the report of the package checked on its own
+        for packagePath, junitFileName, failures, warnings, elapsedSeconds, errorMessage in results[:-1]:
+            self.assertIsNone(errorMessage, "Check %s Checked" % packagePath)
+            packageDirectory, packageFileName = os.path.split(packagePath)
+            AssembledPackage(packageDirectory, packageFileName).runChecks(self._rulesFile,
+                                                                         self._workDirectory + "/single.xml")
+            self.assertEqual(self._retrieveTestCases(junitFileName),
+                             self._retrieveTestCases(self._workDirectory + "/single.xml"),
+                             "Check Report for %s" % packagePath)
+
+        # A package that cannot be checked is reported in the summary (and doesn't stop the batch)
+        self.assertIsNotNone(results[-1][5], "Check Missing Package")
+        summary = ET.parse(outputDirectory + "/summary.xml").getroot()
+        self.assertEqual([testCase.get("classname") for testCase in summary.iter("testcase")],
+                         packageBatch._packagePaths, "Check Summary")
+
+    def test_runChecksSharesRules(self):
+        outputDirectory = self._workDirectory + "/shared"
+        os.makedirs(outputDirectory)
+
+        PackageBatch(self._packagePaths, self._rulesFile).runChecks(outputDirectory, outputDirectory + "/summary.xml")
+
+        # The rules were read once (in this process) and nothing was collected in the When.data lists
+        ruleReader = cba.teds.teradata.qa.artifacts.PackageBatch._batchRuleReader
+        for when in ruleReader.retrieveListOfWhenConditions().values():
+            self.assertEqual(when.data, [], "Check No When Data for %s" % when.name)
@@ -0,0 +1,76 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.PackageChecker import *
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testPackageChecker(unittest.TestCase):
+    """
+    Unit Tests for the PackageChecker Class.
+
+    These are currently configured to run using "test_assembled_package.tgz" in "resources/test/".
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+        self._testPackagePath = "resources/test/test_assembled_package.tgz"
+        self._workDirectory = tempfile.mkdtemp(prefix="PACKAGE_CHECKER_")
+
+        self._rulesFile = self._workDirectory + "/rules.xml"
+        shutil.copyfile("resources/teradataQualityCheckRules.xml", self._rulesFile)
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self._workDirectory, ignore_errors=True)
+
+    def _retrieveResults(self, testCases):
+        # The object counts are printed from sets (so they are left out)
+        return [(testCase.name, testCase.failure_message, testCase.error_message, testCase.stdout)
+                for testCase in testCases if testCase.name != ".Object Counts"]
+
+    def test_checkPackage(self):
+        packageChecker = PackageChecker(self._rulesFile)
+
+        ruleRunner = RuleRunner(self._rulesFile, AssembledPackage("resources/test/", "test_assembled_package.tgz"))
+        ruleRunner.runRules()
+        expectedResults = self._retrieveResults(ruleRunner.retrieveTestCases())
+
+        # The same PackageChecker can check the package again (and the results are the same)
+        for check in range(2):
+            self.assertEqual(self._retrieveResults(packageChecker.checkPackage(self._testPackagePath).retrieveTestCases()),
+                             expectedResults, "Check Results (%d)" % check)
+        self.assertEqual(packageChecker.retrieveStatus()["checks"], 2, "Check Number of Checks")
+        self.assertEqual(packageChecker.retrieveStatus()["rulesReads"], 1, "Check Rules Read Once")
+
+        # A directory that the package was already extracted to
+        extractedDirectory = self._workDirectory + "/extracted"
+        with tarfile.open(self._testPackagePath) as tarFile:
+            tarFile.extractall(extractedDirectory)
+        self.assertEqual(sorted(self._retrieveResults(packageChecker.checkPackage(extractedDirectory).retrieveTestCases())),
+                         sorted(expectedResults), "Check Results for Directory")
+        self.assertTrue(os.path.isdir(extractedDirectory), "Check Directory Not Deleted")
+
+    def test_reloadRules(self):
+        packageChecker = PackageChecker(self._rulesFile)
+        packageChecker.checkPackage(self._testPackagePath)
+        self.assertEqual(packageChecker.retrieveStatus()["rulesReads"], 1, "Check Rules Read Once")
+
+        # Modifying the rules file means the rules are read again
+        rulesModifiedTime = os.path.getmtime(self._rulesFile)
+        os.utime(self._rulesFile, (rulesModifiedTime + 10, rulesModifiedTime + 10))
+        packageChecker.checkPackage(self._testPackagePath)
+        self.assertEqual(packageChecker.retrieveStatus()["rulesReads"], 2, "Check Rules Read Again")
+
+    def test_checkMissingPackage(self):
+        packageChecker = PackageChecker(self._rulesFile)
+        with self.assertRaises(ValueError):
+            packageChecker.checkPackage(self._workDirectory + "/missing_assembled_package.tgz")
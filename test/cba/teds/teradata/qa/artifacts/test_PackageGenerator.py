@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.PackageGenerator import *
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testPackageGenerator(unittest.TestCase):
+    """
+    Unit Tests for the PackageGenerator Class.
+
+    The generated packages are checked with "resources/teradataQualityCheckRules.xml".
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+        self._rulesFile = "resources/teradataQualityCheckRules.xml"
+        self._workDirectory = tempfile.mkdtemp(prefix="GENERATOR_")
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self._workDirectory, ignore_errors=True)
+
+    def _retrieveFindings(self, packageGenerator, packageFileName):
+        # The names of the (shortened) artifacts that failed (or warned about) a rule
+        packageGenerator.generateTarball(self._workDirectory, packageFileName)
+        assembledPackage = AssembledPackage(self._workDirectory, packageFileName)
+        ruleRunner = RuleRunner(self._rulesFile, assembledPackage)
+        ruleRunner.runRules()
+        return [testCaseName for testCaseName, testCase in ruleRunner._testCases.items()
+                if testCase.failure_message or testCase.error_message]
+
+    def test_generateFilesIsDeterministic(self):
+        self.assertEqual(PackageGenerator(5, 10, 0.5, seed=7).generateFiles(),
+                         PackageGenerator(5, 10, 0.5, seed=7).generateFiles(), "Check Same Seed Same Package")
+        self.assertNotEqual(PackageGenerator(5, 10, 0.5, seed=7).generateFiles(),
+                            PackageGenerator(5, 10, 0.5, seed=8).generateFiles(), "Check Other Seed Other Package")
+
+    def test_generateTarball(self):
+        packageGenerator = PackageGenerator(3, 4)
+        fileCount = packageGenerator.generateTarball(self._workDirectory, "test_generated_package.tgz")
+        self.assertEqual(fileCount, len(packageGenerator.generateFiles()), "Check File Count")
+
+        assembledPackage = AssembledPackage(self._workDirectory, "test_generated_package.tgz")
+        self.assertEqual(len(assembledPackage.retrieveAssembledPackageFilesList()), fileCount, "Check Files Extracted")
+        self.assertEqual(assembledPackage.retrieveChangeRequestNumber(), "C1234567", "Check Change Request Number")
+
+    def test_cleanPackageHasNoFindings(self):
+        findings = self._retrieveFindings(PackageGenerator(5, 10), "test_clean_package.tgz")
+        self.assertEqual(findings, [], "Check No Findings")
+
+    def test_faultyPackageFindings(self):
+        packageGenerator = PackageGenerator(30, 5, faultRate=1.0)
+        packageGenerator.generateFiles()
+        self.assertEqual(len(packageGenerator.faults), 30, "Check Every Table Faulted")
+        self.assertEqual(set(packageGenerator.faults.values()), set(FAULT_TYPES), "Check Every Fault Type Used")
+
+        findings = "\n".join(self._retrieveFindings(packageGenerator, "test_faulty_package.tgz"))
+        for tableName in packageGenerator.faults:
+            self.assertIn(tableName, findings, "Check Fault Found for %s" % tableName)
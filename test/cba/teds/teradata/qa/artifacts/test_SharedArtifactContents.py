@@ -0,0 +1,70 @@
+import multiprocessing
+import pickle
+import unittest
+
+from multiprocessing import shared_memory
+
+from cba.teds.teradata.qa.artifacts.SharedArtifactContents import SharedArtifactContents
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+def _retrieveContentInWorker(arguments):
+    sharedArtifactContents, filePath = arguments
+    return bytes(sharedArtifactContents[filePath])
+
+
+class testSharedArtifactContents(unittest.TestCase):
+    """
+    Unit Tests for the SharedArtifactContents Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def setUp(self):
+        self._artifactContents = {"first.tbl": b"CREATE MULTISET TABLE A\n", "empty.tbl": b"",
+                                  "second.tbl": b"CREATE TABLE B\r\n  Y BYTEINT COMPRESS (0,1)"}
+
+    def test_retrieveContent(self):
+        sharedArtifactContents = SharedArtifactContents(self._artifactContents)
+        try:
+            self.assertEqual(len(sharedArtifactContents), 3, "Check Artifacts")
+            self.assertIn("second.tbl", sharedArtifactContents, "Check Contains")
+            self.assertNotIn("third.tbl", sharedArtifactContents, "Check Not Contains")
+
+            # Only the name and the index are pickled
+            copy = pickle.loads(pickle.dumps(sharedArtifactContents))
+            self.assertLess(len(pickle.dumps(sharedArtifactContents)), 200, "Check Pickled Size")
+            for filePath, content in self._artifactContents.items():
+                self.assertEqual(bytes(copy[filePath]), content, "Check Content (%s)" % filePath)
+            copy.release()
+        finally:
+            sharedArtifactContents.release()
+
+        # The block is unlinked by the process that created it
+        self.assertRaises(FileNotFoundError, shared_memory.SharedMemory, sharedArtifactContents.retrieveName())
+
+    def test_retrieveContentInWorkers(self):
+        sharedArtifactContents = SharedArtifactContents(self._artifactContents)
+        try:
+            pool = multiprocessing.Pool(2)
+            try:
+                contents = pool.map(_retrieveContentInWorker,
+                                    [(sharedArtifactContents, filePath) for filePath in self._artifactContents])
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            sharedArtifactContents.release()
+
+        self.assertEqual(contents, list(self._artifactContents.values()), "Check Content")
+
+    def test_emptyContents(self):
+        sharedArtifactContents = SharedArtifactContents({})
+        self.assertEqual(len(sharedArtifactContents), 0, "Check Artifacts")
+        sharedArtifactContents.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.TarballPackage import *
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testTarballPackage(unittest.TestCase):
+    """
+    Unit Tests for the TarballPackage Class.
+
+    The unit tests compare a TarballPackage with an (extracted) AssembledPackage for "test_assembled_package.tgz" in
+    "resources/test/".
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+        self._testPackageFileName = "test_assembled_package.tgz"
+        self._testPackageLocation = "resources/test/"
+
+        self._tarballPackage = TarballPackage(self._testPackageLocation, self._testPackageFileName)
+        self._assembledPackage = AssembledPackage(self._testPackageLocation, self._testPackageFileName)
+
+    def test_extractedFilesDirectory(self):
+        self.assertIsNone(self._tarballPackage.extractedFilesDirectory(), "Check Nothing Extracted")
+
+    def test_retrieveAssembledPackageFilesList(self):
+        # The File Paths are the same (relative to the extracted files directory)
+        tarballDirectory = self._tarballPackage._extractedFilesRelativeDirectory()
+        assembledDirectory = self._assembledPackage._extractedFilesRelativeDirectory()
+        self.assertEqual(sorted(filePath[len(tarballDirectory):] for filePath in
+                                self._tarballPackage.retrieveAssembledPackageFilesList()),
+                         sorted(filePath[len(assembledDirectory):] for filePath in
+                                self._assembledPackage.retrieveAssembledPackageFilesList()), "Check File List")
+
+    def test_retrieveArtifactContent(self):
+        for filePath in self._tarballPackage.retrieveAssembledPackageFilesList():
+            if filePath.endswith("Version.txt"):
+                self.assertTrue(self._tarballPackage.retrieveArtifactContent(filePath).find(b"CR_NUMBER:") > -1,
+                                "Check Content")
+                self.assertTrue(self._tarballPackage.retrieveArtifactText(filePath).find("CR_NUMBER:") > -1,
+                                "Check Text")
+        self.assertRaises(IOError, self._tarballPackage.retrieveArtifactContent, "imaginary_file_path.tbl")
+
+    def test_retrieveObjects(self):
+        self.assertEqual(self._tarballPackage.retrieveChangeRequestNumber(), "C1403206", "Check Change Number")
+        self.assertEqual(self._tarballPackage.retrieveCreatedObjects(),
+                         self._assembledPackage.retrieveCreatedObjects(), "Check Created Objects")
+        self.assertEqual(self._tarballPackage.retrieveDeletedObjects(),
+                         self._assembledPackage.retrieveDeletedObjects(), "Check Deleted Objects")
+        self.assertEqual(self._tarballPackage.retrieveRolledBackObjects(),
+                         self._assembledPackage.retrieveRolledBackObjects(), "Check Rolled Back Objects")
+
+    def test_runRules(self):
+        assembledRuleRunner = RuleRunner("resources/teradataQualityCheckRules.xml", self._assembledPackage)
+        assembledRuleRunner.runRules()
+
+        for jobs in (1, 2):
+            tarballRuleRunner = RuleRunner("resources/teradataQualityCheckRules.xml", self._tarballPackage, jobs)
+            tarballRuleRunner.runRules()
+
+            # The object counts are reported as sets (so only the other test cases are compared)
+            self.assertEqual(set(tarballRuleRunner._testCases.keys()), set(assembledRuleRunner._testCases.keys()),
+                             "Check Test Cases")
+            for testCaseName in assembledRuleRunner._testCases:
+                if testCaseName == ".Object Counts":
+                    continue
+                assembledTestCase = assembledRuleRunner._testCases.get(testCaseName)
+                tarballTestCase = tarballRuleRunner._testCases.get(testCaseName)
+                self.assertEqual(tarballTestCase.failure_message, assembledTestCase.failure_message, "Check Failures")
+                self.assertEqual(tarballTestCase.error_message, assembledTestCase.error_message, "Check Warnings")
+                self.assertEqual(tarballTestCase.stdout, assembledTestCase.stdout, "Check Information")
+
+
+class testImaginaryTarballPackage(unittest.TestCase):
+    """
+    Unit Tests for the TarballPackage Class using an imaginary (i.e. doesn't exist) package.
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+    def test_ImaginaryPackage(self):
+        self.assertRaises(ValueError, TarballPackage, "resources/test/", "imaginary_file.tgz")
+
+
+if __name__ == "__main__":
+    unittest.main()
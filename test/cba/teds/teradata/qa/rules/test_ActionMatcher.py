@@ -0,0 +1,102 @@
+import unittest
+
+from unittest import mock
+
+from cba.teds.teradata.qa.rules.ActionMatcher import ActionMatcher, isCombinableAction
+from cba.teds.teradata.qa.rules.Rule import *
+from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testActionMatcher(unittest.TestCase):
+    """
+    Unit Tests for the ActionMatcher Class (and isCombinableAction()).
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_isCombinableAction(self):
+        self.assertTrue(isCombinableAction(Action("Pattern", ActionType.PatternMatch.value, r"IS '(.{0,257})'")),
+                        "Check Pattern")
+        self.assertFalse(isCombinableAction(Action("Text", ActionType.TextMatch.value, "MULTISET")), "Check Text")
+        self.assertFalse(isCombinableAction(Action("Flags", ActionType.PatternMatch.value, r"(?i)multiset")),
+                         "Check Flags")
+        self.assertFalse(isCombinableAction(Action("Named", ActionType.PatternMatch.value, r"(?P<name>A)")),
+                         "Check Named Group")
+        self.assertFalse(isCombinableAction(Action("Reference", ActionType.PatternMatch.value, r"(A)\1")),
+                         "Check Group Reference")
+
+        # A pattern that can't be parsed (see PatternParser) is not combined
+        with mock.patch("cba.teds.teradata.qa.rules.PatternParser.sre_parse", None):
+            self.assertFalse(isCombinableAction(Action("Pattern", ActionType.PatternMatch.value, r"IS '(.{0,257})'")),
+                             "Check Without Parser")
+
+    def test_match(self):
+        first = Action("First", ActionType.PatternMatch.value, r"ABCD")
+        second = Action("Second", ActionType.PatternMatch.value, r"BC")
+        third = Action("Third", ActionType.PatternMatch.value, r"^BC")
+        text = Action("Text", ActionType.TextMatch.value, "ABCD")
+        actionMatcher = ActionMatcher([first, second, third, text, second])
+
+        self.assertEqual(actionMatcher.actions, [first, second, third], "Check Actions")
+
+        # An Action that matches inside (or at the same position as) the match of another Action is found
+        self.assertEqual(actionMatcher.match("xxABCDxx"), set([first, second]), "Check Overlapping")
+        self.assertEqual(actionMatcher.match("BCD"), set([second, third]), "Check Same Position")
+        self.assertEqual(actionMatcher.match("xxxx"), set(), "Check No Match")
+
+    def test_matchCommonPrefix(self):
+        # The common literal prefix (i.e. "A\.") is taken out of the alternation (but not a repeated literal)
+        first = Action("First", ActionType.PatternMatch.value, r"A\.B+C")
+        second = Action("Second", ActionType.PatternMatch.value, r"A\.BD")
+        third = Action("Third", ActionType.PatternMatch.value, r"A\.\d")
+        actionMatcher = ActionMatcher([first, second, third])
+
+        self.assertTrue(actionMatcher._buildPattern((0, 1, 2)).startswith(r"A\.(?:"), "Check Prefix")
+        self.assertEqual(actionMatcher.match("A.BBC A.BD"), set([first, second]), "Check Repeated Literal")
+        self.assertEqual(actionMatcher.match("A.C A.1"), set([third]), "Check Escape")
+        self.assertEqual(actionMatcher.match("AXBD"), set(), "Check Escaped Dot")
+
+    def test_matchTopLevelBranch(self):
+        # The literal prefix of an alternative is not taken out of the alternation (the other alternatives don't
+        # start with it)
+        actions = [Action("Branch", ActionType.PatternMatch.value, r"COMPRESS\s\(|FOO"),
+                   Action("Folded", ActionType.PatternMatch.value, r"COMPRESSA|COMPRESSB"),
+                   Action("Grouped", ActionType.PatternMatch.value, r"COMPRESS(?:Y|Z)[|]"),
+                   Action("Prefix", ActionType.PatternMatch.value, r"COMPRESSX")]
+        actionMatcher = ActionMatcher(actions)
+        self.assertEqual(actionMatcher._buildPattern((1, 3)), r"(?:(?P<a1>COMPRESSA|COMPRESSB)|(?P<a3>COMPRESSX))",
+                         "Check Top-Level Branch")
+
+        for data in ("FOO", "COMPRESS (", "COMPRESSB", "COMPRESSX", "COMPRESSY|", "COMPRESSZ", "xx COMPRESSA FOO", ""):
+            matchedActions = actionMatcher.match(data)
+            for action in actions:
+                # executeAction() is True if the action is required (i.e. the pattern is not found)
+                self.assertEqual(action in matchedActions, not action.executeAction(data, None),
+                                 "Check %s (%s)" % (action.name, data))
+            for indexes in ((0, 3), (1, 3), (2, 3)):
+                self.assertEqual(ActionMatcher([actions[index] for index in indexes]).match(data),
+                                 set(actions[index] for index in indexes if actions[index].pattern.search(data)),
+                                 "Check Pair %s (%s)" % (indexes, data))
+
+    def test_matchActionsOfRules(self):
+        # The matcher must agree with each Action on its own
+        ruleReader = RuleReader("resources/teradataQualityCheckRules.xml")
+        actions = list(ruleReader.retrieveListOfActions().values())
+        actionMatcher = ActionMatcher(actions)
+        self.assertGreater(len(actionMatcher.actions), 5, "Check Combined Actions")
+
+        lines = ["RECORD_DELETED_FLAG BYTEINT COMPRESS (0,1)", "PROCESS_NAME CHAR(10) COMPRESS 'PROCESS',",
+                 "CTL_ID SMALLINT COMPRESS 123,", "EXPY_D DATE COMPRESS (DATE '9999-12-31'),",
+                 "EXPY_TS TIMESTAMP(6) COMPRESS (TIMESTAMP '9999-12-31 00:00:00.000000'),",
+                 "LOCKING ROW FOR ACCESS REPLACE VIEW V AS SELECT * FROM T", "COMMENT ON TABLE T IS 'A Comment';",
+                 "COMPRESS (0,1) COMPRESS 123 IS 'X'", ""]
+        for line in lines:
+            expectedActions = set(action for action in actionMatcher.actions if action.pattern.search(line))
+            self.assertEqual(actionMatcher.match(line), expectedActions, "Check %s" % line)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from cba.teds.teradata.qa.rules.ActionMemo import ActionMemo
+from cba.teds.teradata.qa.rules.Rule import *
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testActionMemo(unittest.TestCase):
+    """
+    Unit Tests for ActionMemo Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def setUp(self):
+        self._action = Action("Check for ByteInt Compression", ActionType.PatternMatch.value,
+                              r"COMPRESS\s?\(\s?0\s?,\s?1\s?\)")
+        self._crAction = Action("Check for CR Number", ActionType.ContainsCrNumber.value, "")
+
+    def test_retrieveResult(self):
+        actionMemo = ActionMemo()
+        key = actionMemo.buildKey(self._action, "RECORD_DELETED_FLAG BYTEINT COMPRESS (0,1)")
+
+        self.assertIsNone(actionMemo.retrieveResult(key), "Check Miss")
+        actionMemo.storeResult(key, False)
+        self.assertEqual(actionMemo.retrieveResult(key), False, "Check Hit")
+        self.assertEqual((actionMemo.hits, actionMemo.misses), (1, 1), "Check Counts")
+        self.assertEqual(actionMemo.hitRate(), 50.0, "Check Hit Rate")
+
+        # The same data for another Action (or another Change Request Number) is another entry
+        self.assertNotEqual(actionMemo.buildKey(self._crAction, "COMMENT ON TABLE T IS 'C1234567';", "C1234567"),
+                            actionMemo.buildKey(self._crAction, "COMMENT ON TABLE T IS 'C1234567';", "C7654321"),
+                            "Check Package Fact")
+        self.assertIsNone(actionMemo.retrieveResult(actionMemo.buildKey(self._crAction,
+                                                                        "RECORD_DELETED_FLAG BYTEINT COMPRESS (0,1)")),
+                          "Check Other Action")
+
+        self.assertEqual(actionMemo.drainHits(), (1, 2), "Check Drain")
+        self.assertEqual((actionMemo.hits, actionMemo.misses), (0, 0), "Check Drained")
+
+    def test_evict(self):
+        actionMemo = ActionMemo(maxSize=2, maxDataLength=10)
+        first = actionMemo.buildKey(self._action, "FIRST")
+        second = actionMemo.buildKey(self._action, "SECOND")
+        third = actionMemo.buildKey(self._action, "THIRD")
+
+        actionMemo.storeResult(first, True)
+        actionMemo.storeResult(second, True)
+        actionMemo.retrieveResult(first)
+        actionMemo.storeResult(third, True)
+
+        # The least recently used entry is evicted
+        self.assertIsNone(actionMemo.retrieveResult(second), "Check Evicted")
+        self.assertEqual(actionMemo.retrieveResult(first), True, "Check Recently Used")
+        self.assertEqual(actionMemo.retrieveResult(third), True, "Check Latest")
+
+        # Long data is not memoized
+        self.assertIsNone(actionMemo.buildKey(self._action, "X" * 11), "Check Long Data")
+
+    def test_evictCharacters(self):
+        actionMemo = ActionMemo(maxSize=10, maxDataLength=10, maxCharacters=12)
+        first = actionMemo.buildKey(self._action, "FIRST")
+        second = actionMemo.buildKey(self._action, "SECOND")
+        third = actionMemo.buildKey(self._action, "THIRD")
+
+        actionMemo.storeResult(first, True)
+        actionMemo.storeResult(second, True)
+        actionMemo.storeResult(second, False)
+        self.assertEqual(actionMemo._characters, 11, "Check Characters")
+
+        # The memo is full (by the length of its data, not the number of entries)
+        actionMemo.storeResult(third, True)
+        self.assertIsNone(actionMemo.retrieveResult(first), "Check Evicted")
+        self.assertEqual(actionMemo.retrieveResult(second), False, "Check Not Evicted")
+        self.assertEqual(actionMemo._characters, 11, "Check Characters After Eviction")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from unittest import mock
+
+import cba.teds.teradata.qa.rules.ArtifactCorpus as ArtifactCorpusModule
+from cba.teds.teradata.qa.rules.ArtifactCorpus import ArtifactCorpus, isCorpusWhen
+from cba.teds.teradata.qa.rules.Rule import *
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testArtifactCorpus(unittest.TestCase):
+    """
+    Unit Tests for ArtifactCorpus Class (and isCorpusWhen()).
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def _buildWhen(self, value, scope=WhenScope.Line.value, type=WhenType.MatchesPattern.value):
+        return When("Test When", value, type, scope, WhenFilter.CreateTable.value)
+
+    def _buildCorpus(self):
+        corpus = ArtifactCorpus()
+        corpus.appendArtifact("first.tbl", "CREATE MULTISET TABLE A\n  X BYTEINT COMPRESS (0,1)\n")
+        corpus.appendArtifact("empty.tbl", "")
+        corpus.appendArtifact("second.tbl", "CREATE TABLE B\n  Y BYTEINT COMPRESS ( 0 , 1 )\n  Z BYTEINT COMPRESS (0,1)")
+        return corpus
+
+    def test_isCorpusWhen(self):
+        self.assertTrue(isCorpusWhen(self._buildWhen(r"COMPRESS\s?\(\s?0\s?,\s?1\s?\)")), "Check Pattern")
+        self.assertFalse(isCorpusWhen(self._buildWhen(r"^CREATE")), "Check Anchor")
+        self.assertFalse(isCorpusWhen(self._buildWhen(r"TABLE(?! B)")), "Check Lookahead")
+        self.assertFalse(isCorpusWhen(self._buildWhen(r"COMPRESS", WhenScope.Script.value)), "Check Script Scope")
+        self.assertFalse(isCorpusWhen(self._buildWhen(r"COMPRESS", type=WhenType.Contains.value)), "Check Contains")
+
+        # A pattern that can't be parsed (see PatternParser) is searched for line by line
+        with mock.patch("cba.teds.teradata.qa.rules.PatternParser.sre_parse", None):
+            self.assertFalse(isCorpusWhen(self._buildWhen(r"COMPRESS\s?\(\s?0\s?,\s?1\s?\)")), "Check Without Parser")
+
+    def test_appendArtifact(self):
+        corpus = self._buildCorpus()
+        self.assertEqual(corpus.retrieveArtifactCount(), 2, "Check Artifacts (the empty artifact is skipped)")
+        self.assertEqual(corpus.retrieveLineCount(), 5, "Check Lines")
+
+    def test_findWhenData(self):
+        corpus = self._buildCorpus()
+        when = self._buildWhen(r"COMPRESS\s?\(\s?0\s?,\s?1\s?\)")
+        whenData = corpus.findWhenData(when)
+
+        self.assertEqual([data.artifactName for data in whenData], ["first.tbl", "second.tbl", "second.tbl"],
+                         "Check Artifacts")
+        self.assertEqual([data.data for data in whenData],
+                         ["  X BYTEINT COMPRESS (0,1)\n", "  Y BYTEINT COMPRESS ( 0 , 1 )\n",
+                          "  Z BYTEINT COMPRESS (0,1)"], "Check Lines (the last line doesn't end with a newline)")
+
+        # A line is only matched once
+        self.assertEqual(len(corpus.findWhenData(self._buildWhen(r"T"))), 5, "Check One Match per Line")
+
+        # A match that spans two lines is not a match of either line
+        self.assertEqual(corpus.findWhenData(self._buildWhen(r"B\s+Y")), [], "Check Spanning Match")
+        self.assertEqual(corpus.findWhenData(self._buildWhen(r"NOT_IN_CORPUS")), [], "Check No Match")
+
+    def test_findWhenDataWithoutNumpy(self):
+        numpy = ArtifactCorpusModule.numpy
+        ArtifactCorpusModule.numpy = None
+        try:
+            whenData = self._buildCorpus().findWhenData(self._buildWhen(r"TABLE"))
+        finally:
+            ArtifactCorpusModule.numpy = numpy
+
+        self.assertEqual([data.artifactName for data in whenData], ["first.tbl", "second.tbl"], "Check Artifacts")
+
+
+if __name__ == "__main__":
+    unittest.main()
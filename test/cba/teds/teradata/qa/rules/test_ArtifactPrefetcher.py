@@ -0,0 +1,60 @@
+import threading
+import unittest
+
+from cba.teds.teradata.qa.rules.ArtifactPrefetcher import ArtifactPrefetcher
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testArtifactPrefetcher(unittest.TestCase):
+    """
+    Unit Tests for ArtifactPrefetcher Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def _readArtifact(self, filePath):
+        if filePath == "broken.tbl":
+            raise IOError("Cannot Read: %s" % filePath)
+        return filePath.upper()
+
+    def test_retrieveNextArtifact(self):
+        filePaths = ["file%d.tbl" % index for index in range(20)] + ["broken.tbl"]
+        for readers in (1, 3):
+            prefetcher = ArtifactPrefetcher(filePaths, self._readArtifact, 4, readers)
+            try:
+                artifacts = [prefetcher.retrieveNextArtifact() for filePath in filePaths]
+                self.assertRaises(IndexError, prefetcher.retrieveNextArtifact)
+            finally:
+                prefetcher.close()
+
+            # The artifacts are retrieved in order (and an artifact that can't be read is None)
+            self.assertEqual([filePath for filePath, artifact in artifacts], filePaths, "Check Order (%d)" % readers)
+            self.assertEqual(artifacts[0][1], "FILE0.TBL", "Check Artifact (%d)" % readers)
+            self.assertIsNone(artifacts[-1][1], "Check Broken Artifact (%d)" % readers)
+            self.assertGreaterEqual(prefetcher.waitTime, 0.0, "Check Wait Time")
+
+    def test_depth(self):
+        # The readers stop reading once depth artifacts are waiting to be retrieved
+        readCount = [0]
+        lock = threading.Lock()
+
+        def readArtifact(filePath):
+            with lock:
+                readCount[0] += 1
+            return filePath
+
+        filePaths = ["file%d.tbl" % index for index in range(50)]
+        prefetcher = ArtifactPrefetcher(filePaths, readArtifact, 4, 2)
+        try:
+            self.assertEqual(prefetcher.retrieveNextArtifact()[0], "file0.tbl", "Check First Artifact")
+        finally:
+            prefetcher.close()
+
+        # At most depth artifacts queued (plus one being put by each reader) before close()
+        self.assertLessEqual(readCount[0], 4 + 1 + 2, "Check Read Ahead")
+
+
+if __name__ == "__main__":
+    unittest.main()
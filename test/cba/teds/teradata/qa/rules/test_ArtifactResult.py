@@ -0,0 +1,37 @@
+import unittest
+
+from cba.teds.teradata.qa.rules.ArtifactResult import ArtifactResult
+
+
+class testArtifactResult(unittest.TestCase):
+    """
+    Unit Tests for ArtifactResult Class.
+    """
+
+    def test_noMessages(self):
+        artifactResult = ArtifactResult("name", "classname")
+        self.assertIsNone(artifactResult.failure_message, "Check Failure")
+        self.assertIsNone(artifactResult.error_message, "Check Warning")
+        self.assertIsNone(artifactResult.stdout, "Check Information")
+
+    def test_joinMessages(self):
+        artifactResult = ArtifactResult("name", "classname")
+        artifactResult.recordFailure("First")
+        artifactResult.recordFailure("Second")
+        artifactResult.recordWarning("Warning")
+        artifactResult.recordInformation("Information")
+
+        self.assertEqual(artifactResult.failure_message, "First _BR_ Second", "Check Failure")
+        self.assertEqual(artifactResult.error_message, "Warning", "Check Warning")
+        self.assertEqual(artifactResult.stdout, "Information", "Check Information")
+
+    def test_emptyFirstMessage(self):
+        artifactResult = ArtifactResult("name", "classname")
+        artifactResult.recordFailure("")
+        self.assertIsNone(artifactResult.failure_message, "Check Empty Failure")
+        artifactResult.recordFailure("First")
+        self.assertEqual(artifactResult.failure_message, "First", "Check Failure")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.teradata.qa.artifacts.TarballPackage import TarballPackage
+from cba.teds.teradata.qa.rules.ExtractionPlan import ExtractionPlan
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testExtractionPlan(unittest.TestCase):
+    """
+    Unit Tests for the ExtractionPlan Class.
+
+    These are currently configured to run using "test_assembled_package.tgz" in "resources/test/" with a rules file
+    that only checks the tables (CREATE_TABLE).
+    """
+
+    @classmethod
+    def setUpClass(self):
+
+        forceWorkingDirectory()
+
+        self._testPackageFileName = "test_assembled_package.tgz"
+        self._testPackageLocation = "resources/test/"
+
+        self._rulesDirectory = tempfile.mkdtemp(prefix="EXTRACTION_PLAN_")
+        self._tableRulesFile = self._rulesDirectory + "/tableRules.xml"
+        with open(self._tableRulesFile, "w") as rulesFile:
+            rulesFile.write("""<checks>
+    <assembledTeradataPackageChecks>
+        <whens>
+            <when name="Create Table Statement" value="TABLE P_D" type="CONTAINS" scope="LINE" filter="CREATE_TABLE" />
+            <when name="Create STG Table Statement" value="_STG." type="CONTAINS" scope="FILE_PATH" filter="ALL" />
+        </whens>
+        <actions>
+            <action name="Check for Multiset Statement" textMatch="MULTISET" />
+            <action name="Check for STS File Type" noTextMatch=".sts" />
+        </actions>
+        <rules>
+            <rule when="Create Table Statement" action="Check for Multiset Statement" level="warning" message="MULTISET"/>
+            <rule when="Create STG Table Statement" action="Check for STS File Type" level="error" message="STS"/>
+        </rules>
+    </assembledTeradataPackageChecks>
+</checks>
+""")
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self._rulesDirectory, ignore_errors=True)
+
+    def _retrieveTestCases(self, assembledPackage):
+        # The object counts are printed from sets (so they are compared as sets, see test_selectiveExtraction())
+        ruleRunner = RuleRunner(self._tableRulesFile, assembledPackage)
+        ruleRunner.runRules()
+        return sorted((testCaseName, testCase.failure_message, testCase.error_message, testCase.stdout)
+                      for testCaseName, testCase in ruleRunner._testCases.items() if testCaseName != ".Object Counts")
+
+    def test_requiresContent(self):
+        extractionPlan = ExtractionPlan("resources/teradataQualityCheckRules.xml")
+        # The default rules have a LINE When for ALL artifacts
+        self.assertTrue(extractionPlan.requiresContent("TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0.FACT.viw"), "Check View")
+        self.assertTrue(extractionPlan.requiresContent("release_info.txt"), "Check Text File")
+        self.assertFalse(extractionPlan.requiresContent("diff.tar.gz"), "Check Archive")
+
+        extractionPlan = ExtractionPlan(self._tableRulesFile)
+        self.assertTrue(extractionPlan.requiresContent("TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0.FACT.tbl"), "Check Table")
+        self.assertFalse(extractionPlan.requiresContent("TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0.FACT.viw"), "Check View")
+        self.assertFalse(extractionPlan.requiresContent("release_info.txt"), "Check Text File")
+        # The package-level checks always need the Version File and the drop, rollback and backup scripts
+        self.assertTrue(extractionPlan.requiresContent("TERADATA/RELEASE/BICD/2.123/Version.txt"), "Check Version")
+        self.assertTrue(extractionPlan.requiresContent("DBAI/AUTO_DROP/Auto_Drop_Tables/10_R2.123_Drop_Tables.sql"),
+                        "Check Drop Tables")
+        self.assertTrue(extractionPlan.requiresContent("DBAI/AUTO_BACKUP/Auto_Backup_Views/10_R2.123_Backup_Views.sql"),
+                        "Check Backup Views")
+
+    def test_selectiveExtraction(self):
+        extractionPlan = ExtractionPlan(self._tableRulesFile)
+
+        assembledPackage = AssembledPackage(self._testPackageLocation, self._testPackageFileName)
+        selectivePackage = AssembledPackage(self._testPackageLocation, self._testPackageFileName,
+                                            extractionPlan=extractionPlan)
+
+        # Every member is listed but only the required members are extracted
+        fullDirectory = assembledPackage._extractedFilesRelativeDirectory()
+        selectiveDirectory = selectivePackage._extractedFilesRelativeDirectory()
+        self.assertEqual(sorted(filePath[len(selectiveDirectory):] for filePath in
+                                selectivePackage.retrieveAssembledPackageFilesList()),
+                         sorted(filePath[len(fullDirectory):] for filePath in
+                                assembledPackage.retrieveAssembledPackageFilesList()), "Check File List")
+        for filePath in selectivePackage.retrieveAssembledPackageFilesList():
+            self.assertEqual(os.path.isfile(filePath), extractionPlan.requiresContent(filePath[len(selectiveDirectory):]),
+                             "Check Extracted %s" % filePath)
+
+        self.assertEqual(selectivePackage.retrieveChangeRequestNumber(), assembledPackage.retrieveChangeRequestNumber(),
+                         "Check Change Request Number")
+        self.assertEqual(selectivePackage.retrieveCreatedObjects(), assembledPackage.retrieveCreatedObjects(),
+                         "Check Created Objects")
+        self.assertEqual(selectivePackage.retrieveDeletedObjects(), assembledPackage.retrieveDeletedObjects(),
+                         "Check Deleted Objects")
+        self.assertEqual(selectivePackage.retrieveRolledBackObjects(), assembledPackage.retrieveRolledBackObjects(),
+                         "Check Rolled Back Objects")
+
+        # The findings are the same (the test cases are in member order rather than walk order)
+        self.assertEqual(self._retrieveTestCases(selectivePackage), self._retrieveTestCases(assembledPackage),
+                         "Check Test Cases")
+
+    def test_selectiveTarballPackage(self):
+        extractionPlan = ExtractionPlan(self._tableRulesFile)
+
+        tarballPackage = TarballPackage(self._testPackageLocation, self._testPackageFileName)
+        selectivePackage = TarballPackage(self._testPackageLocation, self._testPackageFileName, extractionPlan)
+
+        self.assertEqual(selectivePackage.retrieveAssembledPackageFilesList(),
+                         tarballPackage.retrieveAssembledPackageFilesList(), "Check File List")
+        self.assertLess(len(selectivePackage.retrieveInMemoryArtifacts()), len(tarballPackage.retrieveInMemoryArtifacts()),
+                        "Check Fewer Members Read")
+        self.assertEqual(self._retrieveTestCases(selectivePackage), self._retrieveTestCases(tarballPackage),
+                         "Check Test Cases")
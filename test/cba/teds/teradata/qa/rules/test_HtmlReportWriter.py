@@ -0,0 +1,84 @@
+import io
+import os
+import unittest
+
+from cba.teds.teradata.qa.rules.HtmlReportWriter import *
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testHtmlReportWriter(unittest.TestCase):
+    """
+    Unit Tests for HtmlReportWriter Class (and readJunitReport()).
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+        if os.path.isdir("output") == False:
+            os.makedirs("output")
+
+    def test_replaceBreaks(self):
+        self.assertEqual(replaceBreaks("First _BR_ Second <Escaped> & Café"),
+                         "First <br> Second &lt;Escaped&gt; &amp; Caf&#233;", "Check Breaks")
+
+    def test_injectConfluenceLinks(self):
+        html = injectConfluenceLinks("Must contain MULTISET ([[A-2]]) _BR_ Must contain COMPRESS ([[A-1]])")
+        self.assertEqual(html.count("link to Confluence"), 2, "Check Links")
+        self.assertIn('href="%sA-2"' % CONFLUENCE_URL, html, "Check First Link")
+        self.assertIn('href="%sA-1"' % CONFLUENCE_URL, html, "Check Second Link")
+        self.assertIn(") <br> Must contain COMPRESS (", html, "Check Break")
+
+        # The same as the XSLT (substring-before/substring-after) when a link is not closed
+        self.assertEqual(injectConfluenceLinks("Not closed [[A-1"),
+                         'Not closed <a target="_blank" href="%s">link to Confluence</a>' % CONFLUENCE_URL,
+                         "Check Unclosed Link")
+
+    def test_writeReport(self):
+        passed = ReportTestCase("/TERADATA/P_D_BAL_001/P_D_BAL_001_STD_0/GOOD.tbl")
+        failed = ReportTestCase("/DBAI/AUTO_BACKUP/Auto_Backup_Tables/10_R2.123_Backup_Tables.sql")
+        failed.failure_message = "Backup Tables must contain the Change Record (CR) Number ([[A-4]])"
+        warned = ReportTestCase(".Change Record Number")
+        warned.error_message = "The Change Record Number is: CXXXXXXX"
+
+        reportFile = io.StringIO()
+        HtmlReportWriter(reportFile, "feature/branch", "11", "14:30 26-05-2015", "22").writeReport(
+            [("Teradata Package Check", 3, [passed, failed, warned])])
+        html = reportFile.getvalue()
+
+        self.assertIn('<tr valign="top" class="Failure">', html, "Check Summary Class")
+        self.assertIn("<td>33.33%</td>", html, "Check Success Rate")
+        self.assertIn("?at=refs%2Fheads%2Ffeature/branch", html, "Check Stash Link")
+        self.assertIn("22:id/assembled_package.tgz", html, "Check Package Link")
+        self.assertIn("buildId=11", html, "Check QA Build Link")
+
+        # The test cases are sorted by name
+        self.assertLess(html.index(".Change Record Number"), html.index("/DBAI/"), "Check Order")
+        self.assertLess(html.index("/DBAI/"), html.index("/TERADATA/"), "Check Order")
+        self.assertEqual(html.count('class="passRow"'), 1, "Check Pass Rows")
+
+    def test_generateHtmlReport(self):
+        assembledPackage = AssembledPackage("resources/test/", "test_assembled_package.tgz")
+        ruleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', assembledPackage)
+        ruleRunner.runRules()
+
+        junitReport = "output/junit-testHtmlReportWriter.xml"
+        htmlReport = "output/testHtmlReportWriter.html"
+        ruleRunner.generateReport(junitReport)
+        ruleRunner.generateHtmlReport(htmlReport, "develop", "11", "14:30 26-05-2015", "22")
+
+        # The report from the results is the same as the report from the JUnit Report
+        reportFile = io.StringIO()
+        HtmlReportWriter(reportFile, "develop", "11", "14:30 26-05-2015", "22").writeReport(
+            readJunitReport(junitReport))
+        with open(htmlReport) as htmlFile:
+            self.assertEqual(htmlFile.read(), reportFile.getvalue(), "Check Report")
+
+        testSuites = readJunitReport(junitReport)
+        self.assertEqual(len(testSuites), 1, "Check Test Suites")
+        self.assertEqual(testSuites[0][1], len(ruleRunner.retrieveTestCases()), "Check Tests")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import io
+import unittest
+
+from collections import OrderedDict
+from junit_xml import TestSuite, TestCase
+from cba.teds.teradata.qa.rules.ArtifactResult import ArtifactResult
+from cba.teds.teradata.qa.rules.JunitReportWriter import JunitReportWriter
+
+
+class testJunitReportWriter(unittest.TestCase):
+    """
+    Unit Tests for JunitReportWriter Class (the report must be the same as the junit_xml report).
+    """
+
+    def _writeTestSuite(self, testCases, properties=None):
+        reportFile = io.StringIO()
+        JunitReportWriter(reportFile).writeTestSuite("Teradata Package Check", testCases, properties)
+        return reportFile.getvalue()
+
+    def test_emptyTestSuite(self):
+        self.assertEqual(self._writeTestSuite([]), TestSuite.to_xml_string([TestSuite("Teradata Package Check")]),
+                         "Check Empty Report")
+
+    def test_writeTestSuite(self):
+        messages = ["Objects: \n{'A', 'B'}", "Tab\tReturn\r & <Escaped> \"Quotes\" 'Apostrophes'", "Bell\x07",
+                    "Unicode é’"]
+
+        testCases = []
+        artifactResults = []
+        for index, message in enumerate(messages):
+            name = "\\TERADATA\\P_D_BAL_001\\%d.tbl" % index
+            testCase = TestCase(name, name)
+            artifactResult = ArtifactResult(name, name)
+            if index != 1:
+                testCase.add_failure_info("%s _BR_ %s" % (message, message))
+                artifactResult.recordFailure(message)
+                artifactResult.recordFailure(message)
+            if index != 2:
+                testCase.add_error_info(message)
+                artifactResult.recordWarning(message)
+            testCase.stdout = message
+            artifactResult.recordInformation(message)
+            testCases.append(testCase)
+            artifactResults.append(artifactResult)
+
+        testCases.append(TestCase("Passed", "Passed"))
+        artifactResults.append(ArtifactResult("Passed", "Passed"))
+
+        properties = OrderedDict([("When: Create Table", "time=0.000001 files=1 lines=2 matches=1")])
+
+        expectedReport = TestSuite.to_xml_string([TestSuite("Teradata Package Check", testCases, properties=properties)])
+        self.assertEqual(self._writeTestSuite(artifactResults, properties), expectedReport, "Check Report")
+        self.assertEqual(self._writeTestSuite(testCases, properties), expectedReport, "Check Report (TestCase)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+
+import unittest
+
+from cba.teds.teradata.qa.rules.KeywordIndex import KeywordIndex, loadKeywordIndex
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testKeywordIndex(unittest.TestCase):
+    """
+    Unit Tests for the KeywordIndex Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_beginsWithKeyword(self):
+        keywordIndex = KeywordIndex(["ABORT ", "ABS ", "CREATE", "NOT NULL "])
+
+        self.assertTrue(keywordIndex.beginsWithKeyword("   ABORT CHAR(1),"), "Check Token")
+        self.assertTrue(keywordIndex.beginsWithKeyword("ABS INTEGER"), "Check Token 2")
+        self.assertFalse(keywordIndex.beginsWithKeyword("ABORTED CHAR(1),"), "Check Longer Token")
+        self.assertFalse(keywordIndex.beginsWithKeyword("ABORT"), "Check No Trailing Space")
+        self.assertFalse(keywordIndex.beginsWithKeyword("ACCT_ID ABORT"), "Check Not Leading")
+        self.assertTrue(keywordIndex.beginsWithKeyword("CREATED_TS TIMESTAMP(6)"), "Check Prefix")
+        self.assertTrue(keywordIndex.beginsWithKeyword("NOT NULL DEFAULT 0"), "Check Prefix With Space")
+        self.assertFalse(keywordIndex.beginsWithKeyword(""), "Check Empty Line")
+
+    def test_matchesKeywordList(self):
+        # The index must agree with a String.find() for each keyword (in the keywords file)
+        keywordIndex = loadKeywordIndex("resources/Teradata_Reserved_Words.csv")
+        self.assertIs(keywordIndex, loadKeywordIndex("resources/Teradata_Reserved_Words.csv"), "Check Loaded Once")
+        self.assertEqual(len(keywordIndex), len(list(keywordIndex)), "Check Keywords")
+
+        lines = ["ACCT_IDNN_HK CHAR(32) CHARACTER SET LATIN NOT CASESPECIFIC TITLE 'Account Identifier HK' NOT NULL,",
+                 "    DATE DATE FORMAT 'YYYY-MM-DD' TITLE 'Date',",
+                 "  ABORT CHAR(1) TITLE 'Abort',",
+                 "TITLE VARCHAR(10) TITLE 'Title',",
+                 "TITLES VARCHAR(10) TITLE 'Titles',",
+                 "USER\tCHAR(8) TITLE 'User',",
+                 ""]
+
+        for line in lines:
+            expected = any(line.lstrip().find(keyword) == 0 for keyword in keywordIndex)
+            self.assertEqual(keywordIndex.beginsWithKeyword(line), expected, "Check Line: %s" % line)
+
+
+if __name__ == "__main__":
+    unittest.main()
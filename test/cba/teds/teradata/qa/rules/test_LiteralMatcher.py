@@ -0,0 +1,71 @@
+
+import unittest
+
+from cba.teds.teradata.qa.rules.Rule import *
+from cba.teds.teradata.qa.rules.LiteralMatcher import LiteralMatcher, isLiteralWhen
+from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testLiteralMatcher(unittest.TestCase):
+    """
+    Unit Tests for the LiteralMatcher Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_isLiteralWhen(self):
+        self.assertTrue(isLiteralWhen(When("A", "TABLE P_D", WhenType.Contains.value, WhenScope.Line.value,
+                                           WhenFilter.CreateTable.value)), "Check CONTAINS")
+        self.assertTrue(isLiteralWhen(When("B", "REPLACE VIEW", WhenType.BeginsWith.value, WhenScope.Script.value,
+                                           WhenFilter.CreateView.value)), "Check BEGINS_WITH")
+        self.assertFalse(isLiteralWhen(When("C", "\\sTITLE\\s\\'", WhenType.MatchesPattern.value,
+                                            WhenScope.Line.value, WhenFilter.CreateTable.value)), "Check Pattern")
+        self.assertFalse(isLiteralWhen(When("D", "_STG.", WhenType.Contains.value, WhenScope.FilePath.value,
+                                            WhenFilter.All.value)), "Check File Path")
+
+    def test_match(self):
+        beetleJuice = When("BeetleJuice", "BeetleJuice", WhenType.Contains.value, WhenScope.Line.value,
+                           WhenFilter.All.value)
+        juice = When("Juice", "Juice", WhenType.Contains.value, WhenScope.Line.value, WhenFilter.All.value)
+        beetle = When("Beetle", "Beetle", WhenType.BeginsWith.value, WhenScope.Line.value, WhenFilter.All.value)
+        ice = When("Ice", "ice", WhenType.BeginsWith.value, WhenScope.Line.value, WhenFilter.All.value)
+
+        literalMatcher = LiteralMatcher([beetleJuice, juice, beetle, ice])
+
+        self.assertEqual(literalMatcher.match("BeetleJuice BeetleJuice"), {beetleJuice, juice, beetle}, "Check 1")
+        self.assertEqual(literalMatcher.match("Say BeetleJuice"), {beetleJuice, juice}, "Check 2")
+        self.assertEqual(literalMatcher.match("ice Juice"), {juice, ice}, "Check 3")
+        self.assertEqual(literalMatcher.match("Beetl"), set(), "Check 4")
+        self.assertEqual(literalMatcher.match(""), set(), "Check 5")
+
+    def test_matchAgreesWithWhen(self):
+        # Every literal When in the rules file must match exactly the lines that When.isConditionMatched() matches
+        ruleReader = RuleReader("resources/teradataQualityCheckRules.xml")
+        whens = [when for when in ruleReader.retrieveListOfWhenConditions().values() if isLiteralWhen(when)]
+        self.assertTrue(len(whens) > 0, "Check Literal Whens")
+
+        literalMatcher = LiteralMatcher(whens)
+
+        lines = ["RECORD_DELETED_FLAG BYTEINT NOT NULL COMPRESS (0,1),",
+                 "   PROCESS_NAME CHAR(30) CHARACTER SET LATIN COMPRESS 'P_D_BAL_001',",
+                 "UPDATE_PROCESS_NAME CHAR(30)",
+                 "CREATE MULTISET TABLE P_D_BAL_001_STD_0.FACT_ACCT_BALN_STG ,NO FALLBACK ,",
+                 "REPLACE VIEW P_V_BAL_001_STD_0.FACT_ACCT_BALN_STG AS",
+                 "COMMENT ON TABLE P_D_BAL_001_STD_0.FACT_ACCT_BALN_STG IS 'C1403206 A Comment';",
+                 "SHOW VIEW P_V_BAL_001_STD_0.FACT_ACCT_BALN_STG;",
+                 "CTL_ID SMALLINT NOT NULL COMPRESS 0,",
+                 "EXPY_D DATE FORMAT 'YYYY-MM-DD'",
+                 "EXPY_TS TIMESTAMP(6)",
+                 "",
+                 "\n"]
+
+        for line in lines:
+            expectedWhens = set(when for when in whens if when.isConditionMatched(line))
+            self.assertEqual(literalMatcher.match(line.strip()), expectedWhens, "Check Line: %s" % line)
+
+
+if __name__ == "__main__":
+    unittest.main()
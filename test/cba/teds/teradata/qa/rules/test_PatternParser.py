@@ -0,0 +1,68 @@
+import unittest
+
+from unittest import mock
+
+from cba.teds.teradata.qa.rules.PatternParser import *
+from cba.teds.teradata.qa.rules.RequiredLiteral import extractRequiredLiteral
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testPatternParser(unittest.TestCase):
+    """
+    Unit Tests for the PatternParser functions.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_parsePattern(self):
+        self.assertIsNotNone(parsePattern(r"COMPRESS\s?\("), "Check Pattern")
+        self.assertIsNone(parsePattern(r"(TITLE"), "Check Invalid Pattern")
+
+    def test_containsOpcode(self):
+        self.assertTrue(containsOpcode(r"^CREATE", ("AT",)), "Check Anchor")
+        self.assertTrue(containsOpcode(r"(?:A|(?:B\b))+", ("AT",)), "Check Nested Anchor")
+        self.assertTrue(containsOpcode(r"(?=(A)\1)", ("GROUPREF",)), "Check Group Reference in Lookahead")
+        self.assertTrue(containsOpcode(r"(A)?(?(1)B|C\b)", ("AT",)), "Check Conditional")
+        self.assertFalse(containsOpcode(r"COMPRESS\s?\(", ("AT", "GROUPREF")), "Check No Opcode")
+        self.assertFalse(containsOpcode(r"A\bB", ("NOT_AN_OPCODE",)), "Check Unknown Opcode")
+        self.assertIsNone(containsOpcode(r"(TITLE", ("AT",)), "Check Invalid Pattern")
+
+    def test_collectRequiredLiterals(self):
+        self.assertEqual([literal for literal in collectRequiredLiterals(r"IS '(.{0,257})' AND\s") if literal],
+                         ["IS '", "' AND"], "Check Literals")
+        self.assertEqual([literal for literal in collectRequiredLiterals(r"(?:TITLE)?|\s") if literal], [],
+                         "Check Optional")
+
+    def test_splitLiteralPrefix(self):
+        literals, rest = splitLiteralPrefix(r"COMPRESS\s?\(")
+        self.assertEqual(("".join(literal for literal, source in literals), rest), ("COMPRESS", r"\s?\("),
+                         "Check Prefix")
+        literals, rest = splitLiteralPrefix(r"A\.B+C")
+        self.assertEqual(([source for literal, source in literals], rest), (["A", r"\."], "B+C"),
+                         "Check Escaped Prefix")
+
+        # A top-level alternation (even one the parser folds into a common prefix) has no prefix
+        self.assertTrue(containsTopLevelBranch(r"COMPRESSA|COMPRESSB"), "Check Top-Level Branch")
+        self.assertFalse(containsTopLevelBranch(r"COMPRESS(?:Y|Z)[|]\|"), "Check Nested Branch")
+        self.assertEqual(splitLiteralPrefix(r"COMPRESSA|COMPRESSB"), ([], r"COMPRESSA|COMPRESSB"),
+                         "Check Folded Branch")
+
+    def test_withoutParser(self):
+        # Without the (private) parser of the re module nothing is optimized (but nothing fails)
+        with mock.patch("cba.teds.teradata.qa.rules.PatternParser.sre_parse", None):
+            self.assertIsNone(parsePattern(r"COMPRESS\s?\("), "Check No Parse Tree")
+            self.assertIsNone(containsOpcode(r"^CREATE", ("AT",)), "Check Unknown Opcodes")
+            self.assertEqual(collectRequiredLiterals(r"COMPRESS\s?\("), [], "Check No Literals")
+            self.assertEqual(splitLiteralPrefix(r"COMPRESS\s?\("), ([], r"COMPRESS\s?\("), "Check No Prefix")
+            self.assertIsNone(extractRequiredLiteral(r"COMPRESS\s?\("), "Check No Required Literal")
+
+        # A parse tree that can't be walked (e.g. a new parser) is the same as no parse tree
+        with mock.patch("cba.teds.teradata.qa.rules.PatternParser.parsePattern", return_value=[("UNKNOWN",)]):
+            self.assertIsNone(containsOpcode(r"^CREATE", ("AT",)), "Check Unknown Parse Tree Opcodes")
+            self.assertEqual(collectRequiredLiterals(r"COMPRESS"), [], "Check Unknown Parse Tree Literals")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from cba.teds.teradata.qa.rules.RequiredLiteral import extractRequiredLiteral
+from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testRequiredLiteral(unittest.TestCase):
+    """
+    Unit Tests for extractRequiredLiteral().
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_extractRequiredLiteral(self):
+        self.assertEqual(extractRequiredLiteral(r"\sTITLE\s\'"), "TITLE", "Check Database Column")
+        self.assertEqual(extractRequiredLiteral(r"COMPRESS\s?\(\s?0\s?,\s?1\s?\)"), "COMPRESS", "Check Compression")
+        self.assertEqual(extractRequiredLiteral(r"LOCKING\s+ROW\s+.*\s*ACCESS"), "LOCKING", "Check Locking Rows")
+        self.assertEqual(extractRequiredLiteral(r"IS '(.{0,257})'"), "IS '", "Check Comment Size")
+        self.assertEqual(extractRequiredLiteral(r"(?:XYZW)+Q"), "XYZW", "Check Repeat")
+        self.assertEqual(extractRequiredLiteral(r"\bFOO\b"), "FOO", "Check Anchors")
+
+    def test_noRequiredLiteral(self):
+        self.assertIsNone(extractRequiredLiteral(r"TITLE|COMMENT"), "Check Alternation")
+        self.assertIsNone(extractRequiredLiteral(r"(?:TITLE)?\s"), "Check Optional")
+        self.assertIsNone(extractRequiredLiteral(r"(?i)TITLE"), "Check Case Insensitive")
+        self.assertIsNone(extractRequiredLiteral(r"\d+"), "Check No Literal")
+        self.assertIsNone(extractRequiredLiteral(r"(TITLE"), "Check Invalid Pattern")
+
+    def test_requiredLiteralsOfRules(self):
+        # Every required literal must be in every match of its pattern
+        ruleReader = RuleReader("resources/teradataQualityCheckRules.xml")
+        lines = ["CTL_ID INTEGER TITLE 'Control Id' COMPRESS 123,", "LOCKING ROW FOR ACCESS",
+                 "COMMENT ON TABLE P_D_BAL_001_STD_0.T IS 'A Comment';", " P_D_BAL_001_STD_0", " D_D01_V",
+                 "PROCESS_NAME VARCHAR(50) COMPRESS 'PROCESS',", "EXPY_D DATE COMPRESS (DATE '9999-12-31'),"]
+        for when in ruleReader.retrieveListOfWhenConditions().values():
+            if when.pattern is not None and when.literal is not None:
+                for line in lines:
+                    match = when.pattern.search(line.strip())
+                    if match is not None:
+                        self.assertIn(when.literal, line, "Check %s" % when.name)
+        for action in ruleReader.retrieveListOfActions().values():
+            if action.pattern is not None and action.literal is not None:
+                for line in lines:
+                    if action.pattern.search(line) is not None:
+                        self.assertIn(action.literal, line, "Check %s" % action.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from cba.teds.teradata.qa.rules.ResultCache import ResultCache
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testResultCache(unittest.TestCase):
+    """
+    Unit Tests for the ResultCache Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def setUp(self):
+        self._cacheDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._cacheDirectory, ignore_errors=True)
+
+    def test_buildKey(self):
+        key = ResultCache.buildKey("RULES", "TERADATA/A.tbl", b"CREATE TABLE A")
+        self.assertEqual(key, ResultCache.buildKey("RULES", "TERADATA/A.tbl", b"CREATE TABLE A"), "Check Same Key")
+        self.assertNotEqual(key, ResultCache.buildKey("OTHER", "TERADATA/A.tbl", b"CREATE TABLE A"), "Check Rules")
+        self.assertNotEqual(key, ResultCache.buildKey("RULES", "TERADATA/B.tbl", b"CREATE TABLE A"), "Check Name")
+        self.assertNotEqual(key, ResultCache.buildKey("RULES", "TERADATA/A.tbl", b"CREATE TABLE B"), "Check Content")
+
+    def test_storeAndRetrieveFindings(self):
+        resultCache = ResultCache(self._cacheDirectory)
+        key = ResultCache.buildKey("RULES", "TERADATA/A.tbl", b"CREATE TABLE A")
+
+        self.assertIsNone(resultCache.retrieveFindings(key), "Check Miss")
+
+        resultCache.storeFindings(key, [(0, 1), (3, 0)])
+        self.assertEqual(resultCache.retrieveFindings(key), [(0, 1), (3, 0)], "Check Hit")
+
+        resultCache.storeFindings(key, [])
+        self.assertEqual(resultCache.retrieveFindings(key), [], "Check Empty Findings")
+
+        self.assertEqual((resultCache.hits, resultCache.misses), (2, 1), "Check Counters")
+        self.assertAlmostEqual(resultCache.hitRate(), 200.0 / 3, 3, "Check Hit Rate")
+
+        # The entries persist for the next ResultCache object
+        self.assertEqual(ResultCache(self._cacheDirectory).retrieveFindings(key), [], "Check Persistent")
+
+    def test_evict(self):
+        keys = [ResultCache.buildKey("RULES", "TERADATA/%d.tbl" % index, b"") for index in range(4)]
+
+        resultCache = ResultCache(self._cacheDirectory, maxAge=60)
+        for index, key in enumerate(keys):
+            resultCache.storeFindings(key, [(index, 1)])
+
+        # Evict by Age
+        oldTime = time.time() - 120
+        os.utime(resultCache._entryPath(keys[0]), (oldTime, oldTime))
+        self.assertEqual(resultCache.evict(), 1, "Check Evicted By Age")
+        self.assertIsNone(resultCache.retrieveFindings(keys[0]), "Check Old Entry")
+
+        # Evict by Size (least recently used first)
+        entrySize = os.path.getsize(resultCache._entryPath(keys[1]))
+        for index, key in enumerate(keys[1:]):
+            entryTime = time.time() - 30 + index
+            os.utime(resultCache._entryPath(key), (entryTime, entryTime))
+        resultCache = ResultCache(self._cacheDirectory, maxSize=2 * entrySize, maxAge=60)
+        self.assertEqual(resultCache.evict(), 1, "Check Evicted By Size")
+        self.assertIsNone(resultCache.retrieveFindings(keys[1]), "Check Least Recently Used Entry")
+        self.assertEqual(resultCache.retrieveFindings(keys[3]), [(3, 1)], "Check Most Recently Used Entry")
+
+    def test_evictOnlyEntries(self):
+        key = ResultCache.buildKey("RULES", "TERADATA/A.tbl", b"")
+        resultCache = ResultCache(self._cacheDirectory, maxSize=0, maxAge=60)
+        resultCache.storeFindings(key, [(0, 1)])
+
+        # Other files in the cache directory (e.g. a compiled rule set of RuleSetCache kept there) are not entries
+        otherPaths = [os.path.join(self._cacheDirectory, "rulesets", "%s.json" % ("0" * 40)),
+                      os.path.join(self._cacheDirectory, "README")]
+        oldTime = time.time() - 120
+        for otherPath in otherPaths:
+            if not os.path.exists(os.path.dirname(otherPath)):
+                os.makedirs(os.path.dirname(otherPath))
+            with open(otherPath, "w") as otherFile:
+                otherFile.write("{}")
+            os.utime(otherPath, (oldTime, oldTime))
+
+        self.assertEqual(resultCache._listEntryPaths(), [resultCache._entryPath(key)], "Check Entries")
+        self.assertEqual(resultCache.evict(), 1, "Check Evicted")
+        for otherPath in otherPaths:
+            self.assertTrue(os.path.exists(otherPath), "Check Not Evicted (%s)" % otherPath)
+
+
+if __name__ == "__main__":
+    unittest.main()
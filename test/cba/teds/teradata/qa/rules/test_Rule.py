@@ -2,6 +2,7 @@
 import unittest
 
 from cba.teds.teradata.qa.rules.Rule import *
+from cba.teds.teradata.qa.rules.KeywordIndex import KeywordIndex
 from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
 from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
 
@@ -46,6 +47,21 @@ class testRule(unittest.TestCase):
 
         self.assertEqual(when.data[0].__str__(), "WhenData: {artifactName: (IMDB), data: (Adam and Barbara are a normal couple...who happen to be dead. They have given their precious time to decorate the house)}")
 
+    def test_whenDataSpan(self):
+        script = "REPLACE VIEW P_V_BAL_001_STD_0.FACT_ACCT_BALN_STG AS\nLOCKING ROW FOR ACCESS\n"
+
+        # A span that covers the entire source shares the source (no copy)
+        whenData = WhenData("Script", script)
+        self.assertIs(whenData.data, script, "Check Script")
+
+        # A span of a line is sliced out of the source
+        whenData = WhenData("Line", script, 53, 76)
+        self.assertEqual(whenData.data, "LOCKING ROW FOR ACCESS\n", "Check Line")
+        self.assertIs(whenData.data, whenData.data, "Check Sliced Once")
+        self.assertEqual(whenData.__str__(), "WhenData: {artifactName: (Line), data: (LOCKING ROW FOR ACCESS\n)}")
+
+        self.assertFalse(hasattr(whenData, "__dict__"), "Check Slots")
+
     def test_isConditionMatchedForWhen(self):
 
         # Test CONTAINS (WhenType)
@@ -181,7 +197,7 @@ class testRule(unittest.TestCase):
 
     def test_executeActionForTeradataKeywords(self):
         action = Action("Check for Teradata keywords", ActionType.ContainsTeradataKeywords.value, "")
-        self._assembledPackage._teradataKeywords = ['CREATE','AS']
+        self._assembledPackage._teradataKeywords = KeywordIndex(['CREATE','AS'])
         dbLine = 'CREATE MULTISET TABLE PDDBABKP.SB_92_1_1_F_LEND_B_1_C1112223 AS P_D_INP_001_STD_0.SB_92_1_1_F_LEND_BALN_MNLY WITH DATA AND STATS;'
         self.assertTrue(action.executeAction(dbLine, self._assembledPackage), 'Check for teradat keywords 1 (QA checks Fail Test)')
 
@@ -0,0 +1,58 @@
+import unittest
+
+from cba.teds.teradata.qa.rules.Rule import *
+from cba.teds.teradata.qa.rules.RulePlan import RulePlan
+from cba.teds.teradata.qa.rules.RuleReader import RuleReader
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testRulePlan(unittest.TestCase):
+    """
+    Unit Tests for RulePlan Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_rulePlan(self):
+        viewWhen = When("View", "REPLACE VIEW", WhenType.BeginsWith.value, WhenScope.Script.value,
+                        WhenFilter.CreateView.value)
+        tableWhen = When("Table", "TABLE P_D", WhenType.Contains.value, WhenScope.Line.value,
+                         WhenFilter.CreateTable.value)
+        allWhen = When("All", "_STG.", WhenType.Contains.value, WhenScope.FilePath.value, WhenFilter.All.value)
+        deadWhen = When("Dead", "SHOW VIEW ", WhenType.BeginsWith.value, WhenScope.Line.value,
+                        WhenFilter.CreateBackupView.value)
+        action = Action("Action", ActionType.TextMatch.value, "MULTISET")
+
+        whens = dict((when.name, when) for when in (viewWhen, tableWhen, allWhen, deadWhen))
+        rules = [Rule(viewWhen, action, RuleLevel.Error.value, "First"),
+                 Rule(tableWhen, action, RuleLevel.Error.value, "Second"),
+                 Rule(viewWhen, action, RuleLevel.Warning.value, "Third"),
+                 Rule(allWhen, action, RuleLevel.Error.value, "Fourth")]
+        rulePlan = RulePlan(whens, rules)
+
+        # The steps are sorted by filter (ALL first) and each When has all of its rules
+        self.assertEqual([(when.name, ruleIndexes) for when, ruleIndexes in rulePlan.retrieveSteps()],
+                         [("All", [3]), ("Table", [1]), ("View", [0, 2])], "Check Steps")
+        self.assertEqual(list(rulePlan.retrieveWhens().keys()), ["All", "Table", "View"], "Check Whens")
+        self.assertEqual(rulePlan.retrieveDroppedWhens(), ["Dead"], "Check Dropped Whens")
+
+        explanation = rulePlan.explain()
+        self.assertTrue(explanation.startswith("Rule Plan: 3 Whens, 4 Rules (1 Whens dropped)"), "Check Summary")
+        self.assertIn("  Filter CREATE_VIEW\n    When \"View\"", explanation, "Check Filter")
+        self.assertIn("      Rule 3: Action \"Action\" (warning) Third", explanation, "Check Rule")
+        self.assertIn("  Dropped Whens (not referenced by a Rule)\n    When \"Dead\"", explanation, "Check Dropped")
+
+    def test_rulePlanOfRules(self):
+        ruleReader = RuleReader("resources/teradataQualityCheckRules.xml")
+        rulePlan = RulePlan(ruleReader.retrieveListOfWhenConditions(), ruleReader.retrieveListOfRules())
+
+        # The rule for "Create Backup View Statement" is commented out
+        self.assertEqual(rulePlan.retrieveDroppedWhens(), ["Create Backup View Statement"], "Check Dropped Whens")
+        self.assertEqual(sorted(ruleIndex for when, ruleIndexes in rulePlan.retrieveSteps() for ruleIndex in ruleIndexes),
+                         list(range(len(ruleReader.retrieveListOfRules()))), "Check Every Rule Planned")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 
+import os
+import tempfile
 import unittest
 
 from cba.teds.teradata.qa.rules.RuleReader import RuleReader
@@ -38,6 +40,49 @@ class testRuleReader(unittest.TestCase):
         whens = ruleReader.retrieveListOfWhenConditions()
         self.assertEqual(len(whens), 0, "Check Empty")
 
+    def test_invalidRules(self):
+        rules = """<checks>
+    <assembledTeradataPackageChecks>
+        <whens>
+            <when name="Valid" value="BeetleJuice" type="CONTAINS" scope="SCRIPT" filter="ALL" />
+            <when name="Invalid Pattern" value="(BeetleJuice" type="MATCHES_PATTERN" scope="LINE" filter="ALL" />
+        </whens>
+        <actions>
+            <action name="Valid" textMatch="BeetleJuice BeetleJuice" />
+            <action name="Invalid Pattern" patternMatch="[BeetleJuice" />
+            <action name="Unknown Action Type" somethingElse="BeetleJuice" />
+        </actions>
+        <rules>
+            <rule when="Valid" action="Valid" level="error" message="Valid"/>
+            <rule when="Invalid Pattern" action="Valid" level="error" message="Invalid When"/>
+            <rule when="Valid" action="Invalid Pattern" level="error" message="Invalid Action"/>
+            <rule when="Unknown" action="Valid" level="error" message="Unknown When"/>
+        </rules>
+    </assembledTeradataPackageChecks>
+</checks>
+"""
+        fileDescriptor, fileLocation = tempfile.mkstemp(suffix=".xml")
+        try:
+            with os.fdopen(fileDescriptor, "w") as ruleFile:
+                ruleFile.write(rules)
+            ruleReader = RuleReader(fileLocation)
+        finally:
+            os.remove(fileLocation)
+
+        self.assertEqual(len(ruleReader.retrieveListOfWhenConditions()), 1, "Check Whens")
+        self.assertEqual(len(ruleReader.retrieveListOfActions()), 1, "Check Actions")
+        self.assertEqual([rule.message for rule in ruleReader.retrieveListOfRules()], ["Valid"], "Check Rules")
+        self.assertEqual(len(ruleReader.retrieveErrors()), 6, "Check Errors")
+
+    def test_compileRuleSet(self):
+        compiledRuleSet = self._ruleReader.compileRuleSet()
+        ruleReader = RuleReader(self._fileLocation, compiledRuleSet=compiledRuleSet)
+
+        self.assertEqual(ruleReader.compileRuleSet(), compiledRuleSet, "Check Compiled Rule Set")
+        rule = ruleReader.retrieveListOfRules()[0]
+        self.assertIs(rule.when, ruleReader.retrieveListOfWhenConditions()[rule.when.name], "Check Rule When")
+        self.assertEqual(rule.message, "Oops!", "Check Rule Message")
+
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
@@ -1,8 +1,14 @@
 
+import os
+import shutil
+import tempfile
 import unittest
 
+from unittest import mock
+
 from cba.teds.teradata.qa.rules.Rule import *
-from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner
+from cba.teds.teradata.qa.rules.RuleRunner import RuleRunner, shortenArtifactName
+from cba.teds.teradata.qa.artifacts.ArtifactIndex import ArtifactKind
 from cba.teds.teradata.qa.artifacts.AssembledPackage import AssembledPackage
 from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
 
@@ -62,6 +68,347 @@ class testRuleRunner(unittest.TestCase):
                     WhenFilter.All.value)
         ruleRunner._buildWhenData('imaginary_file_path.tbl', when)
 
+    def test_scanArtifact(self):
+
+        ruleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+
+        # The single pass scan must collect exactly what the When-by-When scan collects
+        for filePath in self._assembledPackage.retrieveAssembledPackageFilesList():
+            whens = ruleRunner._retrieveWhensForArtifact(filePath)
+            artifactWhenData = ruleRunner._scanArtifact(filePath, whens,
+                                                        ruleRunner._retrieveLiteralMatchersForFilterGroups(
+                                                            ruleRunner._retrieveFilterGroupsForArtifact(filePath)))
+            for when in whens:
+                whenByWhen = When(when.name, when.value, when.type, when.scope, when.filter)
+                ruleRunner._buildWhenData(filePath, whenByWhen)
+                self.assertEqual([(whenData.artifactName, whenData.data) for whenData in artifactWhenData.get(when, [])],
+                                 [(whenData.artifactName, whenData.data) for whenData in whenByWhen.data],
+                                 "Check When Data for %s (%s)" % (when.name, filePath))
+
+        # An imaginary file is logged (not raised) and collects nothing
+        when = When("Someone says BeetleJuice!", "BeetleJuice", WhenType.Contains.value, WhenScope.Script.value,
+                    WhenFilter.All.value)
+        self.assertEqual(ruleRunner._scanArtifact('imaginary_file_path.tbl', [when]), {}, "Check Imaginary File")
+
+    def test_retrieveFilterGroupsForArtifact(self):
+
+        ruleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        self.assertIn("Create Backup View Statement", ruleRunner._plan.retrieveDroppedWhens(), "Check Dropped When")
+
+        # The plan dropped every CREATE_BACKUP_VIEW When so the filter type is (silently) not a filter group
+        backupViewsFilePaths = self._assembledPackage.retrieveArtifactIndex().retrieveFilePaths(
+            ArtifactKind.AutoBackupViews)
+        self.assertGreater(len(backupViewsFilePaths), 0, "Check Auto Backup Views")
+        with self.assertNoLogs("cba", level="WARNING"):
+            for filePath in backupViewsFilePaths:
+                self.assertNotIn(WhenFilter.CreateBackupView.value,
+                                 ruleRunner._retrieveFilterGroupsForArtifact(filePath), "Check Filter Groups")
+
+        # A filter type without any When in the rules file is still an invalid filter type
+        ruleRunner = RuleRunner('resources/test/testRules.xml', self._assembledPackage)
+        with self.assertLogs("cba", level="WARNING") as logs:
+            ruleRunner._retrieveFilterGroupsForArtifact(backupViewsFilePaths[0])
+        self.assertIn("Invalid Filter Type : CREATE_BACKUP_VIEW", logs.output[0], "Check Warning")
+
+    def test_runRulesInParallel(self):
+
+        serialRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        serialRuleRunner.runRules()
+
+        parallelRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage, jobs=2)
+        parallelRuleRunner.runRules()
+
+        # The parallel run must produce the same test cases (in the same order) as the serial run
+        self.assertEqual(list(parallelRuleRunner._testCases.keys()), list(serialRuleRunner._testCases.keys()),
+                         "Check Test Case Order")
+        for testCaseName in serialRuleRunner._testCases:
+            serialTestCase = serialRuleRunner._testCases.get(testCaseName)
+            parallelTestCase = parallelRuleRunner._testCases.get(testCaseName)
+            self.assertEqual(parallelTestCase.failure_message, serialTestCase.failure_message, "Check Failures")
+            self.assertEqual(parallelTestCase.error_message, serialTestCase.error_message, "Check Warnings")
+            self.assertEqual(parallelTestCase.stdout, serialTestCase.stdout, "Check Information")
+
+    def test_runRulesWithCorpus(self):
+
+        serialRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        serialRuleRunner.runRules()
+
+        corpusRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage, corpus=True)
+        for whenKey in serialRuleRunner._whens:
+            serialData = [(data.artifactName, data.data) for data in serialRuleRunner._whens[whenKey].data]
+            corpusData = [(data.artifactName, data.data) for data in corpusRuleRunner._whens[whenKey].data]
+            self.assertEqual(corpusData, serialData, "Check When Data (%s)" % whenKey)
+
+        # The corpus run must produce the same test cases (in the same order) as the serial run
+        corpusRuleRunner.runRules()
+        self.assertEqual(list(corpusRuleRunner._testCases.keys()), list(serialRuleRunner._testCases.keys()),
+                         "Check Test Case Order")
+        for testCaseName in serialRuleRunner._testCases:
+            serialTestCase = serialRuleRunner._testCases.get(testCaseName)
+            corpusTestCase = corpusRuleRunner._testCases.get(testCaseName)
+            self.assertEqual(corpusTestCase.failure_message, serialTestCase.failure_message, "Check Failures")
+            self.assertEqual(corpusTestCase.error_message, serialTestCase.error_message, "Check Warnings")
+            self.assertEqual(corpusTestCase.stdout, serialTestCase.stdout, "Check Information")
+
+    def test_buildWhenDataWithPrefetch(self):
+
+        serialRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+
+        for corpus in (False, True):
+            prefetchRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                            corpus=corpus, prefetch=4, readers=2)
+            for whenKey in serialRuleRunner._whens:
+                serialData = [(data.artifactName, data.data) for data in serialRuleRunner._whens[whenKey].data]
+                prefetchData = [(data.artifactName, data.data) for data in prefetchRuleRunner._whens[whenKey].data]
+                self.assertEqual(prefetchData, serialData, "Check When Data (%s)" % whenKey)
+
+    def test_runRulesWithActionMatcher(self):
+
+        # Give the CREATE_TABLE TCF Whens every compression Action (so each When has an ActionMatcher)
+        with open('resources/teradataQualityCheckRules.xml') as rulesFile:
+            rules = rulesFile.read()
+        extraRules = []
+        for when in ("TCF Column (PROCESS_NAME)", "TCF Column (CTL_ID)", "TCF Column (EXPY_D)"):
+            for action in ("Check for ByteInt Compression", "Check for Number Compression",
+                           "Check for Date Compression", "Check for TimeStamp Compression"):
+                extraRules.append('<rule when="%s" action="%s" level="warning" message="%s %s"/>'
+                                  % (when, action, when, action))
+        rules = rules.replace("</rules>", "%s\n        </rules>" % "\n".join(extraRules))
+
+        rulesDirectory = tempfile.mkdtemp()
+        try:
+            rulesFileName = rulesDirectory + "/teradataQualityCheckRules.xml"
+            with open(rulesFileName, "w") as rulesFile:
+                rulesFile.write(rules)
+
+            matcherRuleRunner = RuleRunner(rulesFileName, self._assembledPackage)
+            self.assertEqual(len(matcherRuleRunner._actionMatchers), 3, "Check Action Matchers")
+            matcherRuleRunner.runRules()
+
+            actionRuleRunner = RuleRunner(rulesFileName, self._assembledPackage)
+            actionRuleRunner._actionMatchers = {}
+            actionRuleRunner.runRules()
+        finally:
+            shutil.rmtree(rulesDirectory)
+
+        # The ActionMatchers must produce the same test cases as the Actions on their own
+        self.assertEqual(list(matcherRuleRunner._testCases.keys()), list(actionRuleRunner._testCases.keys()),
+                         "Check Test Case Order")
+        for testCaseName in actionRuleRunner._testCases:
+            actionTestCase = actionRuleRunner._testCases.get(testCaseName)
+            matcherTestCase = matcherRuleRunner._testCases.get(testCaseName)
+            self.assertEqual(matcherTestCase.failure_message, actionTestCase.failure_message, "Check Failures")
+            self.assertEqual(matcherTestCase.error_message, actionTestCase.error_message, "Check Warnings")
+            self.assertEqual(matcherTestCase.stdout, actionTestCase.stdout, "Check Information")
+
+    def test_runRulesWithActionMemo(self):
+
+        memoRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        memoRuleRunner.runRules()
+        self.assertGreater(memoRuleRunner._actionMemo.hits, 0, "Check Memo Hits")
+
+        noMemoRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                      actionMemoSize=0)
+        self.assertIsNone(noMemoRuleRunner._actionMemo, "Check No Memo")
+        noMemoRuleRunner.runRules()
+
+        # The memoized run must produce the same test cases as a run without the memo
+        self.assertEqual(list(memoRuleRunner._testCases.keys()), list(noMemoRuleRunner._testCases.keys()),
+                         "Check Test Case Order")
+        for testCaseName in noMemoRuleRunner._testCases:
+            noMemoTestCase = noMemoRuleRunner._testCases.get(testCaseName)
+            memoTestCase = memoRuleRunner._testCases.get(testCaseName)
+            self.assertEqual(memoTestCase.failure_message, noMemoTestCase.failure_message, "Check Failures")
+            self.assertEqual(memoTestCase.error_message, noMemoTestCase.error_message, "Check Warnings")
+            self.assertEqual(memoTestCase.stdout, noMemoTestCase.stdout, "Check Information")
+
+        # The hits of the workers are handed back to the parent process
+        parallelRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage, jobs=2)
+        parallelRuleRunner.runRules()
+        self.assertEqual(parallelRuleRunner._actionMemo.hits + parallelRuleRunner._actionMemo.misses,
+                         memoRuleRunner._actionMemo.hits + memoRuleRunner._actionMemo.misses, "Check Lookups")
+
+    def test_runRulesWithSkippedArtifacts(self):
+
+        # A copy of the good package with a binary (and an image) file in it
+        packageDirectory = tempfile.mkdtemp()
+        try:
+            shutil.copytree(self._testPackageLocation + "goodPackage", packageDirectory + "/package")
+            with open(packageDirectory + "/package/DBAI/extract.dat", "wb") as binaryFile:
+                binaryFile.write(b"CREATE TABLE\x00\x01\x02" * 64)
+            with open(packageDirectory + "/package/DBAI/logo.png", "wb") as imageFile:
+                imageFile.write(b"\x89PNG\r\n\x1a\n")
+            assembledPackage = AssembledPackage(packageDirectory, "package.tgz", "package")
+
+            artifactIndex = assembledPackage.retrieveArtifactIndex()
+            self.assertEqual(sorted(os.path.basename(filePath) for filePath in artifactIndex.retrieveSkippedFilePaths()),
+                             ["extract.dat", "logo.png"], "Check Skipped Artifacts")
+
+            ruleRunners = []
+            for options in ({}, {"streaming": True}, {"jobs": 2}, {"corpus": True, "prefetch": 2}):
+                ruleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', assembledPackage, **options)
+                ruleRunner.runRules()
+                ruleRunners.append(ruleRunner)
+        finally:
+            shutil.rmtree(packageDirectory)
+
+        serialRuleRunner = ruleRunners[0]
+        for filePath in artifactIndex.retrieveSkippedFilePaths():
+            testCase = serialRuleRunner._testCases.get(shortenArtifactName(filePath))
+            self.assertIn("The content of this artifact was not checked", testCase.stdout, "Check Information")
+            self.assertIsNone(testCase.failure_message, "Check No Failures")
+
+        # Every way of evaluating the rules must record the skipped artifacts in the same way
+        for ruleRunner in ruleRunners[1:]:
+            self.assertEqual(list(ruleRunner._testCases.keys()), list(serialRuleRunner._testCases.keys()),
+                             "Check Test Case Order")
+            for testCaseName in serialRuleRunner._testCases:
+                serialTestCase = serialRuleRunner._testCases.get(testCaseName)
+                testCase = ruleRunner._testCases.get(testCaseName)
+                self.assertEqual(testCase.failure_message, serialTestCase.failure_message, "Check Failures")
+                self.assertEqual(testCase.error_message, serialTestCase.error_message, "Check Warnings")
+                self.assertEqual(testCase.stdout, serialTestCase.stdout, "Check Information")
+
+    def test_runRulesStreaming(self):
+
+        serialRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        serialRuleRunner.runRules()
+
+        streamingRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                         streaming=True)
+        for when in streamingRuleRunner._whens.values():
+            self.assertEqual(len(when.data), 0, "Check No When Data Collected")
+
+        streamingRuleRunner.runRules()
+        for when in streamingRuleRunner._whens.values():
+            self.assertEqual(len(when.data), 0, "Check No When Data Retained")
+
+        # The streaming run must produce the same test cases (in the same order) as the serial run
+        self.assertEqual(list(streamingRuleRunner._testCases.keys()), list(serialRuleRunner._testCases.keys()),
+                         "Check Test Case Order")
+        for testCaseName in serialRuleRunner._testCases:
+            serialTestCase = serialRuleRunner._testCases.get(testCaseName)
+            streamingTestCase = streamingRuleRunner._testCases.get(testCaseName)
+            self.assertEqual(streamingTestCase.failure_message, serialTestCase.failure_message, "Check Failures")
+            self.assertEqual(streamingTestCase.error_message, serialTestCase.error_message, "Check Warnings")
+            self.assertEqual(streamingTestCase.stdout, serialTestCase.stdout, "Check Information")
+
+    def test_runRulesWithResultCache(self):
+
+        serialRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        serialRuleRunner.runRules()
+
+        cacheDirectory = tempfile.mkdtemp()
+        try:
+            for run in range(2):
+                cachedRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                              cacheDirectory=cacheDirectory)
+                cachedRuleRunner.runRules()
+
+                # The first run fills the cache, the second run finds everything in it
+                resultCache = cachedRuleRunner._resultCache
+                self.assertTrue(resultCache.hits + resultCache.misses > 0, "Check Cache Used")
+                if run == 0:
+                    self.assertEqual(resultCache.hits, 0, "Check No Hits")
+                else:
+                    self.assertEqual(resultCache.misses, 0, "Check No Misses")
+
+                # A cached run must produce the same test cases (in the same order) as the serial run
+                self.assertEqual(list(cachedRuleRunner._testCases.keys()), list(serialRuleRunner._testCases.keys()),
+                                 "Check Test Case Order")
+                for testCaseName in serialRuleRunner._testCases:
+                    serialTestCase = serialRuleRunner._testCases.get(testCaseName)
+                    cachedTestCase = cachedRuleRunner._testCases.get(testCaseName)
+                    self.assertEqual(cachedTestCase.failure_message, serialTestCase.failure_message, "Check Failures")
+                    self.assertEqual(cachedTestCase.error_message, serialTestCase.error_message, "Check Warnings")
+                    self.assertEqual(cachedTestCase.stdout, serialTestCase.stdout, "Check Information")
+        finally:
+            shutil.rmtree(cacheDirectory, ignore_errors=True)
+
+    def test_runRulesInParallelWithResultCache(self):
+
+        serialRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage)
+        serialRuleRunner.runRules()
+
+        cacheDirectory = tempfile.mkdtemp()
+        try:
+            for run in range(2):
+                cachedRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                              jobs=2, cacheDirectory=cacheDirectory)
+                cachedRuleRunner.runRules()
+
+                # The first (cold) run fills the cache, the second (warm) run finds everything in it
+                resultCache = cachedRuleRunner._resultCache
+                self.assertTrue(resultCache.hits + resultCache.misses > 0, "Check Cache Used")
+                if run == 0:
+                    self.assertEqual(resultCache.hits, 0, "Check No Hits")
+                else:
+                    self.assertEqual(resultCache.misses, 0, "Check No Misses")
+
+                self.assertEqual(list(cachedRuleRunner._testCases.keys()), list(serialRuleRunner._testCases.keys()),
+                                 "Check Test Case Order")
+                for testCaseName in serialRuleRunner._testCases:
+                    serialTestCase = serialRuleRunner._testCases.get(testCaseName)
+                    cachedTestCase = cachedRuleRunner._testCases.get(testCaseName)
+                    self.assertEqual(cachedTestCase.failure_message, serialTestCase.failure_message, "Check Failures")
+                    self.assertEqual(cachedTestCase.error_message, serialTestCase.error_message, "Check Warnings")
+                    self.assertEqual(cachedTestCase.stdout, serialTestCase.stdout, "Check Information")
+        finally:
+            shutil.rmtree(cacheDirectory, ignore_errors=True)
+
+    def test_runRulesWithResultCacheForNewChangeRequest(self):
+
+        cacheDirectory = tempfile.mkdtemp()
+        try:
+            cachedRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                          cacheDirectory=cacheDirectory)
+            cachedRuleRunner.runRules()
+
+            # Only the artifacts that a containsCrNumber rule applies to are evaluated again for a new CR Number
+            changeRequestFilePaths = [filePath for filePath in self._assembledPackage.retrieveAssembledPackageFilesList()
+                                      if cachedRuleRunner._retrieveArtifactRuleSetHash(filePath) !=
+                                      cachedRuleRunner._retrieveRuleSetHash()]
+            self.assertGreater(len(changeRequestFilePaths), 0, "Check Change Request Artifacts")
+
+            with mock.patch.object(self._assembledPackage, "retrieveChangeRequestNumber", return_value="C7654321"):
+                newRuleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                           cacheDirectory=cacheDirectory)
+                newRuleRunner.runRules()
+
+            self.assertEqual(newRuleRunner._resultCache.misses, len(changeRequestFilePaths), "Check Misses")
+            self.assertGreater(newRuleRunner._resultCache.hits, 0, "Check Hits")
+        finally:
+            shutil.rmtree(cacheDirectory, ignore_errors=True)
+
+    def test_runRulesWithStatistics(self):
+
+        counts = []
+        for options in ({}, {"streaming": True}, {"jobs": 2}):
+            ruleRunner = RuleRunner('resources/teradataQualityCheckRules.xml', self._assembledPackage,
+                                    collectStatistics=True, **options)
+            ruleRunner.runRules()
+
+            # Every finding recorded in the test cases is counted against its Action
+            findings = 0
+            for testCaseName in ruleRunner._testCases:
+                if testCaseName.startswith("."):
+                    continue
+                testCase = ruleRunner._testCases.get(testCaseName)
+                for message in (testCase.failure_message, testCase.error_message, testCase.stdout):
+                    if message is not None:
+                        findings += len(message.split(" _BR_ "))
+            self.assertEqual(sum(ruleRunner._statistics.retrieveActionStatistics(action.name)["findings"]
+                                 for action in ruleRunner._actions.values()), findings, "Check Findings")
+
+            whenCounts = dict((whenName, (whenStatistics["files"], whenStatistics["lines"], whenStatistics["matches"]))
+                              for whenName, whenStatistics in ruleRunner._statistics.drain()[0].items())
+            self.assertTrue(whenCounts["Create Table Statement"][0] > 0, "Check Files Inspected")
+            counts.append(whenCounts)
+
+        # The counts (but not the times) are the same in every mode
+        self.assertEqual(counts[1], counts[0], "Check Streaming Counts")
+        self.assertEqual(counts[2], counts[0], "Check Parallel Counts")
+
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
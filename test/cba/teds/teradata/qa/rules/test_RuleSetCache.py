@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest import mock
+
+import cba.teds.teradata.qa.rules.RuleSetCache
+
+from cba.teds.teradata.qa.rules.RuleSetCache import buildRuleSetHash, loadRuleSet, retrieveDefaultRuleSetDirectory, \
+    retrieveRuleSetPath
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testRuleSetCache(unittest.TestCase):
+    """
+    Unit Tests for RuleSetCache.
+    """
+
+    def setUp(self):
+        forceWorkingDirectory()
+
+        self._fileLocation = "resources/test/testRules.xml"
+        self._cacheDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._cacheDirectory, ignore_errors=True)
+
+    def test_loadRuleSet(self):
+        ruleReader = loadRuleSet(self._fileLocation, self._cacheDirectory)
+        self.assertEqual(len(ruleReader.retrieveListOfRules()), 1, "Check Rules")
+
+        ruleSetPath = retrieveRuleSetPath(self._cacheDirectory, buildRuleSetHash(self._fileLocation))
+        self.assertTrue(os.path.exists(ruleSetPath), "Check Compiled Rule Set File")
+        with open(ruleSetPath) as ruleSetFile:
+            self.assertEqual(json.load(ruleSetFile), ruleReader.compileRuleSet(), "Check Compiled Rule Set")
+
+    def test_loadRuleSetTwice(self):
+        ruleReader = loadRuleSet(self._fileLocation)
+        secondRuleReader = loadRuleSet(self._fileLocation)
+
+        self.assertEqual(secondRuleReader.compileRuleSet(), ruleReader.compileRuleSet(), "Check Compiled Rule Set")
+        self.assertIsNot(secondRuleReader.retrieveListOfWhenConditions()["Someone Says BeetleJuice"],
+                         ruleReader.retrieveListOfWhenConditions()["Someone Says BeetleJuice"], "Check New Whens")
+
+    def test_loadRuleSetLiterals(self):
+        rulesFile = "resources/teradataQualityCheckRules.xml"
+        ruleReader = loadRuleSet(rulesFile, self._cacheDirectory)
+
+        # A rule set compiled by this process is stored in a (new) ruleSetDirectory as well
+        otherRuleSetDirectory = os.path.join(self._cacheDirectory, "other")
+        loadRuleSet(rulesFile, otherRuleSetDirectory)
+        self.assertTrue(os.path.exists(retrieveRuleSetPath(otherRuleSetDirectory, buildRuleSetHash(rulesFile))),
+                        "Check Compiled Rule Set File")
+
+        # The required literals are loaded from the compiled rule set (not extracted again)
+        with mock.patch.dict(cba.teds.teradata.qa.rules.RuleSetCache._compiledRuleSets, clear=True):
+            with mock.patch("cba.teds.teradata.qa.rules.Rule.extractRequiredLiteral") as extractRequiredLiteral:
+                loadedRuleReader = loadRuleSet(rulesFile, self._cacheDirectory)
+            self.assertFalse(extractRequiredLiteral.called, "Check Literals Not Extracted")
+
+        literals = [(action.name, action.literal) for action in ruleReader.retrieveListOfActions().values()]
+        self.assertIn(True, [literal is not None for name, literal in literals], "Check Literals")
+        self.assertEqual([(action.name, action.literal) for action in loadedRuleReader.retrieveListOfActions().values()],
+                         literals, "Check Action Literals")
+        self.assertEqual([(when.name, when.literal) for when in loadedRuleReader.retrieveListOfWhenConditions().values()],
+                         [(when.name, when.literal) for when in ruleReader.retrieveListOfWhenConditions().values()],
+                         "Check When Literals")
+
+    def test_loadRuleSetNextToRulesFile(self):
+        rulesFile = os.path.join(self._cacheDirectory, "testRules.xml")
+        shutil.copy(self._fileLocation, rulesFile)
+        ruleSetPath = retrieveRuleSetPath(retrieveDefaultRuleSetDirectory(rulesFile), buildRuleSetHash(rulesFile))
+
+        # Without a ruleSetDirectory the directory of the rules file is left alone
+        with mock.patch.dict(cba.teds.teradata.qa.rules.RuleSetCache._compiledRuleSets, clear=True):
+            ruleReader = loadRuleSet(rulesFile)
+        self.assertFalse(os.path.exists(ruleSetPath), "Check Not Stored")
+
+        # A rule set compiled into the rulesets directory next to the rules file (see CompileTeradataRules) is loaded
+        loadRuleSet(rulesFile, retrieveDefaultRuleSetDirectory(rulesFile))
+        self.assertTrue(os.path.exists(ruleSetPath), "Check Compiled Rule Set File")
+        with mock.patch.dict(cba.teds.teradata.qa.rules.RuleSetCache._compiledRuleSets, clear=True):
+            with mock.patch("cba.teds.teradata.qa.rules.RuleSetCache.RuleReader.compileRuleSet") as compileRuleSet:
+                loadedRuleReader = loadRuleSet(rulesFile)
+            self.assertFalse(compileRuleSet.called, "Check Not Compiled")
+        self.assertEqual(loadedRuleReader.compileRuleSet(), ruleReader.compileRuleSet(), "Check Compiled Rule Set")
+
+    def test_buildRuleSetHash(self):
+        self.assertEqual(buildRuleSetHash(self._fileLocation), buildRuleSetHash(self._fileLocation), "Check Same Hash")
+        self.assertNotEqual(buildRuleSetHash(self._fileLocation), buildRuleSetHash(self._fileLocation, "other"),
+                            "Check Parent Node")
+
+        copiedFileLocation = os.path.join(self._cacheDirectory, "testRules.xml")
+        with open(self._fileLocation) as ruleFile:
+            rules = ruleFile.read()
+        with open(copiedFileLocation, "w") as ruleFile:
+            ruleFile.write(rules.replace("Oops!", "Oops Again!"))
+
+        self.assertNotEqual(buildRuleSetHash(copiedFileLocation), buildRuleSetHash(self._fileLocation),
+                            "Check Modified Rules")
+        ruleReader = loadRuleSet(copiedFileLocation, self._cacheDirectory)
+        self.assertEqual(ruleReader.retrieveListOfRules()[0].message, "Oops Again!", "Check Modified Rule")
+
+
+if __name__ == "__main__":
+    unittest.main()
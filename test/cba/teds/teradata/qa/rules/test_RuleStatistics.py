@@ -0,0 +1,72 @@
+
+import json
+import os
+import tempfile
+import unittest
+
+from cba.teds.teradata.qa.rules.RuleStatistics import RuleStatistics
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+
+
+class testRuleStatistics(unittest.TestCase):
+    """
+    Unit Tests for the RuleStatistics Class.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+
+    def test_record(self):
+        ruleStatistics = RuleStatistics(["Create Table Statement"], ["Check for Multiset Statement"])
+        self.assertEqual(ruleStatistics.retrieveWhenStatistics("Create Table Statement")["files"], 0, "Check Zero")
+
+        ruleStatistics.recordWhen("Create Table Statement", 0.5, 1, 10, 1)
+        ruleStatistics.recordWhen("Create Table Statement", 0.25, 1, 20, 0)
+        ruleStatistics.recordAction("Check for Multiset Statement", 0.125, 1, 1)
+
+        self.assertEqual(dict(ruleStatistics.retrieveWhenStatistics("Create Table Statement")),
+                         {"time": 0.75, "files": 2, "lines": 30, "matches": 1}, "Check When")
+        self.assertEqual(dict(ruleStatistics.retrieveActionStatistics("Check for Multiset Statement")),
+                         {"time": 0.125, "evaluations": 1, "findings": 1}, "Check Action")
+
+        self.assertEqual(ruleStatistics.buildProperties(),
+                         {"When: Create Table Statement": "time=0.750000 files=2 lines=30 matches=1",
+                          "Action: Check for Multiset Statement": "time=0.125000 evaluations=1 findings=1"},
+                         "Check Properties")
+
+    def test_drainAndMerge(self):
+        workerStatistics = RuleStatistics()
+        workerStatistics.recordWhen("Create View Statement", 0.5, 1, 10, 1)
+        workerStatistics.recordAction("Check for Locking Rows", 0.25, 1, 0)
+
+        ruleStatistics = RuleStatistics()
+        ruleStatistics.merge(workerStatistics.drain())
+        ruleStatistics.merge(workerStatistics.drain())
+
+        self.assertEqual(workerStatistics.retrieveWhenStatistics("Create View Statement")["files"], 0, "Check Drained")
+        self.assertEqual(dict(ruleStatistics.retrieveWhenStatistics("Create View Statement")),
+                         {"time": 0.5, "files": 1, "lines": 10, "matches": 1}, "Check Merged When")
+        self.assertEqual(dict(ruleStatistics.retrieveActionStatistics("Check for Locking Rows")),
+                         {"time": 0.25, "evaluations": 1, "findings": 0}, "Check Merged Action")
+
+    def test_writeStatistics(self):
+        ruleStatistics = RuleStatistics()
+        ruleStatistics.recordWhen("Create View Statement", 0.5, 1, 10, 1)
+
+        fileDescriptor, statsFileName = tempfile.mkstemp(suffix=".json")
+        os.close(fileDescriptor)
+        try:
+            ruleStatistics.writeStatistics(statsFileName)
+            with open(statsFileName) as statsFile:
+                statistics = json.load(statsFile)
+        finally:
+            os.remove(statsFileName)
+
+        self.assertEqual(statistics, {"whens": {"Create View Statement": {"time": 0.5, "files": 1, "lines": 10,
+                                                                          "matches": 1}},
+                                      "actions": {}}, "Check Stats File")
+
+
+if __name__ == "__main__":
+    unittest.main()
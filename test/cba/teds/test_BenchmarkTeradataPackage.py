@@ -0,0 +1,37 @@
+import json
+import os
+import unittest
+
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+from cba.teds.BenchmarkTeradataPackage import *
+
+
+class testBenchmarkTeradataPackage(unittest.TestCase):
+    """
+    Unit Tests for BenchmarkTeradataPackage (run at a tiny scale).
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+        if os.path.isdir("output") == False:
+            os.makedirs("output")
+
+    def test_benchmarkTeradataPackage(self):
+        resultsFile = "output/benchmark-testBenchmarkTeradataPackage.json"
+
+        results = benchmarkTeradataPackage(["-s", "2x3,3x2", "-n", "2", "-f", "0.5", "-o", resultsFile])
+        self.assertEqual(list(results.keys()), ["2x3", "3x2"], "Check Scales")
+        for scale in results:
+            self.assertEqual(list(results[scale].keys()), PHASES, "Check Phases for %s" % scale)
+
+        # The saved results can be used as a baseline
+        with open(resultsFile) as file:
+            self.assertEqual(json.load(file), results, "Check Saved Results")
+        benchmarkTeradataPackage(["-s", "2x3", "-n", "1", "-b", resultsFile])
+
+    def test_benchmarkTeradataPackageArguments(self):
+        with self.assertRaises(SystemExit):
+            benchmarkTeradataPackage(["-h"])
+        with self.assertRaises(SystemExit):
+            benchmarkTeradataPackage(["-x"])
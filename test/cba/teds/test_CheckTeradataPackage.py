@@ -1,4 +1,8 @@
 
+import contextlib
+import io
+import shutil
+import tempfile
 import unittest
 import os
 
@@ -48,6 +52,57 @@ class Test(unittest.TestCase):
         except Exception as e:
             self.fail("CheckTeradataPackage.py threw an exception (%s)." % (e))
 
+    def test_CheckTeradataPackageAssembledPackageWithJobs(self):
+        tarName = "test_assembled_package.tgz"
+        teradataQualityCheckRuleFile = 'resources/teradataQualityCheckRules.xml'
+
+        serialJunitReport = 'output/junit-testCheckTeradataPackageSerial.xml'
+        parallelJunitReport = 'output/junit-testCheckTeradataPackageParallel.xml'
+
+        checkTeradataPackage(['-q', teradataQualityCheckRuleFile, '-r', self._rootDirectoryPath, '-t', tarName,
+                              '-p', serialJunitReport])
+        checkTeradataPackage(['-q', teradataQualityCheckRuleFile, '-r', self._rootDirectoryPath, '-t', tarName,
+                              '-p', parallelJunitReport, '-j', '2'])
+
+        # The report from a parallel run must be identical to the report from a serial run
+        with open(serialJunitReport) as serialFile, open(parallelJunitReport) as parallelFile:
+            self.assertEqual(parallelFile.read(), serialFile.read(), 'parallel and serial reports should be identical')
+
+    def test_CheckTeradataPackageAssembledPackageWithJobsAndCache(self):
+        tarName = "test_assembled_package.tgz"
+        teradataQualityCheckRuleFile = 'resources/teradataQualityCheckRules.xml'
+
+        serialJunitReport = 'output/junit-testCheckTeradataPackageSerial.xml'
+        cachedJunitReport = 'output/junit-testCheckTeradataPackageParallelCached.xml'
+
+        checkTeradataPackage(['-q', teradataQualityCheckRuleFile, '-r', self._rootDirectoryPath, '-t', tarName,
+                              '-p', serialJunitReport])
+
+        # The workers of a parallel run must be able to use the result cache
+        cacheDirectory = tempfile.mkdtemp()
+        try:
+            checkTeradataPackage(['-q', teradataQualityCheckRuleFile, '-r', self._rootDirectoryPath, '-t', tarName,
+                                  '-p', cachedJunitReport, '-j', '2', '-c', cacheDirectory])
+        finally:
+            shutil.rmtree(cacheDirectory, ignore_errors=True)
+
+        with open(serialJunitReport) as serialFile, open(cachedJunitReport) as cachedFile:
+            self.assertEqual(cachedFile.read(), serialFile.read(), 'cached parallel and serial reports should be identical')
+
+    def test_CheckTeradataPackageExplain(self):
+        explainJunitReport = 'output/junit-testCheckTeradataPackageExplain.xml'
+        if os.path.isfile(explainJunitReport):
+            os.remove(explainJunitReport)
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            checkTeradataPackage(['-q', 'resources/teradataQualityCheckRules.xml', '-r', self._rootDirectoryPath,
+                                  '-t', 'test_assembled_package.tgz', '-p', explainJunitReport, '--explain'])
+
+        # The plan is printed and nothing is checked
+        self.assertIn('When "Create Backup View Statement"', stdout.getvalue(), 'the dropped When should be explained')
+        self.assertFalse(os.path.isfile(explainJunitReport), 'nothing should be checked')
+
     def test_CheckTeradataPackageArguments(self):
         # Test -h or help argument
         try:
@@ -0,0 +1,61 @@
+import json
+import os
+import threading
+import unittest
+
+from cba.teds.utils.WorkingDirectory import forceWorkingDirectory
+from cba.teds.CheckTeradataPackageClient import checkTeradataPackageClient
+from cba.teds.CheckTeradataPackageDaemon import *
+from cba.teds.teradata.qa.artifacts.PackageChecker import PackageChecker
+
+
+class testCheckTeradataPackageDaemon(unittest.TestCase):
+    """
+    Unit Tests for CheckTeradataPackageDaemon (and CheckTeradataPackageClient).
+
+    A daemon is started (on any free port) for the tests and the client checks "test_assembled_package.tgz" in
+    "resources/test/".
+    """
+
+    @classmethod
+    def setUpClass(self):
+        forceWorkingDirectory()
+        if os.path.isdir("output") == False:
+            os.makedirs("output")
+
+        self._server = createServer(PackageChecker('resources/teradataQualityCheckRules.xml'), 0)
+        self._port = str(self._server.server_address[1])
+        self._serverThread = threading.Thread(target=self._server.serve_forever)
+        self._serverThread.start()
+
+    @classmethod
+    def tearDownClass(self):
+        checkTeradataPackageClient(['-P', self._port, '--shutdown'])
+        self._serverThread.join()
+        self._server.server_close()
+
+    def test_checkPackage(self):
+        junitReport = 'output/junit-testCheckTeradataPackageDaemon.xml'
+        response = checkTeradataPackageClient(['-P', self._port, '-t', 'resources/test/test_assembled_package.tgz',
+                                               '-p', junitReport])
+        self.assertTrue(response.startswith('<?xml'), 'Check JUnit Report')
+        with open(junitReport) as reportFile:
+            self.assertEqual(reportFile.read(), response, 'Check JUnit Report File')
+
+        findings = json.loads(checkTeradataPackageClient(['-P', self._port, '-t',
+                                                          'resources/test/test_assembled_package.tgz', '-f']))
+        self.assertIn('.Change Record Number', [finding['artifact'] for finding in findings], 'Check Findings')
+
+        status = json.loads(checkTeradataPackageClient(['-P', self._port, '--status']))
+        self.assertEqual(status['rulesReads'], 1, 'Check Rules Read Once')
+        self.assertGreaterEqual(status['checks'], 2, 'Check Number of Checks')
+
+    def test_checkMissingPackage(self):
+        with self.assertRaises(SystemExit):
+            checkTeradataPackageClient(['-P', self._port, '-t', 'resources/test/missing_assembled_package.tgz'])
+
+    def test_checkTeradataPackageClientArguments(self):
+        with self.assertRaises(SystemExit):
+            checkTeradataPackageClient(['-h'])
+        with self.assertRaises(SystemExit):
+            checkTeradataPackageClient(['-P', self._port])